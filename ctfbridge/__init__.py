@@ -1,3 +1,15 @@
-from ctfbridge.factory import create_client
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ctfbridge.factory import create_client
 
 __all__ = ["create_client"]
+
+
+def __getattr__(name: str):
+    # Imported on first use so that importing ctfbridge (or any of its submodules) stays cheap
+    if name == "create_client":
+        from ctfbridge.factory import create_client
+
+        return create_client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -63,3 +63,12 @@ class CTFClient(ABC):
     def session(self) -> SessionHelper | None:
         """Session helper for managing cookies, headers, etc."""
         pass
+
+    async def aclose(self) -> None:
+        """Close the client's connections. Clients that hold resources override this."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
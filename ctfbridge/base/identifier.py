@@ -1,16 +1,43 @@
 from abc import ABC, abstractmethod
-from urllib.parse import ParseResult
+from dataclasses import dataclass
+from typing import ClassVar, Literal
 
 import httpx
 
 
+@dataclass(frozen=True)
+class Signature:
+    """
+    A marker that identifies a platform in the response to a page request.
+
+    Attributes:
+        pattern: Text to look for. For ``body`` and ``header`` signatures, a case-sensitive
+            substring of the page or header value; for ``cookie`` signatures, a cookie name.
+        where: Which part of the response to search.
+        header: Header name, for ``header`` signatures.
+        weight: How strongly a match points to the platform.
+    """
+
+    pattern: str
+    where: Literal["body", "header", "cookie"] = "body"
+    header: str | None = None
+    weight: float = 1.0
+
+
 class PlatformIdentifier(ABC):
     """
     Abstract base class for CTF platform detection logic.
     Subclasses must implement platform-specific logic for detecting
     whether a given URL belongs to this platform.
+
+    Static detection is declared as data through `signatures`, which are evaluated for
+    all platforms in a single pass over the response. Host patterns that identify a
+    platform from the URL alone are declared in the platform registry's
+    ``PLATFORM_URL_PATTERNS``, so URLs can be matched without importing any identifier.
     """
 
+    signatures: ClassVar[tuple[Signature, ...]] = ()
+
     def __init__(self, http: httpx.AsyncClient):
         self.http = http
 
@@ -36,25 +63,14 @@ class PlatformIdentifier(ABC):
         """
         return None
 
-    @abstractmethod
-    def match_url_pattern(self, url: ParseResult) -> bool:
-        """
-        Fast string-based check to determine if this platform should be considered.
-        Should not make network calls.
-
-        Arguments:
-            url: The URL to check.
-
-        Return:
-            True if this identifier might match the URL, else False.
-        """
-        pass
-
-    @abstractmethod
     async def static_detect(self, response: httpx.Response) -> bool | None:
         """
         Inspect the HTTP response (HTML, headers, etc.) to quickly confirm or rule out the platform.
 
+        The default implementation checks `signatures`. Detection evaluates signatures
+        for all platforms at once and only calls this method on identifiers that
+        override it.
+
         Arguments:
             response: The HTTP response from the candidate.
 
@@ -63,7 +79,9 @@ class PlatformIdentifier(ABC):
             - False: Definitely not this platform
             - None: Inconclusive
         """
-        pass
+        from ctfbridge.platforms.signatures import SignatureMatcher
+
+        return True if SignatureMatcher([("", self.signatures)]).match(response) else None
 
     @abstractmethod
     async def is_base_url(self, candidate: str) -> bool:
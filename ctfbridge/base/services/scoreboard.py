@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import List
+from typing import AsyncIterator, List
 
 from ctfbridge.models.scoreboard import ScoreboardEntry
 
@@ -25,3 +25,46 @@ class ScoreboardService(ABC):
             ServiceUnavailableError: If platform is down.
         """
         raise NotImplementedError
+
+    def iter_top(self, limit: int = 0) -> AsyncIterator[ScoreboardEntry]:
+        """
+        Iterate over the top scoreboard entries in rank order as they are fetched.
+
+        On platforms with a paginated scoreboard, entries are yielded page by page, and
+        no further pages are requested once iteration stops.
+
+        Example:
+            async for entry in client.scoreboard.iter_top():
+                if entry.name == "my-team":
+                    break
+
+        Args:
+            limit: Maximum number of entries to yield. If 0, yield all entries.
+
+        Yields:
+            ScoreboardEntry: Scoreboard entries sorted by rank or score.
+
+        Raises:
+            ScoreboardFetchError: If scoreboard cannot be retrieved.
+            CTFInactiveError: If scoreboard is locked.
+            ServiceUnavailableError: If platform is down.
+        """
+        raise NotImplementedError
+
+    async def get_own_standing(self) -> ScoreboardEntry | None:
+        """
+        Return the scoreboard standing of the authenticated user or team.
+
+        Uses the cheapest source the platform offers, such as the profile of the
+        logged-in account, and only scans the scoreboard when that has no rank.
+
+        Returns:
+            ScoreboardEntry | None: The own rank, score and, where available, number of
+                solves, or None if the account is not on the scoreboard.
+
+        Raises:
+            NotAuthenticatedError: If not logged in.
+            ScoreboardFetchError: If the standing cannot be retrieved, or the platform
+                cannot identify the logged-in account.
+        """
+        raise NotImplementedError
@@ -1,11 +1,11 @@
-import os
 from datetime import datetime, timezone
 
 import typer
 from rich.table import Table
 
 from ctfbridge.cli.ui import STYLES, console, display_error
-from ctfbridge.utils.platform_cache import CACHE_PATH, load_platform_cache
+from ctfbridge.utils import platform_cache
+from ctfbridge.utils.platform_cache import clear_platform_cache, load_platform_cache
 
 app = typer.Typer(name="cache", help="Manage the platform detection cache.", no_args_is_help=True)
 
@@ -35,8 +35,7 @@ def cache_view():
 def cache_clear():
     """Deletes the platform cache file."""
     try:
-        if CACHE_PATH.exists():
-            os.remove(CACHE_PATH)
+        if clear_platform_cache():
             console.print("✅ Platform cache cleared.", style=STYLES["success"])
         else:
             console.print(
@@ -50,4 +49,4 @@ def cache_clear():
 @app.command("path")
 def cache_path():
     """Prints the absolute file path of the cache file."""
-    console.print(str(CACHE_PATH.resolve()))
+    console.print(str(platform_cache.CACHE_PATH.resolve()))
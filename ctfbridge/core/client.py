@@ -41,6 +41,7 @@ class CoreCTFClient(CTFClient):
         self._scoreboard = scoreboard
         self._session = session
         self._http: httpx.AsyncClient
+        self._owns_http = True
 
     @property
     def auth(self) -> CoreAuthService | None:
@@ -67,6 +68,19 @@ class CoreCTFClient(CTFClient):
         """Get the session helper instance."""
         return self._session
 
+    async def aclose(self) -> None:
+        """
+        Close pooled attachment connections and the HTTP client, unless it was passed in.
+
+        Example:
+            async with await create_client("https://demo.ctfd.io") as client:
+                ...
+        """
+        if self._attachments:
+            await self._attachments.aclose()
+        if self._owns_http:
+            await self._http.aclose()
+
     def url(self, path: str) -> str:
         """
         Construct a full URL by combining the platform base URL with the given path.
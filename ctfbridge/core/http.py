@@ -1,7 +1,8 @@
 import asyncio
 import logging
+from contextlib import contextmanager
 from importlib.metadata import version
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
 import httpx
 
@@ -79,6 +80,45 @@ def handle_response(resp: httpx.Response) -> httpx.Response:
         return resp
 
 
+class RetryTransport(httpx.AsyncBaseTransport):
+    """
+    Retries requests that fail to connect, with a policy that can change at any time.
+
+    Equivalent to the ``retries`` option of `httpx.AsyncHTTPTransport`, except that the
+    number of retries is a plain attribute and can be overridden per request with the
+    ``retries`` request extension, so one connection pool can serve requests with
+    different retry policies.
+
+    Example:
+        await client.get(url, extensions={"retries": 0})
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, retries: int = 0, backoff_factor: float = 0.5
+    ):
+        self.transport = transport
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        retries_left = request.extensions.get("retries", self.retries)
+        # Same schedule as httpcore: retry at once, then back off exponentially
+        delay = 0.0
+        while True:
+            try:
+                return await self.transport.handle_async_request(request)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if retries_left <= 0:
+                    raise
+                retries_left -= 1
+                logger.debug("Connection to %s failed, retrying in %ss", request.url, delay)
+                await asyncio.sleep(delay)
+                delay = delay * 2 if delay else self.backoff_factor
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
 class CTFBridgeClient(httpx.AsyncClient):
     """
     Custom HTTP client for CTFBridge:
@@ -118,6 +158,28 @@ class CTFBridgeClient(httpx.AsyncClient):
     def set_postprocess_hook(self, hook: Callable[[httpx.Response], None]):
         self._postprocess_response = hook
 
+    @property
+    def retries(self) -> int | None:
+        """Default number of connection retries, or None if the transport does not retry."""
+        transport = self._transport
+        return transport.retries if isinstance(transport, RetryTransport) else None
+
+    @retries.setter
+    def retries(self, value: int) -> None:
+        if isinstance(self._transport, RetryTransport):
+            self._transport.retries = value
+
+    @contextmanager
+    def retry_policy(self, retries: int) -> Iterator[None]:
+        """Use a different default number of connection retries within the block."""
+        previous = self.retries
+        self.retries = retries
+        try:
+            yield
+        finally:
+            if previous is not None:
+                self.retries = previous
+
 
 def make_http_client(
     *,
@@ -158,7 +220,7 @@ def make_http_client(
         "verify": verify_setting,
         "headers": {"User-Agent": user_agent, **custom_headers},
         "follow_redirects": follow_redirects,
-        "transport": httpx.AsyncHTTPTransport(retries=retries, verify=verify_setting),
+        "transport": RetryTransport(httpx.AsyncHTTPTransport(verify=verify_setting), retries),
         **config,  # Include any remaining config options
     }
 
@@ -1,188 +1,814 @@
 import asyncio
 import logging
+import re
+from contextlib import asynccontextmanager
 from pathlib import Path
-from stat import S_ISDIR
-from typing import Callable
+from stat import S_ISDIR, S_ISLNK
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
 from urllib.parse import urljoin, urlparse
 
-import time
 import httpx
 
 from ctfbridge.models.challenge import (
     Attachment,
     AttachmentCollection,
     Challenge,
+    DownloadEvent,
+    DownloadInfo,
     DownloadType,
-    ProgressData,
 )
-from ctfbridge.exceptions import AttachmentDownloadError
+from ctfbridge.core.ssh import SSHConnectionPool
+from ctfbridge.exceptions import AttachmentDownloadError, AttachmentExtractionError
+from ctfbridge.utils.archive import ArchiveExtractor, is_archive
+from ctfbridge.utils.attachment_manifest import AttachmentManifest, ManifestEntry
+from ctfbridge.utils.attachment_store import AttachmentStore, content_key
+from ctfbridge.utils.digest import FileDigest, StreamDigest, describe_file, digest_file
+from ctfbridge.utils.file_writer import AsyncFileWriter, preallocate
+from ctfbridge.utils.progress import ProgressCallback, ProgressReporter
+from ctfbridge.utils.rate_limit import BandwidthLimiter
+from ctfbridge.utils.url import is_same_origin
 
 logger = logging.getLogger(__name__)
 
 
+_CHUNK_SIZE = 1048576
+
+
+def _replace_file(temp_path: Path, final_path: Path) -> None:
+    if final_path.exists():
+        logger.warning("File already exists and will be overwritten: %s", final_path)
+    temp_path.replace(final_path)
+
+
+def _safe_dirname(name: str, fallback: str) -> str:
+    """Turn a challenge name into a single, safe path component."""
+    cleaned = re.sub(r"[^\w.\- ]+", "_", name).strip(" .")
+    return cleaned or fallback
+
+
 class CoreAttachmentService:
     """Handles downloading attachments, returning updated Challenge objects."""
 
-    def __init__(self, client):
+    def __init__(
+        self,
+        client,
+        store: AttachmentStore | None = None,
+        per_host_concurrency: int = 4,
+        segments: int = 4,
+        segment_threshold: int = 64 * 1048576,
+        compute_md5: bool = False,
+        offload_io: bool = True,
+        fsync: bool = False,
+        ssh_concurrency: int = 8,
+    ):
+        """
+        Initialize the attachment service.
+
+        Downloads share the client's HTTP connection pool. Requests to the platform itself
+        carry the session's cookies and tokens; requests to other hosts reuse the same
+        transport without them.
+
+        Args:
+            client: The CTF client instance
+            store: Optional content-addressed store used to deduplicate downloaded files
+            per_host_concurrency: Maximum concurrent downloads per host, kept below the
+                pool's connection limit so large files cannot starve API calls
+            segments: Number of parallel range requests used for large files
+            segment_threshold: Minimum size in bytes for a file to be downloaded in segments,
+                if the server supports range requests
+            compute_md5: Also compute MD5 checksums of downloaded files
+            offload_io: Perform file writes and filesystem operations in worker threads
+                instead of on the event loop
+            fsync: Flush each downloaded file to stable storage before it is renamed
+            ssh_concurrency: Maximum concurrent file transfers per SSH directory download
+        """
         self._client = client
-        self._http = httpx.AsyncClient(follow_redirects=True)
+        self._external_http: httpx.AsyncClient | None = None
+        self.store = store
+        self.per_host_concurrency = per_host_concurrency
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self.segments = segments
+        self.segment_threshold = segment_threshold
+        self.compute_md5 = compute_md5
+        self.offload_io = offload_io
+        self.fsync = fsync
+        self.ssh_concurrency = ssh_concurrency
+        self._ssh_pool = SSHConnectionPool()
+        self._manifests: dict[Path, AttachmentManifest] = {}
+        self._active_calls = 0
 
     async def download(
         self,
         attachment: Attachment,
         save_dir: str | Path,
-        progress: Callable[[ProgressData], None] | None = None,
+        progress: ProgressCallback | ProgressReporter | None = None,
+        sync: bool = False,
     ) -> list[Attachment]:
         """
         Download a single attachment (HTTP or SSH).
         Returns one or more Attachment objects.
-        """
-        save_dir = Path(save_dir)
-        save_dir.mkdir(parents=True, exist_ok=True)
 
+        With ``sync=True``, HTTP files recorded in the save directory's manifest are
+        revalidated with a conditional request and only transferred if they changed.
+        """
         try:
-            if attachment.download_info.type == DownloadType.HTTP:
-                path = await self._download_http(attachment, save_dir, progress)
-                enriched = await self._enrich_metadata(attachment, path)
-                return [enriched]
-
-            elif attachment.download_info.type == DownloadType.SSH:
-                return await self._download_ssh(attachment, save_dir)
-
-            else:
-                raise AttachmentDownloadError(
-                    None, f"Unsupported download type: {attachment.download_info.type}"
-                )
-
+            async with self._call_scope(), self._progress_reporter(progress) as reporter:
+                return await self._download(attachment, save_dir, progress=reporter, sync=sync)
         except Exception as e:
             logger.warning("Failed to download %s: %s", attachment.name or "<unknown>", e)
             return [attachment]
 
+    async def _download(
+        self,
+        attachment: Attachment,
+        save_dir: str | Path,
+        progress: ProgressReporter | None = None,
+        sync: bool = False,
+        limiter: BandwidthLimiter | None = None,
+    ) -> list[Attachment]:
+        """Download a single attachment, raising on failure."""
+        save_dir = Path(save_dir)
+        await self._io(save_dir.mkdir, parents=True, exist_ok=True)
+
+        if attachment.download_info.type == DownloadType.HTTP:
+            path, digest = await self._download_http(attachment, save_dir, progress, sync, limiter)
+            enriched = await self._enrich_metadata(attachment, path, digest)
+            return [enriched]
+
+        elif attachment.download_info.type == DownloadType.SSH:
+            return await self._download_ssh(attachment, save_dir)
+
+        else:
+            raise AttachmentDownloadError(
+                None, f"Unsupported download type: {attachment.download_info.type}"
+            )
+
     async def download_all(
         self,
         challenge: Challenge,
         save_dir: str | Path,
         concurrency: int = 5,
-        progress: Callable[[ProgressData], None] | None = None,
+        progress: ProgressCallback | ProgressReporter | None = None,
+        sync: bool = False,
+        extract: bool | ArchiveExtractor = False,
     ) -> Challenge:
-        """Download all attachments for a given challenge, merging multiple results."""
+        """
+        Download all attachments for a given challenge, merging multiple results.
+
+        With ``sync=True``, only attachments that changed since the last sync are transferred.
+
+        With ``extract``, archives are extracted next to themselves as soon as they finish
+        downloading, while the other attachments are still being transferred, and their
+        files are listed in ``children``. Pass an `ArchiveExtractor` to configure limits
+        and the worker pool.
+        """
         attachments = list(challenge.attachments)
         if not attachments:
             logger.debug("Challenge '%s' has no attachments.", challenge.name)
             return challenge
 
         save_dir = Path(save_dir)
-        save_dir.mkdir(parents=True, exist_ok=True)
+        await self._io(save_dir.mkdir, parents=True, exist_ok=True)
 
         semaphore = asyncio.Semaphore(concurrency)
 
-        async def task(att: Attachment):
+        async def task(att: Attachment, reporter: ProgressReporter | None):
             async with semaphore:
-                return await self.download(att, save_dir, progress)
-
-        results_nested = await asyncio.gather(*(task(a) for a in attachments))
+                results = await self.download(att, save_dir, reporter, sync)
+            if extractor:
+                results = await self._extract_archives(results, extractor)
+            return results
+
+        async with (
+            self._call_scope(),
+            self._extractor_for(extract) as extractor,
+            self._progress_reporter(progress) as reporter,
+        ):
+            results_nested = await asyncio.gather(*(task(a, reporter) for a in attachments))
         results = [att for sublist in results_nested for att in sublist]
 
         return challenge.model_copy(
             update={"attachments": AttachmentCollection(attachments=results)}
         )
 
+    async def download_many(
+        self,
+        challenges: Iterable[Challenge],
+        save_dir: str | Path | Callable[[Challenge], str | Path],
+        concurrency: int = 10,
+        per_host: int | None = None,
+        max_bytes_per_second: float | None = None,
+        smallest_first: bool = True,
+        priority: Callable[[Challenge, Attachment], Any] | None = None,
+        progress: ProgressCallback | ProgressReporter | None = None,
+        sync: bool = False,
+        extract: bool | ArchiveExtractor = False,
+    ) -> AsyncIterator[DownloadEvent]:
+        """
+        Download the attachments of many challenges through one scheduler.
+
+        Every attachment is queued up front and downloaded under a single global
+        concurrency limit, so mirroring a whole event keeps a bounded number of transfers
+        in flight. Results are yielded as they complete, not in submission order.
+
+        Args:
+            challenges: Challenges whose attachments to download.
+            save_dir: Base directory, in which each challenge gets a subdirectory named after
+                it, or a callable returning the directory for a challenge.
+            concurrency: Maximum number of concurrent downloads overall.
+            per_host: Maximum number of concurrent downloads per host. HTTP downloads are
+                always bounded by the service's ``per_host_concurrency``, so this may only
+                tighten that limit. Defaults to no further limit.
+            max_bytes_per_second: Combined bandwidth cap for all HTTP downloads.
+            smallest_first: Start attachments with a known small size first, so many small
+                files are not stuck behind a few large ones.
+            priority: Sort key taking ``(challenge, attachment)``; lower values start
+                first. Overrides ``smallest_first``.
+            progress: Optional progress callback or `ProgressReporter`.
+            sync: Only transfer attachments that changed since the last sync.
+            extract: Extract downloaded archives, as in `download_all`. Extraction does not
+                hold a download slot, so it overlaps with the remaining transfers.
+
+        Yields:
+            A `DownloadEvent` for each attachment as it finishes.
+
+        Raises:
+            ValueError: If ``per_host`` exceeds the service's ``per_host_concurrency``.
+        """
+        if per_host and per_host > self.per_host_concurrency:
+            raise ValueError(
+                f"per_host ({per_host}) exceeds the service's per_host_concurrency "
+                f"({self.per_host_concurrency})"
+            )
+
+        jobs = [(challenge, att) for challenge in challenges for att in challenge.attachments]
+        if priority:
+            jobs.sort(key=lambda job: priority(*job))
+        elif smallest_first:
+            jobs.sort(key=lambda job: (job[1].size_bytes is None, job[1].size_bytes or 0))
+
+        global_slots = asyncio.Semaphore(concurrency)
+        host_slots: dict[str, asyncio.Semaphore] = {}
+        limiter = BandwidthLimiter(max_bytes_per_second) if max_bytes_per_second else None
+
+        def directory_for(challenge: Challenge) -> Path:
+            if callable(save_dir):
+                return Path(save_dir(challenge))
+            return Path(save_dir) / _safe_dirname(challenge.name, challenge.id)
+
+        async def run(challenge: Challenge, attachment: Attachment) -> DownloadEvent:
+            host = self._attachment_host(attachment)
+            if per_host and host not in host_slots:
+                host_slots[host] = asyncio.Semaphore(per_host)
+            host_slot = host_slots.get(host) if per_host else None
+
+            # Wait for the host first so a busy host does not hold global slots idle
+            if host_slot:
+                await host_slot.acquire()
+            try:
+                async with global_slots:
+                    results = await self._download(
+                        attachment,
+                        directory_for(challenge),
+                        progress=reporter,
+                        sync=sync,
+                        limiter=limiter,
+                    )
+            except Exception as e:
+                logger.warning("Failed to download %s: %s", attachment.name or "<unknown>", e)
+                return DownloadEvent(
+                    challenge=challenge, attachment=attachment, results=[attachment], error=str(e)
+                )
+            finally:
+                if host_slot:
+                    host_slot.release()
+
+            if extractor:
+                results = await self._extract_archives(results, extractor)
+            return DownloadEvent(challenge=challenge, attachment=attachment, results=results)
+
+        async with (
+            self._call_scope(),
+            self._extractor_for(extract) as extractor,
+            self._progress_reporter(progress) as reporter,
+        ):
+            tasks = [asyncio.create_task(run(challenge, att)) for challenge, att in jobs]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    @asynccontextmanager
+    async def _call_scope(self) -> AsyncIterator[None]:
+        """
+        Track a public download call, releasing shared resources when the last one returns.
+
+        SSH connections are pooled across the attachments of one call and of calls running
+        at the same time, but not kept open between calls.
+        """
+        self._active_calls += 1
+        try:
+            yield
+        finally:
+            self._active_calls -= 1
+            if not self._active_calls:
+                await self._release()
+
+    async def _release(self) -> None:
+        """Write pending manifest updates and close idle SSH connections."""
+        manifests, self._manifests = list(self._manifests.values()), {}
+        for manifest in manifests:
+            if manifest.dirty:
+                await self._io(manifest.save)
+        try:
+            await self._ssh_pool.aclose()
+        except Exception as e:
+            logger.warning("Failed to close SSH connections: %s", e)
+
+    @asynccontextmanager
+    async def _extractor_for(
+        self, extract: bool | ArchiveExtractor
+    ) -> AsyncIterator[ArchiveExtractor | None]:
+        """Yield the extractor for a call, creating and closing a default one if needed."""
+        if isinstance(extract, ArchiveExtractor) or not extract:
+            yield extract or None
+            return
+        async with ArchiveExtractor() as extractor:
+            yield extractor
+
+    async def _extract_archives(
+        self, attachments: list[Attachment], extractor: ArchiveExtractor
+    ) -> list[Attachment]:
+        """Extract the downloaded archives among ``attachments``, listing their files as children."""
+
+        async def extract(attachment: Attachment) -> Attachment:
+            if not attachment.local_path or not is_archive(attachment.file_type):
+                return attachment
+            try:
+                files = await extractor.extract(
+                    Path(attachment.local_path), attachment.file_type, self.compute_md5
+                )
+            except Exception as e:
+                # Extraction is best effort; the downloaded archive is kept either way
+                logger.warning("Failed to extract %s: %s", attachment.local_path, e)
+                return attachment
+
+            logger.info("Extracted %d files from %s", len(files), attachment.local_path)
+            children = [
+                Attachment(
+                    name=file.name,
+                    local_path=str(file.path),
+                    size_bytes=file.digest.size_bytes,
+                    sha256=file.digest.sha256,
+                    md5=file.digest.md5,
+                    file_type=file.digest.file_type,
+                )
+                for file in files
+            ]
+            return attachment.model_copy(update={"children": children})
+
+        return list(await asyncio.gather(*(extract(att) for att in attachments)))
+
+    @asynccontextmanager
+    async def open(self, attachment: Attachment) -> AsyncIterator[AsyncIterator[bytes]]:
+        """
+        Open an attachment as a stream of bytes without saving it to disk.
+
+        HTTP attachments are streamed from the response and SSH files from a pooled SFTP
+        session. An expected SHA-256 is checked once the stream has been read to the end.
+
+        Example:
+            async with client.attachments.open(attachment) as stream:
+                async for chunk in stream:
+                    ...
+
+        Raises:
+            AttachmentDownloadError: If the attachment cannot be opened or read, or does
+                not match its expected checksum.
+        """
+        async with self._call_scope(), self._open(attachment) as chunks:
+            yield self._verified(attachment, chunks)
+
+    async def read(self, attachment: Attachment, max_bytes: int | None = None) -> bytes:
+        """
+        Read an attachment into memory without saving it to disk.
+
+        Args:
+            attachment: The attachment to read.
+            max_bytes: Refuse attachments larger than this many bytes. The transfer is
+                stopped as soon as the limit is exceeded.
+
+        Raises:
+            AttachmentDownloadError: If the attachment cannot be read or is too large.
+        """
+        if max_bytes is not None and (attachment.size_bytes or 0) > max_bytes:
+            raise AttachmentDownloadError(attachment.name, f"Larger than {max_bytes} bytes")
+
+        data = bytearray()
+        async with self.open(attachment) as stream:
+            async for chunk in stream:
+                data += chunk
+                if max_bytes is not None and len(data) > max_bytes:
+                    raise AttachmentDownloadError(attachment.name, f"Larger than {max_bytes} bytes")
+        return bytes(data)
+
+    @asynccontextmanager
+    async def _open(self, attachment: Attachment) -> AsyncIterator[AsyncIterator[bytes]]:
+        """Open an attachment as raw chunks, dispatching on its download type."""
+        info = attachment.download_info
+        if info.type == DownloadType.HTTP:
+            url = self._normalize_url(info.url)
+            try:
+                async with (
+                    self._host_slot(url),
+                    self._http_for(url).stream("GET", url) as response,
+                ):
+                    response.raise_for_status()
+                    yield response.aiter_bytes(_CHUNK_SIZE)
+            except httpx.HTTPError as e:
+                raise AttachmentDownloadError(url, str(e)) from e
+
+        elif info.type == DownloadType.SSH:
+            sftp, attrs = await self._ssh_stat(info)
+            if S_ISDIR(attrs.permissions):
+                raise AttachmentDownloadError(info.path, "Cannot stream a directory")
+
+            async with sftp.open(info.path, "rb") as src:
+
+                async def chunks() -> AsyncIterator[bytes]:
+                    while chunk := await src.read(_CHUNK_SIZE):
+                        yield chunk
+
+                yield chunks()
+
+        else:
+            raise AttachmentDownloadError(None, f"Unsupported download type: {info.type}")
+
+    async def _verified(
+        self, attachment: Attachment, chunks: AsyncIterator[bytes]
+    ) -> AsyncIterator[bytes]:
+        expected = attachment.download_info.expected_sha256
+        digest = StreamDigest() if expected else None
+        async for chunk in chunks:
+            if digest:
+                digest.update(chunk)
+            yield chunk
+
+        if digest:
+            actual = digest.finish().sha256
+            if actual != expected.lower():
+                raise AttachmentDownloadError(
+                    attachment.name,
+                    f"SHA-256 mismatch: expected {expected.lower()}, got {actual}",
+                )
+
+    @asynccontextmanager
+    async def _progress_reporter(
+        self, progress: ProgressCallback | ProgressReporter | None
+    ) -> AsyncIterator[ProgressReporter | None]:
+        """Wrap a plain progress callback in a reporter for the duration of a call."""
+        if progress is None or isinstance(progress, ProgressReporter):
+            yield progress
+            return
+
+        async with ProgressReporter(progress) as reporter:
+            yield reporter
+
+    def _attachment_host(self, attachment: Attachment) -> str:
+        info = attachment.download_info
+        if info.type == DownloadType.SSH:
+            return (info.host or "").lower()
+        return urlparse(self._normalize_url(info.url or "")).netloc.lower()
+
     async def _download_http(
         self,
         attachment: Attachment,
         save_dir: Path,
-        progress: Callable[[ProgressData], None] | None = None,
-    ) -> Path:
-        """Download a single HTTP/HTTPS attachment."""
+        progress: ProgressReporter | None = None,
+        sync: bool = False,
+        limiter: BandwidthLimiter | None = None,
+    ) -> tuple[Path, FileDigest]:
+        """
+        Download a single HTTP/HTTPS attachment.
+
+        Returns:
+            The local path and the digest computed while streaming the file.
+        """
         url = self._normalize_url(attachment.download_info.url)
         filename = attachment.name or Path(urlparse(url).path).name
         final_path = save_dir / filename
         temp_path = final_path.with_suffix(final_path.suffix + ".part")
 
-        async with self._http.stream("GET", url) as response:
+        manifest = await self._get_manifest(save_dir) if sync else None
+        headers = {}
+        entry = await self._io(manifest.fresh_entry, filename, url) if manifest else None
+        if entry:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        key = content_key(url) if self.store else None
+        if key:
+            digest = await self._io(self.store.lookup, key)
+            expected = attachment.download_info.expected_sha256
+            if digest and expected and expected.lower() != digest:
+                logger.warning(
+                    "Stored file for %s does not match the expected SHA-256, downloading it", url
+                )
+                digest = None
+            if digest:
+                await self._io(self.store.place, digest, final_path)
+                logger.info("Placed stored file without downloading: %s", final_path)
+                return final_path, await self._describe(final_path, digest)
+
+        http = self._http_for(url)
+
+        async with self._host_slot(url), http.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304:
+                if not entry:
+                    raise AttachmentDownloadError(url, "Got 304 Not Modified for a plain request")
+                logger.info("File unchanged, skipping download: %s", final_path)
+                return final_path, await self._describe(final_path, entry.sha256)
+
             response.raise_for_status()
             total_size = int(response.headers.get("Content-Length", 0))
-            downloaded = 0
-            start_time = time.monotonic()
-
-            with temp_path.open("wb") as f:
-                async for chunk in response.aiter_bytes(1048576):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-
-                    elapsed = time.monotonic() - start_time
-                    speed_bps = downloaded / elapsed if elapsed > 0 else 0.0
-                    eta_seconds = (total_size - downloaded) / speed_bps if speed_bps > 0 else None
-
-                    if progress and total_size > 0:
-                        await progress(
-                            ProgressData(
-                                attachment=attachment,
-                                downloaded_bytes=downloaded,
-                                total_bytes=total_size,
-                                percentage=(downloaded / total_size) * 100,
-                                speed_bps=speed_bps,
-                                eta_seconds=eta_seconds,
-                            )
-                        )
-
-        if final_path.exists():
-            logger.warning("File already exists and will be overwritten: %s", final_path)
-
-        temp_path.rename(final_path)
+            tracker = progress.track(attachment, total_size) if progress else None
+
+            async def advance(size: int) -> None:
+                if tracker:
+                    tracker.advance(size)
+                if limiter:
+                    await limiter.consume(size)
+
+            wanted = self.segments - 1 if self._can_segment(response, total_size) else 0
+            async with self._spare_host_slots(url, wanted) as spare:
+                if spare:
+                    await self._download_segmented(
+                        http, url, response, temp_path, total_size, spare + 1, advance
+                    )
+            if spare:
+                digest = await asyncio.to_thread(digest_file, temp_path, self.compute_md5)
+            else:
+                stream_digest = StreamDigest(md5=self.compute_md5)
+                async with self._writer(temp_path, size=total_size) as f:
+                    async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                        await f.write(chunk)
+                        stream_digest.update(chunk)
+                        await advance(len(chunk))
+                digest = stream_digest.finish()
+
+        await self._verify(attachment, temp_path, digest)
+
+        if manifest:
+            manifest.update(
+                filename,
+                ManifestEntry(
+                    url=url,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    size_bytes=digest.size_bytes,
+                    sha256=digest.sha256,
+                ),
+            )
+
+        if self.store:
+            await self._io(self.store.ingest, temp_path, digest.sha256, key)
+            await self._io(self.store.place, digest.sha256, final_path)
+            logger.info("Downloaded HTTP file: %s (sha256 %s)", final_path, digest.sha256)
+            return final_path, digest
+
+        await self._io(_replace_file, temp_path, final_path)
         logger.info("Downloaded HTTP file: %s", final_path)
-        return final_path
+        return final_path, digest
+
+    async def _io(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking filesystem operation, off the event loop if ``offload_io`` is set."""
+        if self.offload_io:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return func(*args, **kwargs)
+
+    def _writer(self, path: Path, **kwargs) -> AsyncFileWriter:
+        return AsyncFileWriter(path, fsync=self.fsync, threaded=self.offload_io, **kwargs)
+
+    async def _describe(self, path: Path, sha256: str | None) -> FileDigest:
+        """Digest a file that was not streamed, reusing a known SHA-256 where possible."""
+        if sha256 and not self.compute_md5:
+            return await asyncio.to_thread(describe_file, path, sha256)
+        return await asyncio.to_thread(digest_file, path, self.compute_md5)
+
+    async def _verify(self, attachment: Attachment, temp_path: Path, digest: FileDigest) -> None:
+        """Discard a transfer whose checksum does not match the expected one."""
+        expected = attachment.download_info.expected_sha256
+        if expected and expected.lower() != digest.sha256:
+            await self._io(temp_path.unlink, missing_ok=True)
+            raise AttachmentDownloadError(
+                attachment.name,
+                f"SHA-256 mismatch: expected {expected.lower()}, got {digest.sha256}",
+            )
+
+    def _can_segment(self, response: httpx.Response, total_size: int) -> bool:
+        """Check whether a response can be fetched as parallel byte ranges."""
+        return (
+            self.segments > 1
+            and total_size >= self.segment_threshold
+            and response.headers.get("Accept-Ranges", "").lower() == "bytes"
+            and response.headers.get("Content-Encoding", "identity").lower() == "identity"
+        )
+
+    async def _download_segmented(
+        self,
+        http: httpx.AsyncClient,
+        url: str,
+        response: httpx.Response,
+        temp_path: Path,
+        total_size: int,
+        segments: int,
+        advance: Callable[[int], Awaitable[None]],
+    ) -> None:
+        """
+        Download a file as concurrent byte ranges written in place into a preallocated file.
+
+        The first range is read from the already open response; the others are requested
+        with ``Range`` headers guarded by ``If-Range`` so a file changing mid-transfer fails
+        instead of mixing versions. The caller must hold a host slot for each segment.
+        """
+        segment_size = -(-total_size // segments)
+        ranges = [
+            (start, min(start + segment_size, total_size) - 1)
+            for start in range(0, total_size, segment_size)
+        ]
+        validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        if validator and validator.startswith("W/"):
+            validator = None
+
+        await self._io(temp_path.unlink, missing_ok=True)
+        await self._io(preallocate, temp_path, total_size)
+
+        async def write_range(chunks: AsyncIterator[bytes], start: int, end: int) -> None:
+            remaining = end - start + 1
+            async with self._writer(temp_path, offset=start) as f:
+                async for chunk in chunks:
+                    chunk = chunk[:remaining]
+                    await f.write(chunk)
+                    remaining -= len(chunk)
+                    await advance(len(chunk))
+                    if remaining == 0:
+                        break
+            if remaining:
+                raise AttachmentDownloadError(url, f"Range {start}-{end} ended early")
+
+        async def fetch_range(start: int, end: int) -> None:
+            headers = {"Range": f"bytes={start}-{end}"}
+            if validator:
+                headers["If-Range"] = validator
+            async with http.stream("GET", url, headers=headers) as part:
+                content_range = part.headers.get("Content-Range", "")
+                if part.status_code != 206 or not content_range.startswith(f"bytes {start}-{end}/"):
+                    raise AttachmentDownloadError(
+                        url, f"Server did not honour range {start}-{end} ({part.status_code})"
+                    )
+                await write_range(part.aiter_bytes(_CHUNK_SIZE), start, end)
+
+        logger.debug("Downloading %s in %d segments", url, len(ranges))
+        first_start, first_end = ranges[0]
+        tasks = [
+            asyncio.create_task(
+                write_range(response.aiter_bytes(_CHUNK_SIZE), first_start, first_end)
+            ),
+            *(asyncio.create_task(fetch_range(start, end)) for start, end in ranges[1:]),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._io(temp_path.unlink, missing_ok=True)
+            raise
+
+        actual_size = (await self._io(temp_path.stat)).st_size
+        if actual_size != total_size:
+            raise AttachmentDownloadError(
+                url, f"Expected {total_size} bytes, assembled {actual_size}"
+            )
+
+    def _http_for(self, url: str) -> httpx.AsyncClient:
+        """
+        Return the HTTP client to download a URL with.
+
+        Platform URLs use the authenticated platform client. Other hosts get a client that
+        shares its transport (pool, retries, HTTP/2, proxy) but not its credentials.
+        """
+        http = self._client._http
+        if is_same_origin(url, self._client.platform_url):
+            return http
+
+        if self._external_http is None:
+            mounts = getattr(http, "_mounts", {})
+            self._external_http = httpx.AsyncClient(
+                transport=getattr(http, "_transport", None),
+                mounts={pattern.pattern: transport for pattern, transport in mounts.items()},
+                headers={"User-Agent": http.headers.get("User-Agent", "")},
+                timeout=http.timeout,
+                follow_redirects=True,
+            )
+        return self._external_http
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent downloads from the URL's host."""
+        host = urlparse(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return slot
+
+    @asynccontextmanager
+    async def _spare_host_slots(self, url: str, wanted: int) -> AsyncIterator[int]:
+        """
+        Take up to ``wanted`` additional host slots without waiting for any.
+
+        Yields the number of slots taken, so segmented downloads stay within the per-host
+        limit and never wait on slots held by other downloads.
+        """
+        slot = self._host_slot(url)
+        taken = 0
+        try:
+            while taken < wanted and not slot.locked():
+                await slot.acquire()
+                taken += 1
+            yield taken
+        finally:
+            for _ in range(taken):
+                slot.release()
+
+    async def _get_manifest(self, save_dir: Path) -> AttachmentManifest:
+        """Return the cached manifest for a save directory, loading it on first use."""
+        key = await self._io(save_dir.resolve)
+        manifest = self._manifests.get(key)
+        if manifest is None:
+            loaded = await self._io(AttachmentManifest.load, save_dir)
+            # Another download into the same directory may have loaded it meanwhile
+            manifest = self._manifests.setdefault(key, loaded)
+        return manifest
 
     async def _download_ssh(self, attachment: Attachment, save_dir: Path) -> list[Attachment]:
         """Download a file or directory from an SSH server, returning one or more Attachment objects."""
+        info = attachment.download_info
+        await self._io(save_dir.mkdir, parents=True, exist_ok=True)
+
+        sftp, attrs = await self._ssh_stat(info)
+
+        if S_ISDIR(attrs.permissions):
+            logger.info("Remote path '%s' is a directory, downloading contents...", info.path)
+            return await self._download_ssh_dir(sftp, attachment, info.path, save_dir)
+
+        return [await self._download_ssh_file(sftp, attachment, info.path, save_dir)]
+
+    async def _ssh_stat(self, info: DownloadInfo):
+        """Return a pooled SFTP session for the download info and the attributes of its path."""
         import asyncssh
 
-        info = attachment.download_info
         if not info or not info.host or not info.path or not info.username:
             raise AttachmentDownloadError(None, "Incomplete SSH download info")
 
-        save_dir.mkdir(parents=True, exist_ok=True)
-        downloaded: list[Attachment] = []
-
-        async with asyncssh.connect(
-            info.host,
-            port=info.port or 22,
-            username=info.username,
-            password=info.password,
-            known_hosts=None,
-            client_keys=[info.key] if info.key else None,
-        ) as conn:
-            try:
-                sftp = await asyncio.wait_for(conn.start_sftp_client(), timeout=3)
-            except asyncio.TimeoutError:
-                raise AttachmentDownloadError(info.path or info.host, "SFTP unavailable.")
-
+        for attempt in range(2):
+            sftp = await self._ssh_pool.sftp(info)
             try:
-                attrs = await sftp.stat(info.path)
+                return sftp, await sftp.stat(info.path)
+            except (asyncssh.SFTPConnectionLost, asyncssh.ConnectionLost) as e:
+                # The pooled connection went away (e.g. the remote host restarted)
+                await self._ssh_pool.invalidate(info)
+                if attempt:
+                    raise AttachmentDownloadError(info.path, f"SSH connection lost: {e}")
             except (OSError, asyncssh.SFTPError) as e:
                 raise AttachmentDownloadError(info.path, f"Cannot stat remote path: {e}")
 
-            if S_ISDIR(attrs.permissions):
-                logger.info("Remote path '%s' is a directory, downloading contents...", info.path)
-                downloaded = await self._download_ssh_dir(sftp, attachment, info.path, save_dir)
-            else:
-                att = await self._download_ssh_file(sftp, attachment, info.path, save_dir)
-                downloaded.append(att)
-
-        return downloaded
-
     async def _download_ssh_file(
         self, sftp, attachment: Attachment, remote_path: str, local_dir: Path
     ) -> Attachment:
         """Download a single SSH file and return an Attachment with metadata."""
         filename = Path(remote_path).name
         local_path = local_dir / filename
-        local_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if local_path.exists():
-            logger.warning("File already exists and will be overwritten: %s", local_path)
-
-        await sftp.get(remote_path, str(local_path))
+        await self._io(local_path.parent.mkdir, parents=True, exist_ok=True)
+
+        temp_path = local_path.with_suffix(local_path.suffix + ".part")
+
+        stream_digest = StreamDigest(md5=self.compute_md5)
+        async with sftp.open(remote_path, "rb") as src:
+            async with self._writer(temp_path) as f:
+                while chunk := await src.read(_CHUNK_SIZE):
+                    await f.write(chunk)
+                    stream_digest.update(chunk)
+        digest = stream_digest.finish()
+        if remote_path == attachment.download_info.path:
+            # An expected checksum describes the attachment itself, not files inside a directory
+            await self._verify(attachment, temp_path, digest)
+
+        await self._io(_replace_file, temp_path, local_path)
         logger.debug("Downloaded SSH file: %s", local_path)
 
         updated_attachment = attachment.model_copy(
@@ -194,7 +820,7 @@ class CoreAttachmentService:
             }
         )
 
-        updated_attachment = await self._enrich_metadata(updated_attachment, local_path)
+        updated_attachment = await self._enrich_metadata(updated_attachment, local_path, digest)
 
         return updated_attachment
 
@@ -206,62 +832,92 @@ class CoreAttachmentService:
         local_dir: Path,
         include_hidden: bool = False,
         seen: set[str] | None = None,
+        slots: asyncio.Semaphore | None = None,
     ) -> list[Attachment]:
-        """Recursively download a directory and return a list of Attachment objects."""
-        seen = seen or set()
+        """
+        Recursively download a directory and return a list of Attachment objects.
+
+        Entries are listed with their attributes in one request per directory, and
+        subdirectories and files are processed concurrently, with at most
+        ``ssh_concurrency`` file transfers in flight.
+        """
+        seen = seen if seen is not None else set()
         if remote_dir in seen:
             return []
         seen.add(remote_dir)
+        slots = slots or asyncio.Semaphore(self.ssh_concurrency)
 
-        attachments: list[Attachment] = []
-        local_dir.mkdir(parents=True, exist_ok=True)
+        await self._io(local_dir.mkdir, parents=True, exist_ok=True)
 
         try:
-            entries = await asyncio.wait_for(sftp.listdir(remote_dir), timeout=5)
+            entries = await asyncio.wait_for(sftp.readdir(remote_dir), timeout=5)
         except Exception as e:
             logger.warning("Failed to list directory %s: %s", remote_dir, e)
             return []
 
+        async def transfer(remote_path: str) -> list[Attachment]:
+            async with slots:
+                try:
+                    return [await self._download_ssh_file(sftp, attachment, remote_path, local_dir)]
+                except Exception as e:
+                    logger.warning("Failed to download %s: %s", remote_path, e)
+                    return []
+
+        tasks = []
         for entry in entries:
-            if not include_hidden and entry.startswith("."):
+            name = entry.filename
+            if isinstance(name, bytes):
+                name = name.decode(errors="replace")
+            if name in (".", "..") or (not include_hidden and name.startswith(".")):
                 continue
 
-            remote_path = f"{remote_dir.rstrip('/')}/{entry}"
-            local_path = local_dir / entry
+            remote_path = f"{remote_dir.rstrip('/')}/{name}"
+            attrs = entry.attrs
 
-            try:
-                attrs = await asyncio.wait_for(sftp.stat(remote_path), timeout=5)
-            except Exception as e:
-                logger.warning("Failed to stat %s: %s", remote_path, e)
-                continue
+            if attrs.permissions is None or S_ISLNK(attrs.permissions):
+                # readdir reports the link itself; follow it like the original stat-based walk
+                try:
+                    attrs = await asyncio.wait_for(sftp.stat(remote_path), timeout=5)
+                except Exception as e:
+                    logger.warning("Failed to stat %s: %s", remote_path, e)
+                    continue
 
             if S_ISDIR(attrs.permissions):
-                sub_attachments = await self._download_ssh_dir(
-                    sftp, attachment, remote_path, local_path, include_hidden, seen
+                tasks.append(
+                    self._download_ssh_dir(
+                        sftp,
+                        attachment,
+                        remote_path,
+                        local_dir / name,
+                        include_hidden,
+                        seen,
+                        slots,
+                    )
                 )
-                attachments.extend(sub_attachments)
             else:
-                try:
-                    att = await self._download_ssh_file(sftp, attachment, remote_path, local_dir)
-                    attachments.append(att)
-                except Exception as e:
-                    logger.warning("Failed to download %s: %s", remote_path, e)
+                tasks.append(transfer(remote_path))
 
-        return attachments
+        results = await asyncio.gather(*tasks)
+        return [att for sublist in results for att in sublist]
 
-    async def _enrich_metadata(self, attachment: Attachment, path: Path) -> Attachment:
-        """Fill in metadata (name, size) after download."""
+    async def _enrich_metadata(
+        self, attachment: Attachment, path: Path, digest: FileDigest | None = None
+    ) -> Attachment:
+        """Fill in metadata (name, size, checksums, type) after download."""
         try:
-            size_bytes = path.stat().st_size
             name = attachment.name or path.name
+            update = {"name": name, "local_path": str(path)}
+            if digest:
+                update.update(
+                    size_bytes=digest.size_bytes,
+                    sha256=digest.sha256,
+                    md5=digest.md5,
+                    file_type=digest.file_type,
+                )
+            else:
+                update["size_bytes"] = (await self._io(path.stat)).st_size
 
-            return attachment.model_copy(
-                update={
-                    "name": name,
-                    "local_path": str(path),
-                    "size_bytes": size_bytes,
-                }
-            )
+            return attachment.model_copy(update=update)
         except Exception as e:
             logger.warning("Failed to enrich metadata for %s: %s", path, e)
             return attachment
@@ -275,5 +931,11 @@ class CoreAttachmentService:
     async def __aenter__(self):
         return self
 
+    async def aclose(self) -> None:
+        """Release pooled SSH connections."""
+        # The HTTP connection pool belongs to the platform client, which closes it.
+        self._external_http = None
+        await self._release()
+
     async def __aexit__(self, *args):
-        await self._http.aclose()
+        await self.aclose()
@@ -1,7 +1,7 @@
-from abc import abstractmethod
-from typing import List
+from typing import AsyncIterator, List
 
 from ctfbridge.base.services.scoreboard import ScoreboardService
+from ctfbridge.exceptions import ScoreboardFetchError
 from ctfbridge.models.scoreboard import ScoreboardEntry
 
 
@@ -9,6 +9,9 @@ class CoreScoreboardService(ScoreboardService):
     """
     Core implementation of the scoreboard service.
     Provides common scoreboard fetching and filtering functionality.
+
+    Platform services implement either `_fetch_scoreboard`, returning the scoreboard at
+    once, or `_iter_scoreboard`, streaming it page by page.
     """
 
     def __init__(self, client):
@@ -21,15 +24,79 @@ class CoreScoreboardService(ScoreboardService):
         self._client = client
 
     async def get_top(self, limit: int = 0) -> List[ScoreboardEntry]:
-        scoreboard = await self._fetch_scoreboard(limit)
+        return [entry async for entry in self.iter_top(limit)]
+
+    async def iter_top(self, limit: int = 0) -> AsyncIterator[ScoreboardEntry]:
+        entries = self._iter_scoreboard(limit)
+        try:
+            count = 0
+            async for entry in entries:
+                yield entry
+                count += 1
+                if count == limit:
+                    break
+        finally:
+            # Stop fetching pages as soon as the caller stops iterating
+            await entries.aclose()
+
+    async def get_own_standing(self) -> ScoreboardEntry | None:
+        return await self._fetch_own_standing()
+
+    async def _fetch_own_standing(self) -> ScoreboardEntry | None:
+        """
+        Fetch the standing of the authenticated account from the platform.
+
+        Defaults to looking up the name from `_own_name` on the scoreboard. Platforms
+        that report the standing in the account's profile override this.
 
-        return scoreboard if limit == 0 else scoreboard[:limit]
+        Raises:
+            ScoreboardFetchError: If the platform cannot identify the logged-in account.
+        """
+        name = await self._own_name()
+        if name is None:
+            raise ScoreboardFetchError("Own standing is not supported on this platform")
+        return await self._find_on_scoreboard(name)
+
+    async def _own_name(self) -> str | None:
+        """
+        Return the scoreboard name of the authenticated user or team.
+        Platform services that can resolve it override this (e.g. GZCTF).
+
+        Returns:
+            The name, or None if the platform offers no way to look it up.
+        """
+        return None
+
+    async def _find_on_scoreboard(self, name: str) -> ScoreboardEntry | None:
+        """
+        Scan the scoreboard in rank order for an account, stopping once it is found.
+
+        Args:
+            name: The user or team name as shown on the scoreboard.
+        """
+        async for entry in self.iter_top():
+            if entry.name == name:
+                return entry
+        return None
+
+    async def _iter_scoreboard(self, limit: int) -> AsyncIterator[ScoreboardEntry]:
+        """
+        Stream the scoreboard from the platform in rank order.
+
+        Defaults to yielding the result of `_fetch_scoreboard`. Platforms that paginate
+        override this to yield each page as it arrives.
+
+        Args:
+            limit: Maximum number of entries needed (0 for all). More may be yielded.
+        """
+        for entry in await self._fetch_scoreboard(limit):
+            yield entry
 
-    @abstractmethod
-    async def _fetch_scoreboard(self, limit) -> List[ScoreboardEntry]:
+    async def _fetch_scoreboard(self, limit: int) -> List[ScoreboardEntry]:
         """
         Fetch the scoreboard from the platform.
-        Must be implemented by platform-specific services.
+        Must be implemented by platform-specific services that do not implement
+        `_iter_scoreboard`.
 
         Args:
             limit: Maximum number of entries to fetch (0 for all)
@@ -37,4 +104,4 @@ class CoreScoreboardService(ScoreboardService):
         Returns:
             List of scoreboard entries
         """
-        pass
+        raise NotImplementedError
@@ -0,0 +1,96 @@
+import asyncio
+import hashlib
+import logging
+
+from ctfbridge.exceptions import AttachmentDownloadError
+from ctfbridge.models.challenge import DownloadInfo
+
+logger = logging.getLogger("ctfbridge.ssh")
+
+PoolKey = tuple[str, int, str, str]
+
+
+def _pool_key(info: DownloadInfo) -> PoolKey:
+    secret = info.key or info.password or ""
+    if isinstance(secret, str):
+        secret = secret.encode()
+    return (
+        (info.host or "").lower(),
+        info.port or 22,
+        info.username or "",
+        hashlib.sha256(secret).hexdigest(),
+    )
+
+
+class SSHConnectionPool:
+    """
+    Reuses SSH connections and their SFTP sessions across attachment downloads.
+
+    Connections are keyed by host, port, user and credentials, so attachments of many
+    challenges served from the same host share one connection and one SFTP session.
+    """
+
+    def __init__(self, sftp_timeout: float = 3):
+        """
+        Args:
+            sftp_timeout: Seconds to wait for the SFTP subsystem to start.
+        """
+        self.sftp_timeout = sftp_timeout
+        self._sessions: dict[PoolKey, tuple] = {}
+        self._locks: dict[PoolKey, asyncio.Lock] = {}
+
+    async def sftp(self, info: DownloadInfo):
+        """
+        Return an SFTP client for the given download info, connecting if needed.
+
+        Raises:
+            AttachmentDownloadError: If the SFTP subsystem is unavailable.
+        """
+        import asyncssh
+
+        key = _pool_key(info)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            session = self._sessions.get(key)
+            if session:
+                conn, sftp = session
+                if not conn.is_closed():
+                    return sftp
+                logger.debug("Pooled SSH connection to %s was closed, reconnecting", info.host)
+                self._sessions.pop(key, None)
+
+            logger.debug("Opening SSH connection to %s@%s", info.username, info.host)
+            conn = await asyncssh.connect(
+                info.host,
+                port=info.port or 22,
+                username=info.username,
+                password=info.password,
+                known_hosts=None,
+                client_keys=[info.key] if info.key else None,
+            )
+            try:
+                sftp = await asyncio.wait_for(conn.start_sftp_client(), timeout=self.sftp_timeout)
+            except asyncio.TimeoutError:
+                conn.close()
+                raise AttachmentDownloadError(info.path or info.host, "SFTP unavailable.")
+
+            self._sessions[key] = (conn, sftp)
+            return sftp
+
+    async def invalidate(self, info: DownloadInfo) -> None:
+        """Close the pooled connection for the given download info, if any."""
+        session = self._sessions.pop(_pool_key(info), None)
+        if session:
+            await self._close(*session)
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        sessions, self._sessions = list(self._sessions.values()), {}
+        await asyncio.gather(*(self._close(*session) for session in sessions))
+
+    @staticmethod
+    async def _close(conn, sftp) -> None:
+        sftp.exit()
+        conn.close()
+        await conn.wait_closed()
@@ -1,4 +1,4 @@
-from .attachment import AttachmentDownloadError
+from .attachment import AttachmentDownloadError, AttachmentExtractionError
 from .auth import (
     InvalidAuthMethodError,
     LoginError,
@@ -27,7 +27,12 @@ from .http import (
     UnauthorizedError,
     ValidationError,
 )
-from .platform import PlatformMismatchError, UnknownBaseURLError, UnknownPlatformError
+from .platform import (
+    DetectionTimeoutError,
+    PlatformMismatchError,
+    UnknownBaseURLError,
+    UnknownPlatformError,
+)
 from .scoreboard import ScoreboardFetchError
 from .session import SessionError
 
@@ -63,8 +68,10 @@ __all__ = [
     "SessionError",
     # Attachments
     "AttachmentDownloadError",
+    "AttachmentExtractionError",
     # Platform
     "UnknownPlatformError",
     "UnknownBaseURLError",
     "PlatformMismatchError",
+    "DetectionTimeoutError",
 ]
@@ -6,3 +6,17 @@ class AttachmentDownloadError(CTFBridgeError):
         super().__init__(f"Failed to download attachment from {url}: {reason}")
         self.url = url
         self.reason = reason
+
+    def __reduce__(self):
+        # Rebuild from the constructor arguments, so the error survives a process boundary
+        return type(self), (self.url, self.reason)
+
+
+class AttachmentExtractionError(CTFBridgeError):
+    def __init__(self, path: str, reason: str):
+        super().__init__(f"Failed to extract attachment {path}: {reason}")
+        self.path = path
+        self.reason = reason
+
+    def __reduce__(self):
+        return type(self), (self.path, self.reason)
@@ -7,6 +7,19 @@ class UnknownPlatformError(CTFBridgeError):
         self.url = url
 
 
+class DetectionTimeoutError(UnknownPlatformError):
+    def __init__(self, url: str, timeout: float, timings: dict[str, float]):
+        breakdown = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items())
+        CTFBridgeError.__init__(
+            self,
+            f"Platform detection for {url} timed out after {timeout}s"
+            + (f" ({breakdown})" if breakdown else ""),
+        )
+        self.url = url
+        self.timeout = timeout
+        self.timings = timings
+
+
 class UnknownBaseURLError(CTFBridgeError):
     def __init__(self, url: str):
         super().__init__(f"Could not determine base URL from {url}")
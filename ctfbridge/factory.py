@@ -1,12 +1,16 @@
+import asyncio
 import logging
-from typing import Any
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
-from ctfbridge.base.client import CTFClient
 from ctfbridge.core.http import make_http_client
 from ctfbridge.exceptions import UnknownPlatformError
 
+if TYPE_CHECKING:
+    from ctfbridge.base.client import CTFClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,7 +21,8 @@ async def create_client(
     cache_platform: bool = True,
     http: httpx.AsyncClient | None = None,
     http_config: dict[str, Any] | None = None,
-) -> CTFClient:
+    detect_timeout: float | None = None,
+) -> "CTFClient":
     """
     Create and return a resolved CTF client.
 
@@ -26,6 +31,9 @@ async def create_client(
         platform: Platform name or 'auto'.
         cache_platform: Whether to cache platform detection.
         http: Optional preconfigured HTTP client.
+        detect_timeout: Deadline in seconds for platform auto-detection as a whole. When
+            it runs out, the most likely platform found so far is used (and not cached),
+            or DetectionTimeoutError is raised if there is none.
         http_config: Configuration dictionary for the HTTP client with options:
             - timeout: Request timeout in seconds (int/float)
             - retries: Number of retries for failed requests (int)
@@ -43,69 +51,58 @@ async def create_client(
         A resolved and ready-to-use CTFClient instance.
     """
     from ctfbridge.platforms import get_platform_client
-    from ctfbridge.platforms.detect import detect_platform
+    from ctfbridge.platforms.detect import DetectionReport, detect_platform
     from ctfbridge.utils.platform_cache import get_cached_platform, set_cached_platform
 
     logger.info(f"Initializing CTFBridge client for URL: {url} (Specified platform: {platform})")
 
-    base_http_config = dict(http_config or {})
-    detection_http = http
-    detection_http_owned = False
+    http_owned = http is None
+    if http is None:
+        http = make_http_client(config=http_config)
 
-    if platform == "auto":
-        detection_http_config = dict(base_http_config)
-        detection_http_config.setdefault("retries", 1)
-        if detection_http is None:
-            detection_http = make_http_client(config=detection_http_config)
-            detection_http_owned = True
-    else:
-        if detection_http is None:
-            detection_http = make_http_client(config=base_http_config)
-            detection_http_owned = True
+    # Detection fails fast on unreachable candidates; the platform client then keeps the
+    # same connection pool, with the configured retry policy
+    detection_retries = (
+        nullcontext()
+        if not http_owned or "retries" in (http_config or {})
+        else http.retry_policy(1)
+    )
 
     try:
         if platform == "auto":
             logger.debug(f"Attempting to auto-detect platform for {url}.")
-            if cache_platform:
-                cached = get_cached_platform(url)
-                if cached:
-                    platform, base_url = cached
-                    logger.debug(
-                        f"Platform cache hit for {url}: Platform={platform}, Base URL={base_url}"
-                    )
-                else:
-                    logger.debug(f"Platform cache miss for {url}. Detecting platform...")
-                    platform, base_url = await detect_platform(url, detection_http)
-                    logger.debug(f"Platform detected: Name={platform}, Base URL={base_url}")
-                    set_cached_platform(url, platform, base_url)
+            cached = await asyncio.to_thread(get_cached_platform, url) if cache_platform else None
+            if cached:
+                platform, base_url = cached
+                logger.debug(
+                    f"Platform cache hit for {url}: Platform={platform}, Base URL={base_url}"
+                )
             else:
-                platform, base_url = await detect_platform(url, detection_http)
-                logger.debug(f"Platform detected (no cache): Name={platform}, Base URL={base_url}")
+                logger.debug(f"Detecting platform for {url}...")
+                report = DetectionReport()
+                with detection_retries:
+                    platform, base_url = await detect_platform(
+                        url, http, timeout=detect_timeout, report=report
+                    )
+                logger.debug(f"Platform detected: Name={platform}, Base URL={base_url}")
+                if cache_platform and not report.guessed:
+                    await asyncio.to_thread(set_cached_platform, url, platform, base_url)
         else:
             base_url = url
             logger.debug(f"Using specified platform: Name={platform}, Base URL={base_url}")
+
+        try:
+            client_class = get_platform_client(platform)
+        except UnknownPlatformError:
+            logger.error(f"Unknown platform specified or detected: {platform}")
+            raise UnknownPlatformError(platform)
     except Exception:
-        if detection_http_owned:
-            await detection_http.aclose()
+        if http_owned:
+            await http.aclose()
         raise
 
-    # Determine final HTTP client configuration
-    if http is None:
-        if platform == "auto" and "retries" not in base_http_config:
-            if detection_http_owned:
-                await detection_http.aclose()
-            http = make_http_client(config=base_http_config)
-        else:
-            http = detection_http
-            detection_http_owned = False
-
-    try:
-        client_class = get_platform_client(platform)
-    except UnknownPlatformError:
-        logger.error(f"Unknown platform specified or detected: {platform}")
-        raise UnknownPlatformError(platform)
-
     initialized_client = client_class(http=http, url=base_url)
+    initialized_client._owns_http = http_owned
     logger.info(
         f"CTFBridge client for {initialized_client.platform_name} at {initialized_client.platform_url} created successfully."
     )
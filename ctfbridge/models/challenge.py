@@ -38,6 +38,9 @@ class DownloadInfo(BaseModel):
     username: str | None = Field(None, description="Username if required for SSH or API.")
     password: str | None = Field(None, description="Password or token, if available.")
     key: str | None = Field(None, description="Key, if available.")
+    expected_sha256: str | None = Field(
+        None, description="Expected SHA-256 digest; downloads that do not match are discarded."
+    )
     extra: dict[str, str] | None = Field(
         default_factory=dict,
         description="Additional platform-specific metadata.",
@@ -52,7 +55,16 @@ class Attachment(BaseModel):
         None, description="Local file path after download, if available."
     )
     size_bytes: int | None = Field(None, description="Size of the file in bytes, if known.")
+    sha256: str | None = Field(None, description="SHA-256 digest of the file, if downloaded.")
+    md5: str | None = Field(None, description="MD5 digest of the file, if computed.")
+    file_type: str | None = Field(
+        None, description="MIME type detected from the file's contents, if downloaded."
+    )
     download_info: DownloadInfo = Field(None, description="How to obtain this attachment.")
+    children: list["Attachment"] = Field(
+        default_factory=list,
+        description="Files extracted from this attachment, if it is an archive that was extracted.",
+    )
 
     @computed_field
     @property
@@ -240,6 +252,24 @@ class Challenge(BaseModel):
         return attachments.model_dump()
 
 
+class DownloadEvent(BaseModel):
+    """Reports the outcome of one attachment download scheduled by `download_many`."""
+
+    challenge: Challenge = Field(..., description="The challenge the attachment belongs to.")
+    attachment: Attachment = Field(..., description="The attachment that was requested.")
+    results: list[Attachment] = Field(
+        default_factory=list,
+        description="The downloaded attachments. SSH directories yield one entry per file.",
+    )
+    error: str | None = Field(None, description="The failure reason, if the download failed.")
+
+    @computed_field
+    @property
+    def ok(self) -> bool:
+        """True if the download succeeded."""
+        return self.error is None
+
+
 class FilterOptions(BaseModel):
     """
     Filtering parameters used to retrieve specific challenges.
@@ -1,8 +1,28 @@
+from typing import TYPE_CHECKING
+
 from ctfbridge.exceptions import UnknownPlatformError
-from ctfbridge.platforms.berg.identifier import BergIdentifier
-from ctfbridge.platforms.ctfd.identifier import CTFdIdentifier
-from ctfbridge.platforms.ept.identifier import EPTIdentifier
-from ctfbridge.platforms.rctf.identifier import RCTFIdentifier
-from ctfbridge.platforms.registry import get_platform_client
+from ctfbridge.platforms.registry import PLATFORM_IDENTIFIERS, get_platform_client, import_object
+
+if TYPE_CHECKING:
+    from ctfbridge.platforms.berg.identifier import BergIdentifier
+    from ctfbridge.platforms.ctfd.identifier import CTFdIdentifier
+    from ctfbridge.platforms.ept.identifier import EPTIdentifier
+    from ctfbridge.platforms.rctf.identifier import RCTFIdentifier
+
+__all__ = [
+    "BergIdentifier",
+    "CTFdIdentifier",
+    "EPTIdentifier",
+    "RCTFIdentifier",
+    "UnknownPlatformError",
+    "get_platform_client",
+]
+
+_IDENTIFIERS = {path.rsplit(".", 1)[1]: path for path in PLATFORM_IDENTIFIERS.values()}
+
 
-__all__ = ["get_platform_client"]
+def __getattr__(name: str):
+    # Identifiers are imported on first use so that importing detection stays cheap
+    if name in _IDENTIFIERS:
+        return import_object(_IDENTIFIERS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,6 @@
-from typing import Optional
-from urllib.parse import ParseResult
-
 import httpx
 
-from ctfbridge.base.identifier import PlatformIdentifier
+from ctfbridge.base.identifier import PlatformIdentifier, Signature
 from ctfbridge.platforms.berg.http.endpoints import Endpoints
 
 
@@ -12,6 +9,8 @@ class BergIdentifier(PlatformIdentifier):
     Identifier for Berg platforms using known API endpoints and response signatures.
     """
 
+    signatures = (Signature("Berg CTF Platform"),)
+
     def __init__(self, http: httpx.AsyncClient):
         self.http = http
 
@@ -19,18 +18,6 @@ class BergIdentifier(PlatformIdentifier):
     def platform_name(self):
         return "Berg"
 
-    def match_url_pattern(self, url: ParseResult) -> bool:
-        return False
-
-    async def static_detect(self, response: httpx.Response) -> Optional[bool]:
-        """
-        Lightweight static detection by checking HTML or response text for 'ctfd'.
-        """
-        text = response.text
-        if "Berg CTF Platform" in text:
-            return True
-        return None
-
     async def is_base_url(self, candidate: str) -> bool:
         """
         A base URL is valid if the Berg metadata endpoint is reachable.
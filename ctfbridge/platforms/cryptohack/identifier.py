@@ -1,4 +1,4 @@
-from urllib.parse import ParseResult, urlparse
+from urllib.parse import urlparse
 
 import httpx
 
@@ -14,12 +14,6 @@ class CryptoHackIdentifier(PlatformIdentifier):
     def platform_name(self):
         return "CryptoHack"
 
-    def match_url_pattern(self, url: ParseResult) -> bool:
-        return url.netloc.lower() == "cryptohack.org"
-
-    async def static_detect(self, response: httpx.Response) -> bool | None:
-        return False
-
     async def dynamic_detect(self, base_url: str) -> bool:
         return False
 
@@ -15,10 +15,22 @@ class Endpoints:
         def detail(id: str) -> str:
             return f"{API_BASE}/challenges/{id}"
 
+    class Users:
+        ME = f"{API_BASE}/users/me"
+        ME_SOLVES = f"{API_BASE}/users/me/solves"
+
+    class Teams:
+        ME = f"{API_BASE}/teams/me"
+        ME_SOLVES = f"{API_BASE}/teams/me/solves"
+
     class Scoreboard:
         FULL = f"{API_BASE}/scoreboard"
         TOP_TEAMS = f"{API_BASE}/scoreboard/top"
 
+        @staticmethod
+        def top(count: int) -> str:
+            return f"{API_BASE}/scoreboard/top/{count}"
+
     class Misc:
         BASE_PAGE = "/"
         SWAGGER = f"{API_BASE}/swagger.json"
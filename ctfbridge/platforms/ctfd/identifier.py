@@ -1,9 +1,6 @@
-from typing import Optional
-from urllib.parse import ParseResult
-
 import httpx
 
-from ctfbridge.base.identifier import PlatformIdentifier
+from ctfbridge.base.identifier import PlatformIdentifier, Signature
 from ctfbridge.platforms.ctfd.http.endpoints import Endpoints
 
 
@@ -12,6 +9,8 @@ class CTFdIdentifier(PlatformIdentifier):
     Identifier for CTFd platforms using known API endpoints and response signatures.
     """
 
+    signatures = (Signature("Powered by CTFd"),)
+
     def __init__(self, http: httpx.AsyncClient):
         self.http = http
 
@@ -19,18 +18,6 @@ class CTFdIdentifier(PlatformIdentifier):
     def platform_name(self):
         return "CTFd"
 
-    def match_url_pattern(self, url: ParseResult) -> bool:
-        return url.netloc.lower().endswith(".ctfd.io")
-
-    async def static_detect(self, response: httpx.Response) -> Optional[bool]:
-        """
-        Lightweight static detection by checking HTML or response text for 'ctfd'.
-        """
-        text = response.text
-        if "Powered by CTFd" in text:
-            return True
-        return None
-
     async def is_base_url(self, candidate: str) -> bool:
         """
         A base URL is valid if the CTFd /api/v1/swagger endpoint is reachable.
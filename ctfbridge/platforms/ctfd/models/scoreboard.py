@@ -15,3 +15,14 @@ class CTFdScoreboardEntry(BaseModel):
     def to_core_model(self) -> ScoreboardEntry:
         """Convert to core ScoreboardEntry model"""
         return ScoreboardEntry.model_construct(name=self.name, score=self.score, rank=self.pos)
+
+
+class CTFdTopScoreboardEntry(BaseModel):
+    """Model for an entry of the CTFd top scoreboard, which is keyed by position"""
+
+    name: str
+    score: int
+
+    def to_core_model(self, pos: int) -> ScoreboardEntry:
+        """Convert to core ScoreboardEntry model"""
+        return ScoreboardEntry.model_construct(name=self.name, score=self.score, rank=pos)
@@ -1,13 +1,14 @@
 """CTFd scoreboard service"""
 
 import logging
-from typing import List
+import re
+from typing import Any, List
 
 from ctfbridge.core.services.scoreboard import CoreScoreboardService
 from ctfbridge.exceptions import NotAuthenticatedError, ScoreboardFetchError
 from ctfbridge.models.scoreboard import ScoreboardEntry
 from ctfbridge.platforms.ctfd.http.endpoints import Endpoints
-from ctfbridge.platforms.ctfd.models.scoreboard import CTFdScoreboardEntry
+from ctfbridge.platforms.ctfd.models.scoreboard import CTFdScoreboardEntry, CTFdTopScoreboardEntry
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +18,62 @@ class CTFdScoreboardService(CoreScoreboardService):
         self._client = client
 
     async def _fetch_scoreboard(self, limit) -> List[ScoreboardEntry]:
+        if limit > 0:
+            # The top endpoint only returns the first `limit` positions
+            top = await self._get_data(Endpoints.Scoreboard.top(limit), allow_missing=True)
+            if isinstance(top, dict):
+                return [
+                    CTFdTopScoreboardEntry(**entry).to_core_model(pos=int(pos))
+                    for pos, entry in sorted(top.items(), key=lambda item: int(item[0]))
+                ]
+            logger.debug("Top scoreboard endpoint unavailable, fetching the full scoreboard")
+
+        data = await self._get_data(Endpoints.Scoreboard.FULL)
+        scoreboard = [CTFdScoreboardEntry(**entry).to_core_model() for entry in data]
+        return scoreboard
+
+    async def _fetch_own_standing(self) -> ScoreboardEntry | None:
+        user = await self._get_data(Endpoints.Users.ME)
+        if not isinstance(user, dict):
+            raise ScoreboardFetchError("Invalid response format from server (profile).")
+        # In team mode the standing is the team's, not the user's
+        if user.get("team_id") is not None:
+            account = await self._get_data(Endpoints.Teams.ME)
+            solves = await self._get_data(Endpoints.Teams.ME_SOLVES)
+        else:
+            account = user
+            solves = await self._get_data(Endpoints.Users.ME_SOLVES)
+
+        if not isinstance(account, dict) or not isinstance(solves, list):
+            raise ScoreboardFetchError("Invalid response format from server (profile).")
+        account_id, name = account.get("id"), account.get("name")
+        if account_id is None or not name:
+            raise ScoreboardFetchError("Invalid response format from server (profile).")
+
+        place = re.match(r"\d+", account.get("place") or "")
+        if place:
+            return ScoreboardEntry.model_construct(
+                id=str(account_id),
+                name=name,
+                score=account.get("score") or 0,
+                rank=int(place.group()),
+                total_solves=len(solves),
+            )
+
+        logger.debug("Own place not in profile, searching the scoreboard")
+        entry = await self._find_on_scoreboard(name)
+        return entry.model_copy(update={"total_solves": len(solves)}) if entry else None
+
+    async def _get_data(self, path: str, allow_missing: bool = False) -> Any:
+        """
+        Fetch the data of a scoreboard endpoint.
+
+        Args:
+            path: The endpoint path.
+            allow_missing: Return None instead of failing if the endpoint does not exist.
+        """
         try:
-            resp = await self._client.get(Endpoints.Scoreboard.FULL)
+            resp = await self._client.get(path)
             if resp.status_code == 401 or (
                 resp.status_code == 302 and "login" in resp.headers.get("location", "")
             ):
@@ -27,12 +82,12 @@ class CTFdScoreboardService(CoreScoreboardService):
             if resp.status_code == 403:
                 raise ScoreboardFetchError("Scoreboard is not available")
 
-            data = resp.json().get("data", [])
+            if resp.status_code == 404 and allow_missing:
+                return None
+
+            return resp.json().get("data", [])
         except (NotAuthenticatedError, ScoreboardFetchError):
             raise
         except Exception as e:
             logger.debug("Failed to fetch scoreboard")
             raise ScoreboardFetchError("Invalid response format from server (scoreboard).") from e
-
-        scoreboard = [CTFdScoreboardEntry(**entry).to_core_model() for entry in data]
-        return scoreboard
@@ -1,20 +1,32 @@
 import asyncio
+import socket
 import ssl
 import time
-from typing import Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Tuple, TypeVar
 from urllib.parse import urlparse, urlunparse
 import logging
 
 import httpx
 
-from ctfbridge.exceptions import UnknownBaseURLError, UnknownPlatformError
-from ctfbridge.platforms.registry import get_identifier_classes
+from ctfbridge.base.identifier import PlatformIdentifier
+from ctfbridge.exceptions import DetectionTimeoutError, UnknownBaseURLError, UnknownPlatformError
+from ctfbridge.platforms.registry import get_identifier_classes, match_url_patterns
+from ctfbridge.platforms.signatures import SignatureMatcher
+from ctfbridge.utils.platform_cache import (
+    get_cached_failure,
+    get_cached_platform,
+    set_cached_platform,
+    update_cached_failures,
+)
 
 logger = logging.getLogger(__name__)
 
 _MAX_CONCURRENT_PROBES = 4
-_FAILED_CANDIDATE_TTL = 300.0  # seconds
-_failed_candidate_cache: dict[str, float] = {}
+_MAX_CONCURRENT_CHECKS = 8
+
+T = TypeVar("T")
 
 
 def _extract_ssl_error(exc: BaseException) -> ssl.SSLError | None:
@@ -51,24 +63,131 @@ def _is_ssl_verification_disabled(http: httpx.AsyncClient) -> bool:
     return False
 
 
-def _record_failure(candidate: str) -> None:
-    _failed_candidate_cache[candidate] = time.monotonic()
+class _ResponseMemo:
+    """
+    Wraps an HTTP client for one detection run, answering repeated GETs from memory.
+
+    Identifiers often request the same URLs (a CTFd base URL check and its dynamic check
+    both fetch the swagger document, for example). Each distinct URL is fetched once per
+    run; concurrent requests for it share the same in-flight request, and errors are
+    memoized as well. Everything other than ``get`` is delegated to the wrapped client.
+    """
 
+    def __init__(self, http: httpx.AsyncClient):
+        self._http = http
+        self._responses: dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self._http, name)
+
+    async def get(self, url, *, params=None, **kwargs) -> httpx.Response:
+        key = str(httpx.URL(url, params=params))
+        future = self._responses.get(key)
+        if future is None:
+            self.misses += 1
+            future = self._responses[key] = asyncio.ensure_future(
+                self._http.get(url, params=params, **kwargs)
+            )
+        else:
+            self.hits += 1
+        # Shield the shared request so one cancelled caller does not cancel the others
+        return await asyncio.shield(future)
+
+    def close(self) -> None:
+        """Cancel requests nobody is waiting for anymore and drop the memo."""
+        for future in self._responses.values():
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled():
+                # Mark failures as retrieved
+                future.exception()
+        self._responses.clear()
+
+
+@dataclass
+class DetectionReport:
+    """
+    What a detection run did, for diagnostics.
+
+    Attributes:
+        timings: Seconds spent in each phase that ran, in order: ``direct`` (URL
+            patterns), ``probe`` (fetching candidate pages), ``static`` (signatures) and
+            ``dynamic`` (platform API checks). Base URL checks count towards the phase
+            that started them.
+        guess: The most likely (platform, base URL) seen so far, even if unconfirmed.
+        guessed: Whether the result is an unconfirmed guess returned because the
+            detection deadline ran out.
+        requests: Number of HTTP requests sent.
+    """
 
-def _is_recent_failure(candidate: str) -> bool:
-    timestamp = _failed_candidate_cache.get(candidate)
-    if timestamp is None:
-        return False
+    timings: dict[str, float] = field(default_factory=dict)
+    guess: tuple[str, str] | None = None
+    guessed: bool = False
+    requests: int = 0
+    _phase: str | None = field(default=None, repr=False)
+    _phase_started: float = field(default=0.0, repr=False)
+
+    def _enter(self, phase: str) -> None:
+        self._finish()
+        self._phase = phase
+        self._phase_started = time.perf_counter()
+
+    def _finish(self) -> None:
+        if self._phase:
+            elapsed = time.perf_counter() - self._phase_started
+            self.timings[self._phase] = self.timings.get(self._phase, 0.0) + elapsed
+            self._phase = None
+
+    def _suggest(self, platform: str, base_url: str) -> None:
+        # Earlier suggestions come from stronger evidence, so they are kept
+        if self.guess is None:
+            self.guess = (platform, base_url)
+
+
+def _classify_failure(exc: BaseException) -> tuple[str, str]:
+    """Categorize a connection failure as dns, tls, timeout, connect or error."""
+    ssl_error = _extract_ssl_error(exc)
+    if ssl_error:
+        return "tls", getattr(ssl_error, "reason", None) or str(ssl_error)
+    if isinstance(exc, httpx.TimeoutException):
+        return "timeout", str(exc) or type(exc).__name__
+
+    current: BaseException | None = exc
+    seen: set[int] = set()
+    while current and id(current) not in seen:
+        if isinstance(current, socket.gaierror):
+            return "dns", str(current)
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
 
-    if time.monotonic() - timestamp > _FAILED_CANDIDATE_TTL:
-        _failed_candidate_cache.pop(candidate, None)
-        return False
+    # httpx does not always chain the resolver error; recognize its message instead
+    message = str(exc)
+    if any(hint in message for hint in ("Name or service not known", "nodename nor servname")):
+        return "dns", message
+    if isinstance(exc, httpx.ConnectError):
+        return "connect", message
+    return "error", message or type(exc).__name__
 
-    return True
 
+def _record_failure(
+    failures: dict[str, tuple[str, str] | None], candidate: str, error: BaseException
+) -> None:
+    reason, detail = _classify_failure(error)
+    logger.debug(f"Remembering failure of {candidate} ({reason}): {detail}")
+    failures[candidate] = (reason, detail)
 
-def _clear_failure(candidate: str) -> None:
-    _failed_candidate_cache.pop(candidate, None)
+
+async def _save_failures(failures: dict[str, tuple[str, str] | None]) -> None:
+    """Write the failures recorded by detection runs to the cache in one go."""
+    if failures:
+        await asyncio.to_thread(update_cached_failures, dict(failures))
+        failures.clear()
+
+
+def _cached_failures(candidates: list[str]) -> dict[str, tuple[str, str] | None]:
+    return {candidate: get_cached_failure(candidate) for candidate in candidates}
 
 
 def _normalize_base_url(url: str) -> str:
@@ -149,13 +268,80 @@ async def _probe_candidates(
     return results
 
 
-async def detect_platform(input_url: str, http: httpx.AsyncClient) -> Tuple[str, str]:
+async def _first_confirmed(
+    checks: list[Callable[[], Awaitable[T | None]]],
+    limit: int = _MAX_CONCURRENT_CHECKS,
+) -> T | None:
+    """
+    Run checks concurrently and return the result of the highest-priority confirmed one.
+
+    Checks are given in priority order and return None if not confirmed. At most
+    ``limit`` run at once. A confirmed result is returned as soon as every check before
+    it has failed, and the checks after it are cancelled, so the outcome is the same as
+    running them one by one.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(check: Callable[[], Awaitable[T | None]]) -> T | None:
+        async with semaphore:
+            try:
+                return await check()
+            except Exception as e:
+                logger.debug(f"Detection check failed: {e}")
+                return None
+
+    tasks = [asyncio.create_task(_run(check)) for check in checks]
+    try:
+        for task in tasks:
+            result = await task
+            if result is not None:
+                return result
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@lru_cache(maxsize=8)
+def _signature_matcher(identifier_classes: tuple[tuple[str, type], ...]) -> SignatureMatcher:
+    return SignatureMatcher((name, cls.signatures) for name, cls in identifier_classes)
+
+
+async def _static_candidates(
+    response: httpx.Response,
+    matcher: SignatureMatcher,
+    custom_static: list[tuple[str, PlatformIdentifier]],
+    priority: dict[str, int],
+) -> list[str]:
+    """
+    Rank the platforms whose static signatures match a page, best first.
+
+    Identifiers overriding `static_detect` count as one matched signature when it
+    returns a truthy value.
+    """
+    scores = dict(matcher.match(response))
+    for name, identifier in custom_static:
+        if await identifier.static_detect(response):
+            scores[name] = scores.get(name, 0) + 1.0
+    return sorted(scores, key=lambda name: (-scores[name], priority[name]))
+
+
+async def detect_platform(
+    input_url: str,
+    http: httpx.AsyncClient,
+    timeout: float | None = None,
+    report: DetectionReport | None = None,
+) -> Tuple[str, str]:
     """
     Detect the platform type and base URL from a possibly nested URL.
 
     Args:
         input_url: Domain or URL to the platform (scheme optional).
         http: A shared HTTP client.
+        timeout: Deadline in seconds for the whole detection, across all phases. When it
+            runs out, the best unconfirmed guess is returned if there is one.
+        report: Filled in with per-phase timings and whether the result is a guess.
 
     Returns:
         (platform_name, base_url)
@@ -163,13 +349,62 @@ async def detect_platform(input_url: str, http: httpx.AsyncClient) -> Tuple[str,
     Raises:
         UnknownPlatformError: If no known platform is matched.
         UnknownBaseURLError: If the platform is matched but no working base URL is found.
+        DetectionTimeoutError: If the deadline ran out before anything was guessed.
+    """
+    report = report if report is not None else DetectionReport()
+    memo = _ResponseMemo(http)
+    failures: dict[str, tuple[str, str] | None] = {}
+    task = asyncio.ensure_future(_detect_platform(input_url, memo, report, failures))
+    try:
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+        if task in done:
+            return task.result()
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        report._finish()
+        if report.guess is None:
+            raise DetectionTimeoutError(input_url, timeout, report.timings)
+        logger.warning(
+            f"Platform detection for {input_url} timed out after {timeout}s, "
+            f"guessing {report.guess[0]} at {report.guess[1]}"
+        )
+        report.guessed = True
+        return report.guess
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        memo.close()
+        await _save_failures(failures)
+        report._finish()
+        report.requests = memo.misses
+        breakdown = ", ".join(f"{phase} {secs:.2f}s" for phase, secs in report.timings.items())
+        logger.debug(
+            f"Detection of {input_url} made {memo.misses} requests ({memo.hits} memoized): "
+            f"{breakdown}"
+        )
+
+
+async def _detect_platform(
+    input_url: str,
+    http: httpx.AsyncClient,
+    report: DetectionReport | None = None,
+    failures: dict[str, tuple[str, str] | None] | None = None,
+) -> Tuple[str, str]:
     """
+    Detect the platform of a URL.
+
+    Candidate failures are collected into ``failures`` (None marks a candidate that
+    responded) for the caller to save with `_save_failures` once detection is over.
+    """
+    report = report if report is not None else DetectionReport()
+    failures = failures if failures is not None else {}
 
     def _append_unique(items: list[str], value: str | None) -> None:
         if value and value not in items:
             items.append(value)
 
-    identifier_classes = list(get_identifier_classes())
     raw_inputs = _expand_input_urls(input_url)
     ssl_verification_disabled = _is_ssl_verification_disabled(http)
 
@@ -181,11 +416,6 @@ async def detect_platform(input_url: str, http: httpx.AsyncClient) -> Tuple[str,
                 seen_candidates.add(candidate)
                 candidates.append(candidate)
 
-    parsed_candidates = {candidate: urlparse(candidate) for candidate in candidates}
-    identifier_instances = [
-        (name, IdentifierClass(http)) for name, IdentifierClass in identifier_classes
-    ]
-
     failed_candidates: set[str] = set()
     reachable_candidates: list[str] = []
 
@@ -206,7 +436,16 @@ async def detect_platform(input_url: str, http: httpx.AsyncClient) -> Tuple[str,
                 ordered_candidates.append(candidate)
                 seen.add(candidate)
 
-        checked: set[str] = set()
+        checks: list[Callable[[], Awaitable[str | None]]] = []
+
+        async def _canonical(url: str) -> str:
+            return url
+
+        async def _check(base_candidate: str) -> str | None:
+            if await identifier.is_base_url(base_candidate):
+                return base_candidate
+            failed_candidates.add(base_candidate)
+            return None
 
         for base_candidate in ordered_candidates:
             try:
@@ -216,41 +455,69 @@ async def detect_platform(input_url: str, http: httpx.AsyncClient) -> Tuple[str,
                 canonical_candidate = None
 
             if canonical_candidate:
-                return canonical_candidate
-
-            if base_candidate in checked:
-                continue
-            checked.add(base_candidate)
+                # Trusted without probing, so nothing after it needs checking
+                checks.append(lambda url=canonical_candidate: _canonical(url))
+                break
 
             if base_candidate in failed_candidates:
                 continue
 
-            if await identifier.is_base_url(base_candidate):
-                return base_candidate
+            checks.append(lambda url=base_candidate: _check(url))
 
-            failed_candidates.add(base_candidate)
+        base_url = await _first_confirmed(checks)
+        if base_url is None:
+            raise UnknownBaseURLError(input_url)
+        return base_url
 
-        raise UnknownBaseURLError(input_url)
-
-    for candidate, parsed_candidate in parsed_candidates.items():
-        for name, identifier in identifier_instances:
+    # URL patterns are matched from the registry, so only identifiers of matching
+    # platforms are imported for a direct match
+    report._enter("direct")
+    for candidate in candidates:
+        for name, IdentifierClass in get_identifier_classes(match_url_patterns(candidate)):
+            report._suggest(name, candidate)
             try:
-                if identifier.match_url_pattern(parsed_candidate):
-                    logger.debug(
-                        f"[Direct match] URL {candidate} identified as {name}, verifying base URL..."
-                    )
-                    base_url = await _find_valid_base_url(identifier, [candidate])
-                    logger.debug(f"[Direct match] Confirmed base URL for {name}: {base_url}")
-                    return name, base_url
+                logger.debug(
+                    f"[Direct match] URL {candidate} identified as {name}, verifying base URL..."
+                )
+                base_url = await _find_valid_base_url(IdentifierClass(http), [candidate])
+                logger.debug(f"[Direct match] Confirmed base URL for {name}: {base_url}")
+                return name, base_url
             except Exception as e:
                 logger.debug(f"[Direct match] Error matching {candidate} with {name}: {e}")
+                if report.guess == (name, candidate):
+                    report.guess = None
+
+    identifier_classes = get_identifier_classes()
+    identifier_instances = [
+        (name, IdentifierClass(http)) for name, IdentifierClass in identifier_classes
+    ]
+    identifiers = dict(identifier_instances)
+    priority = {name: index for index, (name, _) in enumerate(identifier_instances)}
+    signature_matcher = _signature_matcher(tuple(identifier_classes))
+    # Identifiers with hand-written static detection instead of (or besides) signatures
+    custom_static = [
+        (name, identifier)
+        for name, identifier in identifier_instances
+        if type(identifier).static_detect is not PlatformIdentifier.static_detect
+    ]
 
-    probe_targets = [candidate for candidate in candidates if not _is_recent_failure(candidate)]
-    for skipped in candidates:
-        if skipped not in probe_targets:
-            failed_candidates.add(skipped)
+    probe_targets: list[str] = []
+    known_failures: dict[str, tuple[str, str]] = {}
+    # The cache is file backed, so it is read off the event loop
+    cached_failures = await asyncio.to_thread(_cached_failures, candidates)
+    for candidate in candidates:
+        failure = cached_failures[candidate]
+        # TLS failures recorded with verification on say nothing once it is off
+        if failure and not (failure[0] == "tls" and ssl_verification_disabled):
+            logger.debug(f"Skipping {candidate}, failed recently ({failure[0]}): {failure[1]}")
+            known_failures[candidate] = failure
+            failed_candidates.add(candidate)
+        else:
+            probe_targets.append(candidate)
 
+    report._enter("probe")
     probe_results = await _probe_candidates(http, probe_targets) if probe_targets else {}
+    report._enter("static")
 
     for candidate in candidates:
         response, error = probe_results.get(candidate, (None, None))
@@ -258,7 +525,7 @@ async def detect_platform(input_url: str, http: httpx.AsyncClient) -> Tuple[str,
         if response is None:
             failed_candidates.add(candidate)
             if candidate in probe_results:
-                _record_failure(candidate)
+                _record_failure(failures, candidate, error)
                 ssl_error = _extract_ssl_error(error) if error else None
                 if ssl_error:
                     if ssl_verification_disabled:
@@ -268,9 +535,14 @@ async def detect_platform(input_url: str, http: httpx.AsyncClient) -> Tuple[str,
                         f"SSL error while connecting to {candidate}: {detail}. "
                         "If this is expected, rerun with SSL verification disabled."
                     ) from error
+            elif candidate in known_failures and known_failures[candidate][0] == "tls":
+                raise UnknownPlatformError(
+                    f"SSL error while connecting to {candidate}: {known_failures[candidate][1]}. "
+                    "If this is expected, rerun with SSL verification disabled."
+                )
             continue
 
-        _clear_failure(candidate)
+        failures[candidate] = None
 
         final_candidate = _normalize_base_url(str(response.url))
         preferred_candidates: list[str] = []
@@ -279,22 +551,133 @@ async def detect_platform(input_url: str, http: httpx.AsyncClient) -> Tuple[str,
         preferred_candidates.append(candidate)
 
         for base in preferred_candidates:
-            _clear_failure(base)
+            failures[base] = None
             _append_unique(reachable_candidates, base)
 
-        for name, identifier in identifier_instances:
-            detection = await identifier.static_detect(response)
-            if detection:
-                base_url = await _find_valid_base_url(identifier, preferred_candidates)
-                return name, base_url
+        ranked = await _static_candidates(response, signature_matcher, custom_static, priority)
+        if ranked:
+            name = ranked[0]
+            logger.debug(f"[Static match] {candidate} identified as {name}")
+            report._suggest(name, preferred_candidates[0])
+            base_url = await _find_valid_base_url(identifiers[name], preferred_candidates)
+            return name, base_url
 
     if not reachable_candidates:
+        reasons = sorted({reason for reason, _ in known_failures.values()})
+        if reasons:
+            raise UnknownPlatformError(
+                f"Could not connect to {input_url} (recently failed: {', '.join(reasons)})"
+            )
         raise UnknownPlatformError(f"Could not connect to {input_url}")
 
-    for candidate in reachable_candidates:
-        for name, identifier in identifier_instances:
-            if await identifier.dynamic_detect(candidate):
-                base_url = await _find_valid_base_url(identifier, [candidate])
-                return name, base_url
+    report._enter("dynamic")
+
+    async def _dynamic_check(candidate: str, name: str, identifier) -> tuple | None:
+        if await identifier.dynamic_detect(candidate):
+            return candidate, name, identifier
+        return None
+
+    # Candidates and identifiers are in priority order; the earliest confirmed pair wins
+    match = await _first_confirmed(
+        [
+            lambda args=(candidate, name, identifier): _dynamic_check(*args)
+            for candidate in reachable_candidates
+            for name, identifier in identifier_instances
+        ]
+    )
+    if match:
+        candidate, name, identifier = match
+        base_url = await _find_valid_base_url(identifier, [candidate])
+        return name, base_url
 
     raise UnknownPlatformError(f"Could not detect platform from {input_url}")
+
+
+def _host_of(input_url: str) -> str:
+    return urlparse(_expand_input_urls(input_url)[0]).netloc.lower()
+
+
+async def detect_many(
+    urls: Iterable[str],
+    http: httpx.AsyncClient | None = None,
+    concurrency: int = 16,
+    use_cache: bool = True,
+) -> AsyncIterator[tuple[str, str | None, str | Exception]]:
+    """
+    Detect the platforms of many URLs, yielding results as they resolve.
+
+    All detections share one HTTP connection pool. URLs on the same host are detected
+    one after another with a shared response memo, so candidate URLs they have in
+    common (such as the site root) are only probed once; different hosts are detected
+    concurrently. Duplicate URLs are detected once.
+
+    Example:
+        async for url, platform, result in detect_many(urls, concurrency=32):
+            if platform:
+                print(url, platform, result)
+            else:
+                print(url, "failed:", result)
+
+    Args:
+        urls: Domains or URLs to detect (scheme optional).
+        http: HTTP client to use. If None, a client is created and closed afterwards.
+        concurrency: Maximum number of hosts detected at once.
+        use_cache: Answer from, and add results to, the platform cache.
+
+    Yields:
+        ``(url, platform, base_url)`` for detected URLs and ``(url, None, error)`` for
+        URLs that could not be detected.
+    """
+    from ctfbridge.core.http import make_http_client
+
+    hosts: dict[str, list[str]] = {}
+    queue: asyncio.Queue = asyncio.Queue()
+    pending = 0
+
+    for url in dict.fromkeys(urls):
+        pending += 1
+        try:
+            host = _host_of(url)
+        except ValueError as e:
+            queue.put_nowait((url, None, e))
+            continue
+        if use_cache:
+            cached = await asyncio.to_thread(get_cached_platform, url)
+            if cached:
+                queue.put_nowait((url, *cached))
+                continue
+        hosts.setdefault(host, []).append(url)
+
+    owns_http = http is None
+    if owns_http:
+        http = make_http_client(config={"retries": 1})
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _detect_host(host_urls: list[str]) -> None:
+        async with semaphore:
+            memo = _ResponseMemo(http)
+            failures: dict[str, tuple[str, str] | None] = {}
+            try:
+                for url in host_urls:
+                    try:
+                        platform, base_url = await _detect_platform(url, memo, failures=failures)
+                    except Exception as e:
+                        queue.put_nowait((url, None, e))
+                        continue
+                    if use_cache:
+                        await asyncio.to_thread(set_cached_platform, url, platform, base_url)
+                    queue.put_nowait((url, platform, base_url))
+            finally:
+                memo.close()
+                await _save_failures(failures)
+
+    tasks = [asyncio.create_task(_detect_host(host_urls)) for host_urls in hosts.values()]
+    try:
+        for _ in range(pending):
+            yield await queue.get()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if owns_http:
+            await http.aclose()
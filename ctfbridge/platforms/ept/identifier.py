@@ -1,4 +1,4 @@
-from urllib.parse import ParseResult, urlparse, urlunparse
+from urllib.parse import urlparse, urlunparse
 
 import httpx
 
@@ -18,9 +18,6 @@ class EPTIdentifier(PlatformIdentifier):
     def platform_name(self):
         return "EPT"
 
-    def match_url_pattern(self, url: ParseResult) -> bool:
-        return url.netloc.lower() in {"ctf.ept.gg", "backend.ept.gg"}
-
     def get_base_url(self, candidate: str) -> str | None:
         try:
             parsed = urlparse(candidate)
@@ -32,9 +29,6 @@ class EPTIdentifier(PlatformIdentifier):
 
         return None
 
-    async def static_detect(self, response: httpx.Response) -> bool | None:
-        return None
-
     async def is_base_url(self, candidate: str) -> bool:
         try:
             url = f"{candidate.rstrip('/')}{Endpoints.Misc.METADATA}"
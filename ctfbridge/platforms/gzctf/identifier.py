@@ -1,13 +1,15 @@
 import re
-from urllib.parse import ParseResult, urlparse
+from urllib.parse import urlparse
 
 import httpx
 
-from ctfbridge.base.identifier import PlatformIdentifier
+from ctfbridge.base.identifier import PlatformIdentifier, Signature
 from ctfbridge.platforms.ept.http.endpoints import Endpoints
 
 
 class GZCTFIdentifier(PlatformIdentifier):
+    signatures = (Signature("GZCTF"), Signature("GZ::CTF"))
+
     def __init__(self, http: httpx.AsyncClient):
         self.http = http
 
@@ -15,14 +17,6 @@ class GZCTFIdentifier(PlatformIdentifier):
     def platform_name(self):
         return "GZCTF"
 
-    def match_url_pattern(self, url: ParseResult) -> bool:
-        return False
-
-    async def static_detect(self, response: httpx.Response) -> bool | None:
-        if "GZCTF" in response.text or "GZ::CTF" in response.text:
-            return True
-        return None
-
     async def dynamic_detect(self, base_url: str) -> bool:
         return False
 
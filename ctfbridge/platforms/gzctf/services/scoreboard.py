@@ -24,6 +24,9 @@ class GZCTFScoreboardService(CoreScoreboardService):
                 raise NotAuthenticatedError()
 
             data = response.json().get("items", [])
+            # There is no bounded endpoint, but only the needed entries are parsed
+            if limit > 0:
+                data = data[:limit]
         except NotAuthenticatedError:
             raise
         except Exception as e:
@@ -32,3 +35,18 @@ class GZCTFScoreboardService(CoreScoreboardService):
 
         scoreboard = [GZCTFScoreboardEntry(**entry).to_core_model() for entry in data]
         return scoreboard
+
+    async def _own_name(self) -> str | None:
+        try:
+            response = await self._client.get(Endpoints.Ctf.get_details(self._client._ctf_id))
+
+            if response.status_code == 401:
+                raise NotAuthenticatedError()
+
+            # The game details carry the scoreboard item of the participating team
+            return response.json()["rank"]["name"]
+        except NotAuthenticatedError:
+            raise
+        except Exception as e:
+            logger.debug("Failed to fetch own team")
+            raise ScoreboardFetchError("Invalid response format from server (game details).") from e
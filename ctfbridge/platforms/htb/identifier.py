@@ -1,5 +1,4 @@
 import re
-from urllib.parse import ParseResult
 
 import httpx
 
@@ -14,12 +13,6 @@ class HTBIdentifier(PlatformIdentifier):
     def platform_name(self):
         return "HTB"
 
-    def match_url_pattern(self, url: ParseResult) -> bool:
-        return url.netloc.lower() == "ctf.hackthebox.com"
-
-    async def static_detect(self, response: httpx.Response) -> bool | None:
-        return False
-
     async def dynamic_detect(self, base_url: str) -> bool:
         return False
 
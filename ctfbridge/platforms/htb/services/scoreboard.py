@@ -26,6 +26,9 @@ class HTBScoreboardService(CoreScoreboardService):
                 raise NotAuthorizedError()
 
             data = response.json().get("scores", [])
+            # There is no bounded endpoint, but only the needed entries are parsed
+            if limit > 0:
+                data = data[:limit]
         except (NotAuthenticatedError, NotAuthorizedError):
             raise
         except Exception as e:
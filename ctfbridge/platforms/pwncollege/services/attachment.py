@@ -1,13 +1,15 @@
 import logging
 import asyncssh
 import asyncio
-from typing import Callable
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from ctfbridge.core.services.attachment import CoreAttachmentService
 from ctfbridge.models import Attachment
 from pathlib import Path
-from ctfbridge.models.challenge import DownloadInfo, DownloadType, ProgressData
+from ctfbridge.models.challenge import DownloadType
 from ctfbridge.exceptions import AttachmentDownloadError
 from ctfbridge.platforms.pwncollege.utils.api import PwnCollegeService
+from ctfbridge.platforms.pwncollege.utils.instance import OnDemandInstanceManager
 
 
 logger = logging.getLogger(__name__)
@@ -19,55 +21,102 @@ class PwnCollegeAttachmentService(CoreAttachmentService):
     def __init__(self, client):
         super().__init__(client)
         self.svc = PwnCollegeService(client)
+        self.instances = OnDemandInstanceManager()
         self._ssh_keypair = None
-        self._lock = asyncio.Lock()
+        self._key_lock = asyncio.Lock()
 
-    async def download(
+    async def _download(
         self,
         attachment: Attachment,
         save_dir: str | Path,
-        progress: Callable[[ProgressData], None] | None = None,
+        **kwargs,
     ) -> list[Attachment]:
-        if attachment.download_info.type == DownloadType.SSH:
-            logger.info("Starting SSH service for attachment: %s", attachment.name)
+        if attachment.download_info.type != DownloadType.SSH:
+            return await super()._download(attachment, save_dir, **kwargs)
 
-            # We can only run one ondemand instance at a time
-            async with self._lock:
-                # TODO: fix key leaks. Should remove after we are done.
-                private_key, public_key = await self._get_or_create_ssh_keypair()
+        async with self._instance_for(attachment) as ssh_attachment:
+            attachments = await super()._download(ssh_attachment, save_dir, **kwargs)
 
-                attachment.download_info.key = private_key
+        for att in attachments:
+            att.download_info.key = None
 
-                try:
-                    await self.svc.start_ondemand_docker(
-                        attachment.download_info.extra["pwncollege_dojo"],
-                        attachment.download_info.extra["pwncollege_module"],
-                        attachment.download_info.extra["pwncollege_challenge"],
-                    )
+        return attachments
 
-                except Exception as e:
-                    logger.error("Failed to start SSH service: %s", e)
-                    raise AttachmentDownloadError(
-                        attachment.name, f"Failed to start SSH server: {e}"
-                    )
+    @asynccontextmanager
+    async def _open(self, attachment: Attachment) -> AsyncIterator[AsyncIterator[bytes]]:
+        if attachment.download_info.type != DownloadType.SSH:
+            async with super()._open(attachment) as chunks:
+                yield chunks
+            return
 
-                attachments = await super().download(attachment, save_dir, progress)
+        async with (
+            self._instance_for(attachment) as ssh_attachment,
+            super()._open(ssh_attachment) as chunks,
+        ):
+            yield chunks
 
-        for att in attachments:
-            att.download_info.key = None
+    @asynccontextmanager
+    async def _instance_for(self, attachment: Attachment) -> AsyncIterator[Attachment]:
+        """
+        Hold the challenge container serving an SSH attachment.
 
-        return attachments
+        Yields a copy of the attachment carrying the ephemeral private key.
+        """
+        extra = attachment.download_info.extra
+        instance = (
+            extra["pwncollege_dojo"],
+            extra["pwncollege_module"],
+            extra["pwncollege_challenge"],
+        )
+        ssh_attachment = attachment.model_copy(deep=True)
+
+        async def start() -> None:
+            logger.info("Starting SSH service for attachment: %s", attachment.name)
+            try:
+                # Register the key while the container boots
+                await asyncio.gather(
+                    self._get_or_create_ssh_keypair(),
+                    self.svc.start_ondemand_docker(*instance),
+                )
+            except Exception as e:
+                logger.error("Failed to start SSH service: %s", e)
+                raise AttachmentDownloadError(attachment.name, f"Failed to start SSH server: {e}")
+            # Connections to the previous container do not survive the restart
+            ssh_attachment.download_info.key = self._ssh_keypair[0]
+            await self._ssh_pool.invalidate(ssh_attachment.download_info)
 
-    async def _get_or_create_ssh_keypair(self) -> tuple[str, str]:
-        """Generate (and cache) an ephemeral SSH keypair."""
-        if self._ssh_keypair is None:
-            logger.debug("Generating ephemeral SSH keypair")
-            key = asyncssh.generate_private_key("ssh-rsa", comment="ctfbridge")
-            private_key = key.export_private_key()
-            public_key = key.export_public_key()
-            self._ssh_keypair = (private_key, public_key)
-
-            await self.svc.add_ssh_key(public_key)
-        else:
-            logger.debug("Using cached in-memory SSH keypair")
+        # We can only run one ondemand instance at a time
+        async with self.instances.lease(instance, start):
+            private_key, _ = await self._get_or_create_ssh_keypair()
+            ssh_attachment.download_info.key = private_key
+            yield ssh_attachment
+
+    async def _get_or_create_ssh_keypair(self) -> tuple[bytes, bytes]:
+        """Generate (and cache) an ephemeral SSH keypair registered with the account."""
+        async with self._key_lock:
+            if self._ssh_keypair is None:
+                logger.debug("Generating ephemeral SSH keypair")
+                key = await asyncio.to_thread(
+                    asyncssh.generate_private_key, "ssh-rsa", comment="ctfbridge"
+                )
+                keypair = (key.export_private_key(), key.export_public_key())
+
+                await self.svc.add_ssh_key(keypair[1])
+                self._ssh_keypair = keypair
+            else:
+                logger.debug("Using cached in-memory SSH keypair")
         return self._ssh_keypair
+
+    async def _release(self) -> None:
+        """Also remove the ephemeral SSH key from the account once no download is running."""
+        await super()._release()
+        async with self._key_lock:
+            # A download that started meanwhile keeps using the key
+            if self._ssh_keypair is None or self._active_calls:
+                return
+            _, public_key = self._ssh_keypair
+            self._ssh_keypair = None
+            try:
+                await self.svc.remove_ssh_key(public_key)
+            except Exception as e:
+                logger.warning("Failed to remove ephemeral SSH key: %s", e)
@@ -64,8 +64,11 @@ class PwnCollegeService:
         return data["success"]
 
     async def remove_ssh_key(self, public_key) -> bool:
-        response = await self.client.delete(
-            "/pwncollege_api/v1/ssh_key", json={"ssh_key": public_key}
+        # httpx only accepts a JSON body on DELETE through the generic request method
+        response = await self.client._http.request(
+            "DELETE",
+            self.client.url("/pwncollege_api/v1/ssh_key"),
+            json={"ssh_key": public_key.decode()},
         )
         response.raise_for_status()
         data = response.json()
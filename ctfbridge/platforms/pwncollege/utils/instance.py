@@ -0,0 +1,55 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+InstanceKey = tuple[str, str, str]
+
+
+class OnDemandInstanceManager:
+    """
+    Tracks the on-demand challenge container of the logged-in pwn.college user.
+
+    pwn.college runs at most one container per user, and starting one replaces the
+    previous one. Downloads lease the container they need: leases for the running
+    challenge share it without a restart, while a lease for another challenge waits
+    until the running one is no longer in use and then starts its container straight away.
+    """
+
+    def __init__(self):
+        self.current: InstanceKey | None = None
+        self._users = 0
+        self._changed = asyncio.Condition()
+
+    @asynccontextmanager
+    async def lease(
+        self, key: InstanceKey, start: Callable[[], Awaitable[None]]
+    ) -> AsyncIterator[None]:
+        """
+        Hold the container for ``key`` (dojo, module, challenge) for the duration of the block.
+
+        Args:
+            key: The challenge whose container is needed.
+            start: Coroutine function starting that container, called only if it is not
+                already the running one.
+        """
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.current == key or self._users == 0)
+            if self.current != key:
+                logger.debug("Starting on-demand instance for %s", "/".join(key))
+                # Whatever ran before is gone once the start request is sent
+                self.current = None
+                await start()
+                self.current = key
+            else:
+                logger.debug("Reusing running on-demand instance for %s", "/".join(key))
+            self._users += 1
+
+        try:
+            yield
+        finally:
+            async with self._changed:
+                self._users -= 1
+                self._changed.notify_all()
@@ -1,9 +1,6 @@
-from typing import Optional
-from urllib.parse import ParseResult
-
 import httpx
 
-from ctfbridge.base.identifier import PlatformIdentifier
+from ctfbridge.base.identifier import PlatformIdentifier, Signature
 from ctfbridge.exceptions import UnauthorizedError
 
 
@@ -12,6 +9,8 @@ class RCTFIdentifier(PlatformIdentifier):
     Identifier for rCTF platforms using known API endpoints and response signatures.
     """
 
+    signatures = (Signature("rctf-config"),)
+
     def __init__(self, http: httpx.AsyncClient):
         self.http = http
 
@@ -22,17 +21,6 @@ class RCTFIdentifier(PlatformIdentifier):
         """
         return "rCTF"
 
-    def match_url_pattern(self, url: ParseResult) -> bool:
-        return False
-
-    async def static_detect(self, response: httpx.Response) -> Optional[bool]:
-        """
-        Lightweight static detection by checking HTML or response text for rCTF signatures.
-        """
-        if "rctf-config" in response.text:
-            return True
-        return None
-
     async def is_base_url(self, candidate: str) -> bool:
         """
         A base URL is valid if the rCTF /api/v1/users/me endpoint returns the expected
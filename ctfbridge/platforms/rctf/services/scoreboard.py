@@ -1,67 +1,112 @@
+import asyncio
 import logging
-from typing import List
+from collections import deque
+from typing import AsyncIterator
 
 import httpx
 
 from ctfbridge.core.services.scoreboard import CoreScoreboardService
-from ctfbridge.exceptions import NotAuthenticatedError, ScoreboardFetchError
+from ctfbridge.exceptions import ChallengeFetchError, NotAuthenticatedError, ScoreboardFetchError
 from ctfbridge.models.scoreboard import ScoreboardEntry as CoreScoreboardEntry
 from ctfbridge.platforms.rctf.http.endpoints import Endpoints
-from ctfbridge.platforms.rctf.models.scoreboard import RCTFScoreboardResponse
+from ctfbridge.platforms.rctf.models.scoreboard import RCTFScoreboardData, RCTFScoreboardResponse
 
 logger = logging.getLogger(__name__)
 
+PAGE_SIZE = 100
+MAX_CONCURRENT_PAGES = 4
+
 
 class RCTFScoreboardService(CoreScoreboardService):
     def __init__(self, client):
         self._client = client
 
-    async def _fetch_scoreboard(self, limit: int) -> List[CoreScoreboardEntry]:
+    async def _fetch_own_standing(self) -> CoreScoreboardEntry | None:
+        """
+        Reads the standing from the user profile, which includes the global place.
         """
-        Fetches the scoreboard from rCTF with optional pagination.
+        try:
+            profile = await self._client.challenges._fetch_profile()
+        except ChallengeFetchError as e:
+            raise ScoreboardFetchError(str(e)) from e
+
+        if profile.globalPlace is None:
+            logger.debug("Own place not in profile, searching the scoreboard")
+            entry = await self._find_on_scoreboard(profile.name)
+            return entry.model_copy(update={"total_solves": len(profile.solves)}) if entry else None
+
+        return CoreScoreboardEntry.model_construct(
+            id=profile.id,
+            name=profile.name,
+            score=profile.score,
+            rank=profile.globalPlace,
+            total_solves=len(profile.solves),
+        )
+
+    async def _iter_scoreboard(self, limit: int) -> AsyncIterator[CoreScoreboardEntry]:
         """
-        results: List[CoreScoreboardEntry] = []
-        offset = 0
-        fetched_count = 0
-        page_size = 100
+        Streams the scoreboard from rCTF page by page.
 
+        The first page tells how many entries there are; the remaining pages are then
+        fetched concurrently and yielded in order.
+        """
+        first_size = min(PAGE_SIZE, limit) if limit > 0 else PAGE_SIZE
+        page = await self._fetch_page(0, first_size)
+        target = min(limit, page.total) if limit > 0 else page.total
+        offsets = iter(range(first_size, target, PAGE_SIZE))
+        pending: deque[tuple[int, int, asyncio.Task]] = deque()
+
+        def schedule() -> None:
+            # Keep a bounded window of pages in flight ahead of the one being yielded
+            while len(pending) < MAX_CONCURRENT_PAGES:
+                next_offset = next(offsets, None)
+                if next_offset is None:
+                    return
+                size = min(PAGE_SIZE, limit - next_offset) if limit > 0 else PAGE_SIZE
+                task = asyncio.create_task(self._fetch_page(next_offset, size))
+                pending.append((next_offset, size, task))
+
+        offset, size = 0, first_size
         try:
             while True:
-                # Cap how many we request in this round based on user-specified limit
-                request_limit = min(page_size, limit - fetched_count) if limit > 0 else page_size
-                if request_limit <= 0:
-                    break
-
-                logger.debug(f"Fetching scoreboard: offset={offset}, limit={request_limit}")
-                response = await self._client.get(
-                    Endpoints.Scoreboard.NOW,
-                    params={"limit": request_limit, "offset": offset},
-                )
-                response.raise_for_status()
-
-                # Parse and validate full response
-                parsed = RCTFScoreboardResponse(**response.json())
-
-                leaderboard_entries = parsed.data.leaderboard
-                if not leaderboard_entries:
-                    break  # No more data
-
-                for i, entry in enumerate(leaderboard_entries):
+                for rank, entry in enumerate(page.leaderboard, start=offset + 1):
                     try:
-                        rank = offset + i + 1
-                        results.append(entry.to_core_model(rank=rank))
-                        fetched_count += 1
+                        core_entry = entry.to_core_model(rank=rank)
                     except Exception as e:
                         logger.error(f"Error parsing scoreboard entry {entry}: {e}")
                         continue
+                    yield core_entry
 
-                    if limit > 0 and fetched_count >= limit:
-                        break
-
-                if len(leaderboard_entries) < request_limit:
+                if len(page.leaderboard) < size:
                     break  # No more data available from API
 
-                offset += len(leaderboard_entries)
+                # Only fetch ahead once the caller has consumed a page, so stopping early
+                # within the first page sends no further requests
+                schedule()
+                if not pending:
+                    break
+
+                offset, size, task = pending.popleft()
+                page = await task
+        finally:
+            for *_, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for *_, task in pending), return_exceptions=True)
+
+    async def _fetch_page(self, offset: int, limit: int) -> RCTFScoreboardData:
+        """
+        Fetches one page of the scoreboard.
+        """
+        logger.debug(f"Fetching scoreboard: offset={offset}, limit={limit}")
+        try:
+            response = await self._client.get(
+                Endpoints.Scoreboard.NOW,
+                params={"limit": limit, "offset": offset},
+            )
+            response.raise_for_status()
+
+            # Parse and validate full response
+            return RCTFScoreboardResponse(**response.json()).data
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
@@ -79,5 +124,3 @@ class RCTFScoreboardService(CoreScoreboardService):
         except Exception as e:
             logger.exception("Unexpected error during scoreboard fetch")
             raise ScoreboardFetchError(f"Unexpected error: {e}")
-
-        return results
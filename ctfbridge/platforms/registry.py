@@ -1,5 +1,7 @@
 import importlib
-from typing import Any, Type
+from fnmatch import fnmatchcase
+from typing import Any, Iterable, Type
+from urllib.parse import urlparse
 
 # Maps platform names to their client class paths
 PLATFORM_CLIENTS: dict[str, str] = {
@@ -31,6 +33,19 @@ PLATFORM_IDENTIFIERS: dict[str, str] = {
     "pwncollege": "ctfbridge.platforms.pwncollege.identifier.PwnCollegeIdentifier",
 }
 
+# Host patterns (fnmatch syntax) that identify a platform from the URL alone. Declared
+# only here, so URLs can be matched without importing any platform package.
+PLATFORM_URL_PATTERNS: dict[str, tuple[str, ...]] = {
+    "ctfd": ("*.ctfd.io",),
+    "ept": ("ctf.ept.gg", "backend.ept.gg"),
+    "htb": ("ctf.hackthebox.com",),
+    "cryptohack": ("cryptohack.org",),
+    "pwnabletw": ("pwnable.tw",),
+    "pwnablekr": ("pwnable.kr",),
+    "pwnablexyz": ("pwnable.xyz",),
+    "pwncollege": ("pwn.college",),
+}
+
 
 def import_object(dotted_path: str) -> Any:
     """Import a class or function by dotted path."""
@@ -46,5 +61,28 @@ def get_platform_client(name: str) -> type:
     return import_object(PLATFORM_CLIENTS[name])
 
 
-def get_identifier_classes() -> list[tuple[str, Type]]:
-    return [(name, import_object(path)) for name, path in PLATFORM_IDENTIFIERS.items()]
+def get_identifier_classes(names: Iterable[str] | None = None) -> list[tuple[str, Type]]:
+    """
+    Import and return identifier classes in registry (priority) order.
+
+    Args:
+        names: Only import these platforms. All platforms if None.
+    """
+    wanted = PLATFORM_IDENTIFIERS if names is None else set(names)
+    return [
+        (name, import_object(path)) for name, path in PLATFORM_IDENTIFIERS.items() if name in wanted
+    ]
+
+
+def match_url_patterns(url: str) -> list[str]:
+    """
+    Return the platforms whose URL patterns match a URL's host, in registry order.
+
+    Does not import any platform package.
+    """
+    host = urlparse(url).netloc.lower()
+    return [
+        name
+        for name, patterns in PLATFORM_URL_PATTERNS.items()
+        if any(fnmatchcase(host, pattern) for pattern in patterns)
+    ]
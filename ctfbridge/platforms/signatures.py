@@ -0,0 +1,71 @@
+import re
+from collections import defaultdict
+from typing import Iterable
+
+import httpx
+
+from ctfbridge.base.identifier import Signature
+
+
+class SignatureMatcher:
+    """
+    Evaluates the static signatures of many platforms in one pass over a response.
+
+    All body signatures are compiled into a single alternation, so the page is scanned
+    once no matter how many platforms are registered. Header and cookie signatures are
+    looked up directly.
+
+    Body patterns are matched without overlap, longest first; a pattern that only occurs
+    inside a longer matching pattern is not counted separately.
+    """
+
+    def __init__(self, platforms: Iterable[tuple[str, Iterable[Signature]]]):
+        """
+        Args:
+            platforms: (platform name, signatures) pairs in priority order.
+        """
+        self._priority: dict[str, int] = {}
+        self._body: dict[str, list[tuple[str, Signature]]] = defaultdict(list)
+        self._headers: list[tuple[str, Signature]] = []
+        self._cookies: list[tuple[str, Signature]] = []
+
+        for name, signatures in platforms:
+            self._priority.setdefault(name, len(self._priority))
+            for signature in signatures:
+                if signature.where == "body":
+                    self._body[signature.pattern].append((name, signature))
+                elif signature.where == "header":
+                    self._headers.append((name, signature))
+                else:
+                    self._cookies.append((name, signature))
+
+        patterns = sorted(self._body, key=len, reverse=True)
+        self._body_regex = re.compile("|".join(map(re.escape, patterns))) if patterns else None
+
+    def match(self, response: httpx.Response) -> list[tuple[str, float]]:
+        """
+        Score the platforms whose signatures match a response.
+
+        Each distinct matching signature adds its weight to its platform's score.
+
+        Returns:
+            (platform name, score) pairs, highest score first; ties are broken by the
+            priority order the platforms were given in.
+        """
+        matched: dict[str, set[Signature]] = defaultdict(set)
+
+        if self._body_regex:
+            for found in set(self._body_regex.findall(response.text)):
+                for name, signature in self._body[found]:
+                    matched[name].add(signature)
+
+        for name, signature in self._headers:
+            if signature.pattern in response.headers.get(signature.header or "", ""):
+                matched[name].add(signature)
+
+        for name, signature in self._cookies:
+            if signature.pattern in response.cookies:
+                matched[name].add(signature)
+
+        scores = {name: sum(s.weight for s in signatures) for name, signatures in matched.items()}
+        return sorted(scores.items(), key=lambda item: (-item[1], self._priority[item[0]]))
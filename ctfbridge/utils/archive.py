@@ -0,0 +1,319 @@
+import asyncio
+import bz2
+import gzip
+import logging
+import lzma
+import shutil
+import tarfile
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
+
+from ctfbridge.exceptions import AttachmentExtractionError
+from ctfbridge.utils.digest import FileDigest, digest_file
+from ctfbridge.utils.filetype import SNIFF_BYTES, detect_file_type
+
+logger = logging.getLogger(__name__)
+
+_COPY_SIZE = 1048576
+
+# Single-stream compressors that may or may not wrap a tar archive
+_STREAMS = {
+    "application/gzip": (gzip.open, (".gz", ".tgz")),
+    "application/x-xz": (lzma.open, (".xz", ".txz")),
+    "application/x-bzip2": (bz2.open, (".bz2", ".tbz2")),
+}
+
+ARCHIVE_TYPES = frozenset(
+    {"application/zip", "application/x-tar", "application/x-7z-compressed", *_STREAMS}
+)
+
+_ARCHIVE_SUFFIXES = (".zip", ".tar", ".7z", ".tgz", ".txz", ".tbz2", ".gz", ".xz", ".bz2")
+
+
+@dataclass(frozen=True)
+class ExtractionLimits:
+    """Bounds that protect against archive bombs."""
+
+    max_total_bytes: int = 1 << 30
+    max_file_bytes: int = 512 << 20
+    max_members: int = 10000
+
+
+@dataclass(frozen=True)
+class ExtractedFile:
+    """A file written by `extract_archive`, relative to the extraction directory."""
+
+    name: str
+    path: Path
+    digest: FileDigest
+
+
+def is_archive(file_type: str | None) -> bool:
+    """Check whether a MIME type detected by `detect_file_type` is an extractable archive."""
+    return file_type in ARCHIVE_TYPES
+
+
+def extraction_dir(path: Path) -> Path:
+    """Return the directory an archive is extracted to: its path without archive suffixes."""
+    name = path.name
+    while (suffix := Path(name).suffix.lower()) in _ARCHIVE_SUFFIXES:
+        name = name[: -len(suffix)]
+    if not name or name == path.name or (path.parent / name).is_file():
+        name = f"{name or path.name}_extracted"
+    return path.parent / name
+
+
+class _Budget:
+    def __init__(self, archive: Path, limits: ExtractionLimits):
+        self.archive = archive
+        self.limits = limits
+        self.members = 0
+        self.total_bytes = 0
+
+    def add_member(self) -> None:
+        self.members += 1
+        if self.members > self.limits.max_members:
+            raise AttachmentExtractionError(
+                str(self.archive), f"More than {self.limits.max_members} members"
+            )
+
+    def copy(self, src: BinaryIO, dest: Path) -> None:
+        written = 0
+        with dest.open("wb") as f:
+            while chunk := src.read(_COPY_SIZE):
+                written += len(chunk)
+                self.total_bytes += len(chunk)
+                if written > self.limits.max_file_bytes:
+                    raise AttachmentExtractionError(
+                        str(self.archive), f"{dest.name} exceeds {self.limits.max_file_bytes} bytes"
+                    )
+                if self.total_bytes > self.limits.max_total_bytes:
+                    raise AttachmentExtractionError(
+                        str(self.archive),
+                        f"Contents exceed {self.limits.max_total_bytes} bytes",
+                    )
+                f.write(chunk)
+
+
+def _safe_target(archive: Path, dest: Path, name: str) -> Path | None:
+    """Resolve a member name inside ``dest``, or None if it would escape it."""
+    parts = PurePosixPath(name.replace("\\", "/")).parts
+    if not parts or parts[0] == "/" or ":" in parts[0] or ".." in parts:
+        logger.warning("Skipping unsafe member %r in %s", name, archive)
+        return None
+    target = dest.joinpath(*parts)
+    if not target.resolve().is_relative_to(dest.resolve()):
+        logger.warning("Skipping member %r in %s that escapes the destination", name, archive)
+        return None
+    return target
+
+
+def _extract_zip(archive: Path, dest: Path, budget: _Budget) -> list[Path]:
+    written = []
+    with zipfile.ZipFile(archive) as zf:
+        for info in zf.infolist():
+            budget.add_member()
+            # Symlinks are stored with the link target as contents; never recreate them
+            if info.is_dir() or (info.external_attr >> 16) & 0o170000 == 0o120000:
+                continue
+            target = _safe_target(archive, dest, info.filename)
+            if target:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with zf.open(info) as src:
+                    budget.copy(src, target)
+                written.append(target)
+    return written
+
+
+def _extract_tar(archive: Path, dest: Path, budget: _Budget) -> list[Path]:
+    written = []
+    with tarfile.open(archive, "r:*") as tf:
+        for member in tf:
+            budget.add_member()
+            # Links and device files are skipped, only regular files are written
+            if not member.isfile():
+                continue
+            target = _safe_target(archive, dest, member.name)
+            if target:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                src = tf.extractfile(member)
+                if src:
+                    with src:
+                        budget.copy(src, target)
+                    written.append(target)
+    return written
+
+
+def _extract_7z(archive: Path, dest: Path, budget: _Budget) -> list[Path]:
+    try:
+        import py7zr
+    except ImportError:
+        raise AttachmentExtractionError(
+            str(archive), "7z archives require py7zr (pip install ctfbridge[archive])"
+        )
+
+    with py7zr.SevenZipFile(archive) as zf:
+        targets = []
+        for info in zf.list():
+            budget.add_member()
+            if info.is_directory or info.is_symlink:
+                continue
+            size = info.uncompressed or 0
+            budget.total_bytes += size
+            if size > budget.limits.max_file_bytes:
+                raise AttachmentExtractionError(
+                    str(archive), f"{info.filename} exceeds {budget.limits.max_file_bytes} bytes"
+                )
+            if budget.total_bytes > budget.limits.max_total_bytes:
+                raise AttachmentExtractionError(
+                    str(archive), f"Contents exceed {budget.limits.max_total_bytes} bytes"
+                )
+            if _safe_target(archive, dest, info.filename):
+                targets.append(info.filename)
+        zf.extract(path=dest, targets=targets)
+    return [dest / name for name in targets if (dest / name).is_file()]
+
+
+def _extract_stream(archive: Path, dest: Path, budget: _Budget, file_type: str) -> list[Path]:
+    opener, suffixes = _STREAMS[file_type]
+    with opener(archive, "rb") as stream:
+        head = stream.read(SNIFF_BYTES)
+    if detect_file_type(head) == "application/x-tar":
+        return _extract_tar(archive, dest, budget)
+
+    name = archive.name
+    suffix = next((s for s in suffixes if name.lower().endswith(s)), None)
+    name = name[: -len(suffix)] if suffix and len(name) > len(suffix) else f"{name}.out"
+
+    budget.add_member()
+    target = dest / name
+    with opener(archive, "rb") as stream:
+        budget.copy(stream, target)
+    return [target]
+
+
+def extract_archive(
+    archive: Path,
+    dest: Path,
+    file_type: str | None = None,
+    limits: ExtractionLimits = ExtractionLimits(),
+    md5: bool = False,
+) -> list[ExtractedFile]:
+    """
+    Extract an archive into ``dest`` and digest the extracted files.
+
+    Only regular files are written. Members with absolute paths, ``..`` components or
+    that resolve outside ``dest`` are skipped, and links are never created. Exceeding
+    ``limits`` aborts the extraction and removes ``dest``.
+
+    Args:
+        archive: The archive file.
+        dest: Directory to extract into; created if needed.
+        file_type: MIME type of the archive, detected from its contents if None.
+        limits: Size and member count limits.
+        md5: Also compute MD5 digests of the extracted files.
+
+    Raises:
+        AttachmentExtractionError: If the archive is unsupported, encrypted, corrupt or
+            exceeds the limits.
+    """
+    if file_type is None:
+        with archive.open("rb") as f:
+            file_type = detect_file_type(f.read(SNIFF_BYTES))
+    if not is_archive(file_type):
+        raise AttachmentExtractionError(str(archive), f"Not a supported archive ({file_type})")
+
+    created = not dest.exists()
+    dest.mkdir(parents=True, exist_ok=True)
+    budget = _Budget(archive, limits)
+    try:
+        if file_type == "application/zip":
+            paths = _extract_zip(archive, dest, budget)
+        elif file_type == "application/x-tar":
+            paths = _extract_tar(archive, dest, budget)
+        elif file_type == "application/x-7z-compressed":
+            paths = _extract_7z(archive, dest, budget)
+        else:
+            paths = _extract_stream(archive, dest, budget, file_type)
+    except AttachmentExtractionError:
+        if created:
+            shutil.rmtree(dest, ignore_errors=True)
+        raise
+    except (OSError, EOFError, zipfile.BadZipFile, tarfile.TarError, lzma.LZMAError) as e:
+        if created:
+            shutil.rmtree(dest, ignore_errors=True)
+        raise AttachmentExtractionError(str(archive), f"Corrupt archive: {e}") from e
+    except Exception as e:
+        # Encrypted members, unsupported compression methods and the like
+        if created:
+            shutil.rmtree(dest, ignore_errors=True)
+        raise AttachmentExtractionError(str(archive), str(e) or type(e).__name__) from e
+
+    return [
+        ExtractedFile(
+            name=path.relative_to(dest).as_posix(), path=path, digest=digest_file(path, md5)
+        )
+        for path in paths
+    ]
+
+
+def _extract_in_place(
+    archive: Path, file_type: str | None, limits: ExtractionLimits, md5: bool
+) -> list[ExtractedFile]:
+    return extract_archive(archive, extraction_dir(archive), file_type, limits, md5)
+
+
+class ArchiveExtractor:
+    """
+    Extracts downloaded archives in a worker pool.
+
+    Extraction is CPU and disk bound, so it runs in a thread pool by default, or a
+    process pool with ``processes=True``, and never on the event loop.
+
+    Example:
+        async with ArchiveExtractor(max_workers=4) as extractor:
+            challenge = await client.attachments.download_all(challenge, "out", extract=extractor)
+    """
+
+    def __init__(
+        self,
+        limits: ExtractionLimits = ExtractionLimits(),
+        max_workers: int | None = None,
+        processes: bool = False,
+    ):
+        """
+        Args:
+            limits: Size and member count limits applied to every archive.
+            max_workers: Maximum number of archives extracted at once.
+            processes: Extract in worker processes instead of threads.
+        """
+        self.limits = limits
+        self.max_workers = max_workers
+        self.processes = processes
+        self._executor: Executor | None = None
+
+    async def extract(
+        self, archive: Path, file_type: str | None = None, md5: bool = False
+    ) -> list[ExtractedFile]:
+        """Extract an archive next to itself, into the directory given by `extraction_dir`."""
+        if self._executor is None:
+            pool = ProcessPoolExecutor if self.processes else ThreadPoolExecutor
+            self._executor = pool(max_workers=self.max_workers)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, _extract_in_place, archive, file_type, self.limits, md5
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "ArchiveExtractor":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,93 @@
+import json
+import logging
+import os
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".ctfbridge-manifest.json"
+
+
+class ManifestEntry(BaseModel):
+    """Validators and checksum recorded for one downloaded file."""
+
+    url: str = Field(..., description="The URL the file was downloaded from.")
+    etag: str | None = Field(None, description="The ETag header returned by the server.")
+    last_modified: str | None = Field(
+        None, description="The Last-Modified header returned by the server."
+    )
+    size_bytes: int = Field(..., description="Size of the downloaded file in bytes.")
+    sha256: str | None = Field(None, description="SHA-256 hex digest of the file.")
+
+
+class AttachmentManifest:
+    """
+    Per-directory record of downloaded attachments, used to skip unchanged files on re-sync.
+
+    The manifest is stored as ``.ctfbridge-manifest.json`` inside the save directory and
+    maps file names to their `ManifestEntry`.
+    """
+
+    def __init__(self, save_dir: Path, entries: dict[str, ManifestEntry] | None = None):
+        self.path = save_dir / MANIFEST_NAME
+        self.entries = entries or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, save_dir: Path) -> "AttachmentManifest":
+        """
+        Load the manifest for a save directory.
+
+        Returns:
+            The loaded manifest, or an empty one if the file is missing or invalid.
+        """
+        path = save_dir / MANIFEST_NAME
+        try:
+            with open(path, encoding="utf-8") as f:
+                raw = json.load(f)
+            entries = {name: ManifestEntry.model_validate(e) for name, e in raw.items()}
+        except FileNotFoundError:
+            return cls(save_dir)
+        except (OSError, json.JSONDecodeError, ValidationError, AttributeError) as e:
+            logger.warning("Ignoring invalid attachment manifest %s: %s", path, e)
+            return cls(save_dir)
+        return cls(save_dir, entries)
+
+    def get(self, filename: str) -> ManifestEntry | None:
+        return self.entries.get(filename)
+
+    def fresh_entry(self, filename: str, url: str) -> ManifestEntry | None:
+        """
+        Return the entry for a file if it can be revalidated instead of downloaded.
+
+        The entry must belong to the same URL, carry a validator, and the local file must
+        still exist with the recorded size.
+        """
+        entry = self.entries.get(filename)
+        if not entry or entry.url != url or not (entry.etag or entry.last_modified):
+            return None
+        try:
+            if (self.path.parent / filename).stat().st_size != entry.size_bytes:
+                return None
+        except OSError:
+            return None
+        return entry
+
+    def update(self, filename: str, entry: ManifestEntry) -> None:
+        """Record an entry in memory; `save` writes it to disk."""
+        self.entries[filename] = entry
+        self.dirty = True
+
+    def save(self) -> None:
+        """Atomically write the manifest to disk."""
+        self.dirty = False
+        data = {name: e.model_dump() for name, e in self.entries.items()}
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.error("Failed to save attachment manifest to %s: %s", self.path, e)
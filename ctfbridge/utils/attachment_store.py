@@ -0,0 +1,184 @@
+import hashlib
+import logging
+import os
+import re
+import shutil
+from pathlib import Path
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Linux FICLONE ioctl request number (copy-on-write clone of a whole file)
+_FICLONE = 0x40049409
+
+# CTFd serves uploads from /files/<token>/<filename>. The token is unique per upload, so a
+# URL with the same token always refers to the same bytes.
+_CTFD_FILE_PATH = re.compile(r"/files/(?P<token>[0-9a-fA-F]{32})/(?P<name>[^/]+)$")
+
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+
+
+def content_key(url: str) -> str | None:
+    """
+    Derive a stable content key from an attachment URL, if the URL identifies immutable content.
+
+    Args:
+        url: The attachment download URL.
+
+    Tokens are only unique within one CTFd instance, so the key includes the host.
+
+    Returns:
+        A key such as ``ctfd:<host>/<token>/<name>``, or None if the URL carries no content
+        identity.
+    """
+    parsed = urlparse(url)
+    match = _CTFD_FILE_PATH.search(parsed.path)
+    if not match or not parsed.hostname:
+        return None
+    host = parsed.hostname.lower()
+    if parsed.port:
+        host = f"{host}:{parsed.port}"
+    return f"ctfd:{host}/{match['token'].lower()}/{match['name']}"
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    import fcntl
+
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            dst.unlink(missing_ok=True)
+            raise
+
+
+class AttachmentStore:
+    """
+    Content-addressed blob store shared by attachment downloads.
+
+    Blobs are stored once under ``<root>/blobs/<sha256[:2]>/<sha256>`` and linked into each
+    destination directory. URL-derived content keys (see `content_key`) are recorded under
+    ``<root>/keys`` so a known file can be placed without touching the network.
+
+    Note:
+        Hardlinked files share their inode with the store. Modifying a placed file in-place
+        modifies the stored blob too; use ``link_mode="copy"`` or ``"reflink"`` if the
+        downloaded files are edited afterwards.
+    """
+
+    def __init__(self, root: str | Path, link_mode: str = "auto"):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding the store. Created if missing.
+            link_mode: How blobs are placed into destinations: ``auto`` (reflink, then
+                hardlink, then copy), ``reflink``, ``hardlink`` or ``copy``.
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {link_mode}")
+        self.root = Path(root).expanduser()
+        self.link_mode = link_mode
+        self._blobs = self.root / "blobs"
+        self._keys = self.root / "keys"
+        self._blobs.mkdir(parents=True, exist_ok=True)
+        self._keys.mkdir(parents=True, exist_ok=True)
+
+    def blob_path(self, digest: str) -> Path:
+        """Return the path a blob with the given SHA-256 digest is stored at."""
+        return self._blobs / digest[:2] / digest
+
+    def _key_path(self, key: str) -> Path:
+        return self._keys / hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, digest: str) -> Path | None:
+        """Return the blob path for a digest if the blob is present."""
+        path = self.blob_path(digest)
+        return path if path.is_file() else None
+
+    def lookup(self, key: str) -> str | None:
+        """
+        Resolve a content key to the digest of a stored blob.
+
+        Returns:
+            The SHA-256 digest, or None if the key is unknown or its blob is gone.
+        """
+        try:
+            digest = self._key_path(key).read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        return digest if self.get(digest) else None
+
+    def remember(self, key: str, digest: str) -> None:
+        """Record that a content key refers to the blob with the given digest."""
+        path = self._key_path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(digest, encoding="utf-8")
+        os.replace(tmp, path)
+
+    def ingest(self, path: Path, digest: str, key: str | None = None) -> Path:
+        """
+        Move a downloaded file into the store.
+
+        If a blob with the same digest already exists, the file is discarded instead.
+
+        Args:
+            path: The file to ingest. It no longer exists afterwards.
+            digest: SHA-256 hex digest of the file, computed while downloading.
+            key: Optional content key to record for the blob.
+
+        Returns:
+            The path of the stored blob.
+        """
+        blob = self.blob_path(digest)
+        if blob.is_file():
+            logger.debug("Blob %s already stored, discarding %s", digest, path)
+            path.unlink(missing_ok=True)
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(path, blob)
+            except OSError:
+                # Different filesystem: copy next to the blob, then rename atomically
+                tmp = blob.with_name(f"{blob.name}.{os.getpid()}.tmp")
+                shutil.copyfile(path, tmp)
+                os.replace(tmp, blob)
+                path.unlink(missing_ok=True)
+            logger.debug("Stored blob %s", digest)
+
+        if key:
+            self.remember(key, digest)
+        return blob
+
+    def place(self, digest: str, dest: Path) -> None:
+        """
+        Materialize a stored blob at the destination path, replacing any existing file.
+
+        Raises:
+            FileNotFoundError: If no blob with the given digest is stored.
+        """
+        blob = self.get(digest)
+        if blob is None:
+            raise FileNotFoundError(f"Blob {digest} is not in the store")
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists() or dest.is_symlink():
+            logger.warning("File already exists and will be overwritten: %s", dest)
+            dest.unlink()
+
+        modes = ("reflink", "hardlink", "copy") if self.link_mode == "auto" else (self.link_mode,)
+        for mode in modes:
+            try:
+                if mode == "reflink":
+                    _reflink(blob, dest)
+                elif mode == "hardlink":
+                    os.link(blob, dest)
+                else:
+                    shutil.copyfile(blob, dest)
+                logger.debug("Placed blob %s at %s (%s)", digest, dest, mode)
+                return
+            except (OSError, ImportError) as e:
+                logger.debug("Could not %s blob %s to %s: %s", mode, digest, dest, e)
+
+        raise OSError(f"Could not place blob {digest} at {dest}")
@@ -0,0 +1,61 @@
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from ctfbridge.utils.filetype import SNIFF_BYTES, detect_file_type
+
+_READ_SIZE = 1048576
+
+
+@dataclass
+class FileDigest:
+    """Checksums and type of a file, computed in a single pass over its bytes."""
+
+    size_bytes: int
+    sha256: str
+    md5: str | None = None
+    file_type: str | None = None
+
+
+class StreamDigest:
+    """Incrementally hashes, counts and sniffs a byte stream as it is written."""
+
+    def __init__(self, md5: bool = False):
+        self._sha256 = hashlib.sha256()
+        self._md5 = hashlib.md5(usedforsecurity=False) if md5 else None
+        self._head = bytearray()
+        self.size_bytes = 0
+
+    def update(self, chunk: bytes) -> None:
+        self._sha256.update(chunk)
+        if self._md5:
+            self._md5.update(chunk)
+        if len(self._head) < SNIFF_BYTES:
+            self._head += chunk[: SNIFF_BYTES - len(self._head)]
+        self.size_bytes += len(chunk)
+
+    def finish(self) -> FileDigest:
+        return FileDigest(
+            size_bytes=self.size_bytes,
+            sha256=self._sha256.hexdigest(),
+            md5=self._md5.hexdigest() if self._md5 else None,
+            file_type=detect_file_type(bytes(self._head)),
+        )
+
+
+def digest_file(path: Path, md5: bool = False) -> FileDigest:
+    """Compute the `FileDigest` of a file on disk."""
+    digest = StreamDigest(md5=md5)
+    with path.open("rb") as f:
+        while chunk := f.read(_READ_SIZE):
+            digest.update(chunk)
+    return digest.finish()
+
+
+def describe_file(path: Path, sha256: str) -> FileDigest:
+    """Build a `FileDigest` for a file whose SHA-256 is already known, without hashing it."""
+    with path.open("rb") as f:
+        head = f.read(SNIFF_BYTES)
+    return FileDigest(
+        size_bytes=path.stat().st_size, sha256=sha256, file_type=detect_file_type(head)
+    )
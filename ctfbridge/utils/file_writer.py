@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_SIZE = 4 * 1048576
+
+
+def _allocate(f, size: int) -> None:
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass
+    f.truncate(size)
+
+
+def preallocate(path: Path, size: int) -> None:
+    """Create or resize a file to ``size`` bytes, reserving disk blocks where supported."""
+    with open(path, "ab") as f:
+        _allocate(f, size)
+
+
+class AsyncFileWriter:
+    """
+    Writes a file from a dedicated thread so disk I/O never blocks the event loop.
+
+    Writes are coalesced into blocks of ``block_size`` bytes and handed to the writer
+    thread through a bounded queue of at most ``max_pending`` blocks; `write` only waits
+    when that queue is full, which applies backpressure to the download instead of
+    buffering unboundedly in memory.
+
+    Use as an async context manager. Leaving the block normally flushes the remaining data;
+    leaving it with an exception discards it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        offset: int | None = None,
+        size: int = 0,
+        fsync: bool = False,
+        threaded: bool = True,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_pending: int = 4,
+    ):
+        """
+        Args:
+            path: File to write.
+            offset: Write into an existing file starting at this offset. If None, the file
+                is created or truncated and written from the start.
+            size: Expected final size of a newly created file, used to preallocate it.
+            fsync: Flush the file to stable storage before closing.
+            threaded: Write from a dedicated thread. If False, writes happen inline on the
+                event loop, which is only useful for comparison.
+            block_size: Minimum size of each write handed to the thread.
+            max_pending: Maximum number of blocks queued for the thread.
+        """
+        self.path = path
+        self.offset = offset
+        self.size = size
+        self.fsync = fsync
+        self.threaded = threaded
+        self.block_size = block_size
+        self._buffer = bytearray()
+        self._slots = asyncio.Semaphore(max_pending)
+        self._pending: set[asyncio.Future] = set()
+        self._error: BaseException | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._file = None
+        self.written = 0
+
+    async def __aenter__(self) -> "AsyncFileWriter":
+        if self.threaded:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ctfbridge-io")
+        try:
+            await self._run(self._open_sync)
+        except BaseException:
+            if self._executor:
+                self._executor.shutdown(wait=False)
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self.flush()
+            await self._drain()
+            await self._run(self._close_sync, exc_type is None)
+        finally:
+            if self._executor:
+                self._executor.shutdown(wait=False)
+        if exc_type is None and self._error:
+            raise self._error
+
+    async def write(self, data: bytes) -> None:
+        """Queue data to be written after the previously written data."""
+        self._raise_error()
+        self._buffer += data
+        self.written += len(data)
+        if len(self._buffer) >= self.block_size:
+            await self._submit()
+
+    async def flush(self) -> None:
+        """Hand any buffered data to the writer thread."""
+        if self._buffer:
+            await self._submit()
+
+    async def _submit(self) -> None:
+        block, self._buffer = bytes(self._buffer), bytearray()
+        if not self.threaded:
+            self._file.write(block)
+            return
+
+        await self._slots.acquire()
+        future = asyncio.wrap_future(self._executor.submit(self._file.write, block))
+        self._pending.add(future)
+        future.add_done_callback(self._on_written)
+
+    def _on_written(self, future: asyncio.Future) -> None:
+        self._pending.discard(future)
+        self._slots.release()
+        if not future.cancelled() and future.exception() and self._error is None:
+            self._error = future.exception()
+
+    async def _drain(self) -> None:
+        if self._pending:
+            await asyncio.wait(set(self._pending))
+
+    def _raise_error(self) -> None:
+        if self._error:
+            raise self._error
+
+    async def _run(self, func, *args):
+        if not self.threaded:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _open_sync(self) -> None:
+        if self.offset is None:
+            self._file = open(self.path, "wb")
+            if self.size:
+                _allocate(self._file, self.size)
+        else:
+            self._file = open(self.path, "r+b")
+            self._file.seek(self.offset)
+
+    def _close_sync(self, complete: bool) -> None:
+        try:
+            if complete:
+                self._file.flush()
+                if self.offset is None and self.size and self.written != self.size:
+                    # The server sent a different amount than announced; drop the slack
+                    self._file.truncate(self.written)
+                if self.fsync:
+                    os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
@@ -0,0 +1,54 @@
+# Number of leading bytes needed to recognize every signature below
+SNIFF_BYTES = 512
+
+# (offset, magic bytes, MIME type), most specific first
+_SIGNATURES: list[tuple[int, bytes, str]] = [
+    (0, b"\x7fELF", "application/x-elf"),
+    (0, b"MZ", "application/vnd.microsoft.portable-executable"),
+    (0, b"\xcf\xfa\xed\xfe", "application/x-mach-binary"),
+    (0, b"\xca\xfe\xba\xbe", "application/x-mach-binary"),
+    (0, b"PK\x03\x04", "application/zip"),
+    (0, b"PK\x05\x06", "application/zip"),
+    (0, b"\x1f\x8b", "application/gzip"),
+    (0, b"\xfd7zXZ\x00", "application/x-xz"),
+    (0, b"BZh", "application/x-bzip2"),
+    (0, b"7z\xbc\xaf\x27\x1c", "application/x-7z-compressed"),
+    (0, b"Rar!\x1a\x07", "application/vnd.rar"),
+    (0, b"\x28\xb5\x2f\xfd", "application/zstd"),
+    (257, b"ustar", "application/x-tar"),
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF8", "image/gif"),
+    (0, b"\xd4\xc3\xb2\xa1", "application/vnd.tcpdump.pcap"),
+    (0, b"\xa1\xb2\xc3\xd4", "application/vnd.tcpdump.pcap"),
+    (0, b"\x0a\x0d\x0d\x0a", "application/x-pcapng"),
+    (0, b"SQLite format 3\x00", "application/vnd.sqlite3"),
+    (0, b"#!", "text/x-script"),
+]
+
+
+def detect_file_type(head: bytes) -> str | None:
+    """
+    Detect a file's type from its leading bytes.
+
+    Args:
+        head: The first `SNIFF_BYTES` bytes of the file (fewer if the file is shorter).
+
+    Returns:
+        A MIME type such as ``application/x-elf``, ``text/plain`` for UTF-8 text, or None
+        if the type is unknown.
+    """
+    for offset, magic, mime in _SIGNATURES:
+        if head[offset : offset + len(magic)] == magic:
+            return mime
+
+    if not head:
+        return None
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the end of the sample is still text
+        if e.start < len(head) - 3:
+            return None
+    return "text/plain" if b"\x00" not in head else None
@@ -1,19 +1,492 @@
 import json
 import logging
-import tempfile
+import os
+import sqlite3
+import threading
 import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
-CACHE_PATH = Path(tempfile.gettempdir()) / ".ctfbridge_platform_cache.json"
-CACHE_TTL_SECONDS = 86400
-
 CacheEntry = tuple[str, str, float]
 CacheMap = dict[str, CacheEntry]
 
 
+def _default_cache_path() -> Path:
+    configured = os.environ.get("CTFBRIDGE_PLATFORM_CACHE")
+    if configured:
+        return Path(configured).expanduser()
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ctfbridge" / "platform_cache.json"
+
+
+CACHE_PATH = _default_cache_path()
+CACHE_BACKEND = os.environ.get("CTFBRIDGE_PLATFORM_CACHE_BACKEND", "json")
+CACHE_TTL_SECONDS = 86400
+
+# How long an unreachable candidate URL is remembered, by failure reason
+FAILURE_TTL_SECONDS: dict[str, float] = {
+    "dns": 3600,
+    "tls": 3600,
+    "timeout": 300,
+    "connect": 300,
+    "error": 300,
+}
+
+# Compact the append-only log once it holds this many times more records than entries
+_LOG_COMPACT_FACTOR = 4
+_LOG_COMPACT_MIN_RECORDS = 256
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path``'s lock file, shared by all processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "a+b") as lock_file:
+        try:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        except ImportError:
+            import msvcrt
+
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        yield
+        # Closing the file releases the lock
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    """
+    Replace ``path`` with ``text`` so readers see either the old or the new file.
+
+    The data is not fsynced: the cache can be rebuilt, so losing recent writes on a crash
+    is cheaper than a disk flush on every detection.
+    """
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _file_stamp(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class CacheBackend(ABC):
+    """Storage for cache entries keyed by URL. The last element of each entry is its timestamp."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def load(self) -> dict[str, tuple]:
+        """Return all entries, including expired ones."""
+
+    @abstractmethod
+    def get(self, key: str) -> tuple | None:
+        """Return the entry for ``key``, if any."""
+
+    @abstractmethod
+    def update(self, entries: dict[str, tuple | None], ttl_seconds: float | None = None) -> None:
+        """
+        Store several entries in one write, removing those mapped to None.
+
+        Entries older than ``ttl_seconds`` are swept if it is given.
+        """
+
+    def set(self, key: str, entry: tuple, ttl_seconds: float | None = None) -> None:
+        """Store an entry, sweeping entries older than ``ttl_seconds`` if given."""
+        self.update({key: entry}, ttl_seconds)
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry for ``key``, if any."""
+
+    @abstractmethod
+    def replace(self, entries: dict[str, tuple]) -> None:
+        """Replace all entries."""
+
+    @abstractmethod
+    def sweep(self, ttl_seconds: float) -> int:
+        """Remove entries older than ``ttl_seconds``, returning how many were removed."""
+
+    def clear(self) -> bool:
+        """Delete the cache, returning whether it existed."""
+        with self._lock, _file_lock(self.path):
+            existed = self.path.exists()
+            self.path.unlink(missing_ok=True)
+            self._forget()
+            return existed
+
+    def _forget(self) -> None:
+        pass
+
+
+class JSONCacheBackend(CacheBackend):
+    """One JSON document, reread only when it changed and rewritten atomically."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._memo: dict[str, tuple] = {}
+        self._stamp: tuple[int, int, int] | None = None
+
+    def _refresh(self) -> dict[str, tuple]:
+        stamp = _file_stamp(self.path)
+        if stamp is None:
+            if self._stamp is not None:
+                self._memo, self._stamp = {}, None
+            logger.debug("Platform cache file not found at %s.", self.path)
+            return self._memo
+        if stamp == self._stamp:
+            return self._memo
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                raw = json.load(f)
+            self._memo = {k: tuple(v) for k, v in raw.items()}
+        except (json.JSONDecodeError, TypeError, ValueError, AttributeError) as e:
+            logger.warning(
+                "Failed to load or parse platform cache from %s: %s. Returning empty cache.",
+                self.path,
+                e,
+            )
+            self._memo = {}
+        self._stamp = stamp
+        return self._memo
+
+    def _write(self, entries: dict[str, tuple]) -> None:
+        _atomic_write(self.path, json.dumps({k: list(v) for k, v in entries.items()}, indent=2))
+        self._memo, self._stamp = entries, _file_stamp(self.path)
+
+    def load(self) -> dict[str, tuple]:
+        with self._lock:
+            return dict(self._refresh())
+
+    def get(self, key: str) -> tuple | None:
+        with self._lock:
+            return self._refresh().get(key)
+
+    def update(self, entries: dict[str, tuple | None], ttl_seconds: float | None = None) -> None:
+        with self._lock, _file_lock(self.path):
+            previous = self._refresh()
+            current = dict(previous)
+            for key, entry in entries.items():
+                if entry is None:
+                    current.pop(key, None)
+                else:
+                    current[key] = entry
+            if ttl_seconds is not None:
+                cutoff = time.time() - ttl_seconds
+                current = {k: v for k, v in current.items() if v[-1] >= cutoff}
+            if current != previous:
+                self._write(current)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key not in self._refresh():
+                return
+        self.update({key: None})
+
+    def replace(self, entries: dict[str, tuple]) -> None:
+        with self._lock, _file_lock(self.path):
+            self._write(dict(entries))
+
+    def sweep(self, ttl_seconds: float) -> int:
+        with self._lock, _file_lock(self.path):
+            entries = self._refresh()
+            cutoff = time.time() - ttl_seconds
+            live = {k: v for k, v in entries.items() if v[-1] >= cutoff}
+            removed = len(entries) - len(live)
+            if removed:
+                self._write(live)
+            return removed
+
+    def _forget(self) -> None:
+        self._memo, self._stamp = {}, None
+
+
+class LogCacheBackend(CacheBackend):
+    """
+    An append-only JSON-lines log of ``{"key": ..., "entry": [...]}`` records.
+
+    Writes append a single line, and readers only parse the lines added since they last
+    looked. Deletions are recorded with a null entry. The log is rewritten without
+    superseded records once it grows well beyond the number of live entries.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._memo: dict[str, tuple] = {}
+        self._inode: int | None = None
+        self._offset = 0
+        self._records = 0
+
+    def _refresh(self) -> dict[str, tuple]:
+        stamp = _file_stamp(self.path)
+        if stamp is None:
+            self._forget()
+            return self._memo
+        inode, _, size = stamp
+        if inode != self._inode or size < self._offset:
+            # The log was compacted or replaced; read it from the start
+            self._forget()
+            self._inode = inode
+        if size == self._offset:
+            return self._memo
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        # Only consume complete lines; a concurrent append may still be in progress
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            self._records += 1
+            try:
+                record = json.loads(line)
+                key, entry = record["key"], record["entry"]
+            except (json.JSONDecodeError, TypeError, KeyError, UnicodeDecodeError):
+                logger.debug("Skipping corrupt platform cache record in %s", self.path)
+                continue
+            if entry is None:
+                self._memo.pop(key, None)
+            else:
+                self._memo[key] = tuple(entry)
+        self._offset += end
+        return self._memo
+
+    def _append(self, records: list[tuple[str, tuple | None]]) -> None:
+        lines = "".join(
+            json.dumps({"key": key, "entry": list(entry) if entry else None}) + "\n"
+            for key, entry in records
+        )
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def _compact(self, entries: dict[str, tuple]) -> None:
+        lines = "".join(
+            json.dumps({"key": key, "entry": list(entry)}) + "\n" for key, entry in entries.items()
+        )
+        _atomic_write(self.path, lines)
+        self._forget()
+        self._refresh()
+
+    def _maybe_compact(self) -> None:
+        if self._records > max(_LOG_COMPACT_MIN_RECORDS, _LOG_COMPACT_FACTOR * len(self._memo)):
+            self._compact(dict(self._memo))
+
+    def load(self) -> dict[str, tuple]:
+        with self._lock:
+            return dict(self._refresh())
+
+    def get(self, key: str) -> tuple | None:
+        with self._lock:
+            return self._refresh().get(key)
+
+    def update(self, entries: dict[str, tuple | None], ttl_seconds: float | None = None) -> None:
+        with self._lock, _file_lock(self.path):
+            known = self._refresh()
+            # Deleting a missing key is a no-op
+            records = [(k, v) for k, v in entries.items() if v is not None or k in known]
+            if not records:
+                return
+            self._append(records)
+            self._refresh()
+            self._maybe_compact()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key not in self._refresh():
+                return
+        self.update({key: None})
+
+    def replace(self, entries: dict[str, tuple]) -> None:
+        with self._lock, _file_lock(self.path):
+            self._compact(dict(entries))
+
+    def sweep(self, ttl_seconds: float) -> int:
+        with self._lock, _file_lock(self.path):
+            entries = self._refresh()
+            cutoff = time.time() - ttl_seconds
+            live = {k: v for k, v in entries.items() if v[-1] >= cutoff}
+            removed = len(entries) - len(live)
+            if removed:
+                self._compact(live)
+            return removed
+
+    def _forget(self) -> None:
+        self._memo, self._inode, self._offset, self._records = {}, None, 0, 0
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """A SQLite table indexed by key, with the in-process copy invalidated on foreign writes."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._conn: sqlite3.Connection | None = None
+        self._memo: dict[str, tuple | None] = {}
+        self._data_version: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries"
+                " (key TEXT PRIMARY KEY, entry TEXT NOT NULL, timestamp REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_timestamp ON entries (timestamp)")
+            conn.commit()
+            self._conn = conn
+        # data_version changes whenever another connection commits
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._memo, self._data_version = {}, version
+        return self._conn
+
+    def load(self) -> dict[str, tuple]:
+        with self._lock:
+            rows = self._connect().execute("SELECT key, entry FROM entries").fetchall()
+            return {key: tuple(json.loads(entry)) for key, entry in rows}
+
+    def get(self, key: str) -> tuple | None:
+        with self._lock:
+            conn = self._connect()
+            if key not in self._memo:
+                row = conn.execute("SELECT entry FROM entries WHERE key = ?", (key,)).fetchone()
+                self._memo[key] = tuple(json.loads(row[0])) if row else None
+            return self._memo[key]
+
+    def update(self, entries: dict[str, tuple | None], ttl_seconds: float | None = None) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, entry, timestamp) VALUES (?, ?, ?)",
+                    [(k, json.dumps(list(v)), v[-1]) for k, v in entries.items() if v is not None],
+                )
+                conn.executemany(
+                    "DELETE FROM entries WHERE key = ?",
+                    [(k,) for k, v in entries.items() if v is None],
+                )
+                if ttl_seconds is not None:
+                    conn.execute(
+                        "DELETE FROM entries WHERE timestamp < ?", (time.time() - ttl_seconds,)
+                    )
+            self._memo.update({k: tuple(v) if v else None for k, v in entries.items()})
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            if key in self._memo and self._memo[key] is None:
+                return
+            with conn:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._memo[key] = None
+
+    def replace(self, entries: dict[str, tuple]) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM entries")
+                conn.executemany(
+                    "INSERT INTO entries (key, entry, timestamp) VALUES (?, ?, ?)",
+                    [(k, json.dumps(list(v)), v[-1]) for k, v in entries.items()],
+                )
+            self._memo = {}
+
+    def sweep(self, ttl_seconds: float) -> int:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM entries WHERE timestamp < ?", (time.time() - ttl_seconds,)
+                )
+            self._memo = {}
+            return cursor.rowcount
+
+    def clear(self) -> bool:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            existed = self.path.exists()
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+            self._memo, self._data_version = {}, None
+            return existed
+
+
+BACKENDS: dict[str, type[CacheBackend]] = {
+    "json": JSONCacheBackend,
+    "log": LogCacheBackend,
+    "sqlite": SQLiteCacheBackend,
+}
+
+_backends: dict[tuple[str, Path], CacheBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_cache_backend(path: Path | None = None) -> CacheBackend:
+    """Return the shared backend instance for ``path`` (default `CACHE_PATH`)."""
+    path = Path(path or CACHE_PATH)
+    key = (CACHE_BACKEND, path)
+    with _backends_lock:
+        backend = _backends.get(key)
+        if backend is None:
+            if CACHE_BACKEND not in BACKENDS:
+                raise ValueError(f"Unknown platform cache backend: {CACHE_BACKEND}")
+            backend = _backends[key] = BACKENDS[CACHE_BACKEND](path)
+        return backend
+
+
+def configure_platform_cache(
+    path: str | Path | None = None,
+    backend: str | None = None,
+    ttl_seconds: float | None = None,
+) -> None:
+    """
+    Change where and how platform detection results are cached.
+
+    The cache is shared by every process on the machine, and all backends are safe to
+    use concurrently:
+
+    - ``json`` (default): one JSON document, rewritten atomically under a file lock.
+    - ``log``: an append-only JSON-lines log, compacted once it grows well beyond the
+      number of live entries.
+    - ``sqlite``: a SQLite database in WAL mode.
+
+    The defaults can also be set with the ``CTFBRIDGE_PLATFORM_CACHE`` (path) and
+    ``CTFBRIDGE_PLATFORM_CACHE_BACKEND`` environment variables.
+
+    Args:
+        path: Cache file location, ``~/.cache/ctfbridge/platform_cache.json`` by default.
+        backend: One of ``json``, ``log`` or ``sqlite``.
+        ttl_seconds: How long detection results stay valid.
+    """
+    global CACHE_PATH, CACHE_BACKEND, CACHE_TTL_SECONDS
+    if backend is not None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown platform cache backend: {backend}")
+        CACHE_BACKEND = backend
+    if path is not None:
+        CACHE_PATH = Path(path).expanduser()
+    if ttl_seconds is not None:
+        CACHE_TTL_SECONDS = ttl_seconds
+
+
 def load_platform_cache() -> CacheMap:
     """
     Load the platform cache from disk.
@@ -22,42 +495,132 @@ def load_platform_cache() -> CacheMap:
         A dictionary mapping URLs to (platform, base_url, timestamp).
         Returns an empty dict if the file does not exist or is invalid.
     """
-    if not CACHE_PATH.exists():
-        logger.debug("Platform cache file not found at %s.", CACHE_PATH)
-        return {}
     try:
-        with open(CACHE_PATH, encoding="utf-8") as f:
-            raw = json.load(f)
-            return {k: tuple(v) for k, v in raw.items()}
-    except (json.JSONDecodeError, TypeError, ValueError) as e:
-        logger.warning(
-            "Failed to load or parse platform cache from %s: %s. Returning empty cache.",
-            CACHE_PATH,
-            e,
-        )
+        return get_cache_backend().load()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to load platform cache from %s: %s", CACHE_PATH, e)
         return {}
 
 
 def save_platform_cache(cache: CacheMap) -> None:
     """
-    Save the platform cache to disk.
+    Save the platform cache to disk, replacing its contents.
 
     Args:
         cache: The cache dictionary mapping URLs to (platform, base_url, timestamp).
     """
-    serializable_cache = {k: list(v) for k, v in cache.items()}
     try:
-        with open(CACHE_PATH, "w", encoding="utf-8") as f:
-            json.dump(serializable_cache, f, indent=2)
+        get_cache_backend().replace(cache)
         logger.debug("Platform cache saved successfully to %s.", CACHE_PATH)
-    except OSError as e:
+    except (OSError, sqlite3.Error) as e:
         logger.error("Failed to save platform cache to %s: %s", CACHE_PATH, e)
 
 
+def sweep_platform_cache(ttl_seconds: float | None = None) -> int:
+    """
+    Remove expired entries from the platform cache.
+
+    Args:
+        ttl_seconds: Maximum entry age, `CACHE_TTL_SECONDS` by default.
+
+    Returns:
+        The number of entries removed.
+    """
+    try:
+        return get_cache_backend().sweep(ttl_seconds or CACHE_TTL_SECONDS)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to sweep platform cache at %s: %s", CACHE_PATH, e)
+        return 0
+
+
+def clear_platform_cache() -> bool:
+    """Delete the platform cache and the failure cache, returning whether either existed."""
+    failures_existed = get_cache_backend(_failure_cache_path()).clear()
+    return get_cache_backend().clear() or failures_existed
+
+
+def _failure_cache_path() -> Path:
+    return CACHE_PATH.with_name(f"{CACHE_PATH.stem}.failures{CACHE_PATH.suffix}")
+
+
+def get_cached_failure(candidate: str) -> Optional[tuple[str, str]]:
+    """
+    Get the reason a candidate URL recently failed to respond, if it did.
+
+    Failures are kept next to the platform cache, with the same backend, for
+    `FAILURE_TTL_SECONDS` of their reason.
+
+    Args:
+        candidate: The candidate base URL.
+
+    Returns:
+        A tuple (reason, detail), where reason is one of the keys of
+        `FAILURE_TTL_SECONDS`, or None.
+    """
+    try:
+        entry = get_cache_backend(_failure_cache_path()).get(candidate)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to read failure cache: %s", e)
+        return None
+    if not entry:
+        return None
+
+    reason, detail, timestamp = entry
+    ttl = FAILURE_TTL_SECONDS.get(reason, FAILURE_TTL_SECONDS["error"])
+    if time.time() - timestamp > ttl:
+        return None
+    return reason, detail
+
+
+def set_cached_failure(candidate: str, reason: str, detail: str) -> None:
+    """
+    Remember that a candidate URL failed to respond.
+
+    Args:
+        candidate: The candidate base URL.
+        reason: Failure category, such as ``dns``, ``tls`` or ``timeout``.
+        detail: Human-readable error message.
+    """
+    try:
+        get_cache_backend(_failure_cache_path()).set(
+            candidate, (reason, detail, time.time()), max(FAILURE_TTL_SECONDS.values())
+        )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to save failure cache: %s", e)
+
+
+def update_cached_failures(failures: dict[str, tuple[str, str] | None]) -> None:
+    """
+    Record and forget the failures of several candidate URLs in one write.
+
+    Args:
+        failures: Maps candidate base URLs to a (reason, detail) tuple, or to None to
+            forget a recorded failure.
+    """
+    now = time.time()
+    entries = {
+        candidate: (*failure, now) if failure else None for candidate, failure in failures.items()
+    }
+    try:
+        get_cache_backend(_failure_cache_path()).update(entries, max(FAILURE_TTL_SECONDS.values()))
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to save failure cache: %s", e)
+
+
+def clear_cached_failure(candidate: str) -> None:
+    """Forget a recorded failure of a candidate URL."""
+    try:
+        get_cache_backend(_failure_cache_path()).delete(candidate)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to update failure cache: %s", e)
+
+
 def get_cached_platform(url: str) -> Optional[tuple[str, str]]:
     """
     Get a cached platform and base URL for the given input URL, if the cache entry is valid.
 
+    Expired entries are ignored here and removed by the next write or sweep.
+
     Args:
         url: The original user-provided platform URL.
 
@@ -65,8 +628,11 @@ def get_cached_platform(url: str) -> Optional[tuple[str, str]]:
         A tuple (platform, base_url) if a non-expired cache entry is found; None otherwise.
     """
     logger.debug("Checking platform cache for URL: %s.", url)
-    cache = load_platform_cache()
-    entry = cache.get(url)
+    try:
+        entry = get_cache_backend().get(url)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to read platform cache at %s: %s", CACHE_PATH, e)
+        return None
 
     if not entry:
         logger.debug("Cache miss for URL: %s.", url)
@@ -80,9 +646,6 @@ def get_cached_platform(url: str) -> Optional[tuple[str, str]]:
             timestamp,
             CACHE_TTL_SECONDS,
         )
-        # Removing expired cache entry
-        cache.pop(url)
-        save_platform_cache(cache)
         return None
 
     logger.debug("Cache hit for URL %s: Platform=%s, Base URL=%s.", url, platform, base_url)
@@ -93,12 +656,16 @@ def set_cached_platform(url: str, platform: str, base_url: str) -> None:
     """
     Store the platform and base URL in the cache with the current timestamp.
 
+    Expired entries are swept as part of the write.
+
     Args:
         url: The original user-provided URL (lookup key).
         platform: Detected platform name (e.g., 'ctfd').
         base_url: Cleaned and confirmed base URL for the platform.
     """
-    cache = load_platform_cache()
-    cache[url] = (platform, base_url, time.time())
-    save_platform_cache(cache)
+    try:
+        get_cache_backend().set(url, (platform, base_url, time.time()), CACHE_TTL_SECONDS)
+    except (OSError, sqlite3.Error) as e:
+        logger.error("Failed to save platform cache to %s: %s", CACHE_PATH, e)
+        return
     logger.debug("Cached platform for URL %s: Platform=%s, Base URL=%s.", url, platform, base_url)
@@ -0,0 +1,136 @@
+import asyncio
+import inspect
+import logging
+import time
+from typing import Awaitable, Callable
+
+from ctfbridge.models.challenge import Attachment, ProgressData
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[ProgressData], Awaitable[None] | None]
+
+
+class ProgressTracker:
+    """Accumulates the progress of one download and publishes it at the reporter's rate."""
+
+    def __init__(self, reporter: "ProgressReporter", attachment: Attachment, total_bytes: int):
+        self._reporter = reporter
+        self.attachment = attachment
+        self.total_bytes = total_bytes
+        self.downloaded_bytes = 0
+        self.speed_bps = 0.0
+        self._last_time = time.monotonic()
+        self._last_bytes = 0
+
+    def advance(self, size: int) -> None:
+        """Record ``size`` more bytes. Cheap enough to call for every chunk."""
+        self.downloaded_bytes += size
+        now = time.monotonic()
+        if now - self._last_time >= self._reporter.interval or (
+            0 < self.total_bytes <= self.downloaded_bytes
+        ):
+            self._sample(now)
+
+    def _sample(self, now: float) -> None:
+        elapsed = now - self._last_time
+        if elapsed > 0:
+            speed = (self.downloaded_bytes - self._last_bytes) / elapsed
+            if self.speed_bps:
+                alpha = self._reporter.smoothing
+                speed = alpha * speed + (1 - alpha) * self.speed_bps
+            self.speed_bps = speed
+        self._last_time = now
+        self._last_bytes = self.downloaded_bytes
+
+        if self.total_bytes > 0:
+            remaining = max(self.total_bytes - self.downloaded_bytes, 0)
+            self._reporter._publish(
+                self,
+                ProgressData(
+                    attachment=self.attachment,
+                    downloaded_bytes=self.downloaded_bytes,
+                    total_bytes=self.total_bytes,
+                    percentage=min(self.downloaded_bytes / self.total_bytes * 100, 100.0),
+                    speed_bps=self.speed_bps,
+                    eta_seconds=remaining / self.speed_bps if self.speed_bps > 0 else None,
+                ),
+            )
+
+
+class ProgressReporter:
+    """
+    Throttled, non-blocking delivery of attachment download progress.
+
+    Downloads record bytes on a `ProgressTracker` without awaiting anything. At most one
+    event per attachment is emitted every ``interval`` seconds, with speed and ETA smoothed
+    by an exponential moving average. Events are delivered to the callback by a separate
+    task; if the callback falls behind, newer events replace undelivered ones for the same
+    attachment, so a slow consumer never throttles the transfers.
+
+    Example:
+        async with ProgressReporter(on_progress, interval=0.25) as reporter:
+            await client.attachments.download_all(challenge, "out", progress=reporter)
+    """
+
+    def __init__(self, callback: ProgressCallback, interval: float = 0.1, smoothing: float = 0.3):
+        """
+        Args:
+            callback: Sync or async function receiving `ProgressData` events.
+            interval: Minimum number of seconds between events for one attachment.
+            smoothing: Weight of the newest sample in the speed moving average (0-1].
+        """
+        self.callback = callback
+        self.interval = interval
+        self.smoothing = smoothing
+        self._pending: dict[ProgressTracker, ProgressData] = {}
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._task: asyncio.Task | None = None
+
+    def track(self, attachment: Attachment, total_bytes: int) -> ProgressTracker:
+        """Start tracking a download of ``total_bytes`` bytes (0 if unknown)."""
+        return ProgressTracker(self, attachment, total_bytes)
+
+    def _publish(self, tracker: ProgressTracker, event: ProgressData) -> None:
+        self._pending[tracker] = event
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the delivery task."""
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.create_task(self._deliver())
+
+    async def aclose(self) -> None:
+        """Deliver any remaining events and stop the delivery task."""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+
+    async def _deliver(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            batch, self._pending = self._pending, {}
+            for event in batch.values():
+                try:
+                    result = self.callback(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.warning("Progress callback failed: %s", e)
+            if self._closing and not self._pending:
+                return
+
+    async def __aenter__(self) -> "ProgressReporter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
@@ -0,0 +1,35 @@
+import asyncio
+import time
+
+
+class BandwidthLimiter:
+    """
+    Token bucket shared by concurrent transfers to cap their combined throughput.
+
+    Transfers call `consume` after receiving each chunk. A transfer that overdraws the
+    bucket sleeps until the debt is paid back, holding up the other transfers meanwhile.
+    """
+
+    def __init__(self, bytes_per_second: float, burst: float | None = None):
+        """
+        Args:
+            bytes_per_second: Sustained rate limit.
+            burst: Bucket capacity in bytes. Defaults to one second's worth of transfer.
+        """
+        if bytes_per_second <= 0:
+            raise ValueError("bytes_per_second must be positive")
+        self.rate = bytes_per_second
+        self.capacity = burst or bytes_per_second
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def consume(self, amount: int) -> None:
+        """Account for ``amount`` transferred bytes, sleeping if the rate is exceeded."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            if self._tokens < 0:
+                await asyncio.sleep(-self._tokens / self.rate)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Measure event-loop lag while attachments are being downloaded.
+
+Serves several large files from an in-memory HTTP transport, downloads them concurrently
+and samples how late a 1 ms ticker wakes up. File I/O is run inline on the event loop
+and offloaded to writer threads, so the two can be compared:
+
+    python scripts/bench_attachment_io.py --files 8 --size-mb 64 --write-delay-ms 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import httpx
+
+from ctfbridge.core.services.attachment import CoreAttachmentService
+from ctfbridge.models.challenge import Attachment, AttachmentCollection, Challenge, DownloadInfo
+from ctfbridge.utils import file_writer
+
+CHUNK = 1048576
+
+
+class SlowFile:
+    """File wrapper that blocks on every write, emulating slow or networked storage."""
+
+    def __init__(self, f, delay: float):
+        self._f = f
+        self._delay = delay
+
+    def write(self, data: bytes) -> int:
+        time.sleep(self._delay * max(1, len(data) // CHUNK))
+        return self._f.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+class BodyStream(httpx.AsyncByteStream):
+    def __init__(self, size: int):
+        self.size = size
+
+    async def __aiter__(self):
+        chunk = b"\0" * CHUNK
+        for _ in range(self.size // CHUNK):
+            yield chunk
+            await asyncio.sleep(0)
+
+
+def make_service(size: int, offload_io: bool) -> CoreAttachmentService:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Length": str(size)}, stream=BodyStream(size))
+
+    client = MagicMock()
+    client.platform_url = "https://bench.local"
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return CoreAttachmentService(client, per_host_concurrency=64, offload_io=offload_io)
+
+
+async def measure(files: int, size: int, offload_io: bool) -> dict[str, float]:
+    service = make_service(size, offload_io)
+    challenge = Challenge(
+        id="bench",
+        name="bench",
+        attachments=AttachmentCollection(
+            attachments=[
+                Attachment(name=f"file{i}.bin", download_info=DownloadInfo(url=f"/files/{i}"))
+                for i in range(files)
+            ]
+        ),
+    )
+
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append((time.perf_counter() - start - 0.001) * 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tick = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await service.download_all(challenge, Path(tmp), concurrency=files)
+        elapsed = time.perf_counter() - start
+        done.set()
+        await tick
+
+    lags.sort()
+    return {
+        "seconds": elapsed,
+        "p50": statistics.median(lags),
+        "p99": lags[int(len(lags) * 0.99) - 1],
+        "max": lags[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--size-mb", type=int, default=32)
+    parser.add_argument("--write-delay-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    if args.write_delay_ms:
+        open_sync = file_writer.AsyncFileWriter._open_sync
+
+        def slow_open(self):
+            open_sync(self)
+            self._file = SlowFile(self._file, args.write_delay_ms / 1000)
+
+        file_writer.AsyncFileWriter._open_sync = slow_open
+
+    print(f"{args.files} files x {args.size_mb} MiB, {args.write_delay_ms} ms per MiB written")
+    print(f"{'mode':<10}{'time (s)':>10}{'p50 lag':>12}{'p99 lag':>12}{'max lag':>12}")
+    for label, offload_io in (("inline", False), ("threaded", True)):
+        r = asyncio.run(measure(args.files, args.size_mb * CHUNK, offload_io))
+        print(
+            f"{label:<10}{r['seconds']:>10.2f}{r['p50']:>10.2f}ms"
+            f"{r['p99']:>10.2f}ms{r['max']:>10.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,521 @@
+import asyncio
+import hashlib
+import io
+import stat
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from ctfbridge.core.services.attachment import CoreAttachmentService
+from ctfbridge.exceptions import AttachmentDownloadError
+from ctfbridge.models.challenge import (
+    Attachment,
+    AttachmentCollection,
+    Challenge,
+    DownloadInfo,
+    DownloadType,
+)
+from ctfbridge.utils.archive import ArchiveExtractor
+from ctfbridge.utils.attachment_manifest import AttachmentManifest
+from ctfbridge.utils.attachment_store import AttachmentStore
+
+FILE_URL = "https://ctf.example.com/files/0123456789abcdef0123456789abcdef/libc.so.6"
+
+
+def make_service(handler, **kwargs) -> CoreAttachmentService:
+    client = MagicMock()
+    client.platform_url = "https://ctf.example.com"
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return CoreAttachmentService(client, **kwargs)
+
+
+def make_attachment(url: str = FILE_URL, name: str = "libc.so.6") -> Attachment:
+    return Attachment(name=name, download_info=DownloadInfo(url=url))
+
+
+@pytest.mark.asyncio
+async def test_download_http(tmp_path):
+    service = make_service(lambda request: httpx.Response(200, content=b"ELF"))
+
+    [result] = await service.download(make_attachment(), tmp_path)
+
+    assert (tmp_path / "libc.so.6").read_bytes() == b"ELF"
+    assert result.local_path == str(tmp_path / "libc.so.6")
+    assert result.size_bytes == 3
+
+
+@pytest.mark.asyncio
+async def test_store_skips_network_for_known_content(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(200, content=b"ELF")
+
+    service = make_service(handler, store=AttachmentStore(tmp_path / "store"))
+
+    await service.download(make_attachment(), tmp_path / "event1")
+    await service.download(make_attachment(), tmp_path / "event2")
+
+    assert len(calls) == 1
+    assert (tmp_path / "event2" / "libc.so.6").read_bytes() == b"ELF"
+
+
+@pytest.mark.asyncio
+async def test_store_hit_checked_against_expected_sha256(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(200, content=b"ELF" if len(calls) == 1 else b"new")
+
+    service = make_service(handler, store=AttachmentStore(tmp_path / "store"))
+    await service.download(make_attachment(), tmp_path / "event1")
+
+    attachment = make_attachment()
+    attachment.download_info.expected_sha256 = hashlib.sha256(b"new").hexdigest()
+    [result] = await service.download(attachment, tmp_path / "event2")
+
+    assert len(calls) == 2
+    assert (tmp_path / "event2" / "libc.so.6").read_bytes() == b"new"
+    assert result.sha256 == attachment.download_info.expected_sha256
+
+
+@pytest.mark.asyncio
+async def test_store_keys_include_host(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(200, content=request.url.host.encode())
+
+    service = make_service(handler, store=AttachmentStore(tmp_path / "store"))
+    other = FILE_URL.replace("ctf.example.com", "other.example.com")
+
+    await service.download(make_attachment(), tmp_path / "a")
+    await service.download(make_attachment(other), tmp_path / "b")
+
+    assert len(calls) == 2
+    assert (tmp_path / "b" / "libc.so.6").read_bytes() == b"other.example.com"
+
+
+@pytest.mark.asyncio
+async def test_sync_revalidates_with_etag(tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"v1", headers={"ETag": '"v1"'})
+
+    service = make_service(handler)
+
+    await service.download(make_attachment(), tmp_path, sync=True)
+    [result] = await service.download(make_attachment(), tmp_path, sync=True)
+
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert result.size_bytes == 2
+    assert (tmp_path / "libc.so.6").read_bytes() == b"v1"
+
+
+@pytest.mark.asyncio
+async def test_sync_writes_manifest_once_per_call(tmp_path, monkeypatch):
+    saves = []
+    monkeypatch.setattr(AttachmentManifest, "save", lambda self: saves.append(dict(self.entries)))
+    service = make_service(
+        lambda request: httpx.Response(200, content=b"v1", headers={"ETag": "1"})
+    )
+    challenge = Challenge(
+        id="1",
+        name="pwn",
+        attachments=AttachmentCollection(
+            attachments=[make_attachment(name=name) for name in ("a", "b", "c")]
+        ),
+    )
+
+    await service.download_all(challenge, tmp_path, sync=True)
+
+    assert [sorted(entries) for entries in saves] == [["a", "b", "c"]]
+
+
+@pytest.mark.asyncio
+async def test_unconditional_304_is_an_error(tmp_path):
+    service = make_service(lambda request: httpx.Response(304))
+
+    with pytest.raises(AttachmentDownloadError):
+        await service._download(make_attachment(), tmp_path, sync=True)
+
+
+@pytest.mark.asyncio
+async def test_credentials_only_sent_to_platform(tmp_path):
+    seen = {}
+
+    def handler(request):
+        seen[request.url.host] = request.headers.get("Authorization")
+        return httpx.Response(200, content=b"data")
+
+    service = make_service(handler)
+    service._client._http.headers["Authorization"] = "Bearer secret"
+
+    await service.download(make_attachment(name="a"), tmp_path)
+    await service.download(make_attachment("https://cdn.example.org/b", name="b"), tmp_path)
+
+    assert seen == {"ctf.example.com": "Bearer secret", "cdn.example.org": None}
+
+
+@pytest.mark.asyncio
+async def test_download_many_streams_events(tmp_path):
+    def handler(request):
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"x" * 10)
+
+    service = make_service(handler)
+    challenges = [
+        Challenge(
+            id="1",
+            name="pwn/one",
+            attachments=AttachmentCollection(
+                attachments=[make_attachment("/files/a", "a"), make_attachment("/missing", "b")]
+            ),
+        ),
+        Challenge(
+            id="2",
+            name="two",
+            attachments=AttachmentCollection(attachments=[make_attachment("/files/c", "c")]),
+        ),
+    ]
+
+    events = [
+        event
+        async for event in service.download_many(
+            challenges, tmp_path, concurrency=2, per_host=1, max_bytes_per_second=1_000_000
+        )
+    ]
+
+    assert sorted((e.attachment.name, e.ok) for e in events) == [
+        ("a", True),
+        ("b", False),
+        ("c", True),
+    ]
+    assert (tmp_path / "pwn_one" / "a").exists()
+    assert (tmp_path / "two" / "c").exists()
+
+
+@pytest.mark.asyncio
+async def test_download_many_rejects_per_host_above_service_cap(tmp_path):
+    service = make_service(lambda request: httpx.Response(200), per_host_concurrency=2)
+    challenge = Challenge(
+        id="1", name="one", attachments=AttachmentCollection(attachments=[make_attachment()])
+    )
+
+    with pytest.raises(ValueError):
+        async for _ in service.download_many([challenge], tmp_path, per_host=4):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_download_many_cancels_pending_downloads_on_close(tmp_path):
+    async def handler(request):
+        if request.url.path.endswith("slow"):
+            await asyncio.sleep(60)
+        return httpx.Response(200, content=b"x")
+
+    service = make_service(handler)
+    challenge = Challenge(
+        id="1",
+        name="one",
+        attachments=AttachmentCollection(
+            attachments=[make_attachment("/fast", "fast"), make_attachment("/slow", "slow")]
+        ),
+    )
+
+    events = service.download_many([challenge], tmp_path)
+    first = await anext(events)
+    await events.aclose()
+
+    assert first.attachment.name == "fast"
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_large_file_downloaded_in_segments(tmp_path):
+    body = bytes(range(256)) * 40
+    ranges = []
+
+    def handler(request):
+        headers = {"Accept-Ranges": "bytes", "ETag": '"abc"'}
+        range_header = request.headers.get("Range")
+        if not range_header:
+            return httpx.Response(200, content=body, headers=headers)
+        start, end = map(int, range_header.removeprefix("bytes=").split("-"))
+        ranges.append((start, end))
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+        return httpx.Response(206, content=body[start : end + 1], headers=headers)
+
+    service = make_service(handler, segments=4, segment_threshold=1024)
+
+    [result] = await service.download(make_attachment(), tmp_path)
+
+    assert (tmp_path / "libc.so.6").read_bytes() == body
+    assert result.size_bytes == len(body)
+    assert ranges == [(2560, 5119), (5120, 7679), (7680, 10239)]
+
+
+@pytest.mark.asyncio
+async def test_segments_limited_to_free_host_slots(tmp_path):
+    body = b"x" * 4096
+    ranges = []
+
+    def handler(request):
+        headers = {"Accept-Ranges": "bytes"}
+        range_header = request.headers.get("Range")
+        if not range_header:
+            return httpx.Response(200, content=body, headers=headers)
+        start, end = map(int, range_header.removeprefix("bytes=").split("-"))
+        ranges.append((start, end))
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+        return httpx.Response(206, content=body[start : end + 1], headers=headers)
+
+    service = make_service(handler, segments=4, segment_threshold=1024, per_host_concurrency=2)
+
+    await service.download(make_attachment(), tmp_path)
+
+    assert (tmp_path / "libc.so.6").read_bytes() == body
+    assert ranges == [(2048, 4095)]
+
+
+@pytest.mark.asyncio
+async def test_segmented_download_fails_if_ranges_ignored(tmp_path):
+    body = b"x" * 4096
+
+    def handler(request):
+        return httpx.Response(200, content=body, headers={"Accept-Ranges": "bytes"})
+
+    service = make_service(handler, segments=2, segment_threshold=1024)
+
+    [result] = await service.download(make_attachment(), tmp_path)
+
+    assert result.local_path is None
+    assert not (tmp_path / "libc.so.6").exists()
+    assert not (tmp_path / "libc.so.6.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_download_records_checksums_and_type(tmp_path):
+    body = b"\x7fELF" + b"\x00" * 60
+    service = make_service(lambda request: httpx.Response(200, content=body), compute_md5=True)
+
+    [result] = await service.download(make_attachment(), tmp_path)
+
+    assert result.sha256 == hashlib.sha256(body).hexdigest()
+    assert result.md5 == hashlib.md5(body).hexdigest()
+    assert result.file_type == "application/x-elf"
+
+
+@pytest.mark.asyncio
+async def test_expected_sha256_mismatch_discards_file(tmp_path):
+    service = make_service(lambda request: httpx.Response(200, content=b"corrupted"))
+    attachment = make_attachment()
+    attachment.download_info.expected_sha256 = hashlib.sha256(b"original").hexdigest()
+
+    [result] = await service.download(attachment, tmp_path)
+
+    assert result.local_path is None
+    assert list(tmp_path.iterdir()) == []
+
+
+class FakeSFTP:
+    """In-memory SFTP server exposing the handful of calls used by the SSH downloader."""
+
+    def __init__(self, tree: dict):
+        self.tree = tree
+        self.readdir_calls = 0
+
+    def _node(self, path: str):
+        node = self.tree
+        for part in filter(None, path.split("/")):
+            node = node[part]
+        return node
+
+    def _attrs(self, node):
+        return SimpleNamespace(
+            permissions=(stat.S_IFDIR if isinstance(node, dict) else stat.S_IFREG)
+        )
+
+    async def stat(self, path):
+        return self._attrs(self._node(path))
+
+    async def readdir(self, path):
+        self.readdir_calls += 1
+        return [
+            SimpleNamespace(filename=name, attrs=self._attrs(node))
+            for name, node in [(".", {}), ("..", {}), *self._node(path).items()]
+        ]
+
+    def open(self, path, mode):
+        data = self._node(path)
+
+        class Reader:
+            async def __aenter__(self):
+                self.data = data
+                return self
+
+            async def __aexit__(self, *args):
+                pass
+
+            async def read(self, size):
+                chunk, self.data = self.data[:size], self.data[size:]
+                return chunk
+
+        return Reader()
+
+    def exit(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_ssh_directory_download_reuses_pooled_session(tmp_path):
+    sftp = FakeSFTP({"chal": {"flag.txt": b"flag", ".hidden": b"x", "lib": {"libc.so.6": b"ELF"}}})
+    service = make_service(lambda request: httpx.Response(404))
+    service._ssh_pool.sftp = AsyncMock(return_value=sftp)
+    attachment = Attachment(
+        name="chal",
+        download_info=DownloadInfo(
+            type=DownloadType.SSH, host="dojo.example.com", username="hacker", path="/chal"
+        ),
+    )
+
+    first = await service.download(attachment, tmp_path / "a")
+    second = await service.download(attachment, tmp_path / "b")
+
+    assert sorted(a.name for a in first) == sorted(a.name for a in second)
+    assert {Path(a.local_path).name for a in first} == {"flag.txt", "libc.so.6"}
+    assert (tmp_path / "a" / "lib" / "libc.so.6").read_bytes() == b"ELF"
+    assert not (tmp_path / "a" / ".hidden").exists()
+    assert sftp.readdir_calls == 4
+    assert service._ssh_pool.sftp.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_ssh_connections_closed_after_download(tmp_path):
+    conn = MagicMock()
+    conn.is_closed.return_value = False
+    conn.start_sftp_client = AsyncMock(return_value=FakeSFTP({"chal": {"flag.txt": b"flag"}}))
+    conn.wait_closed = AsyncMock()
+    service = make_service(lambda request: httpx.Response(404))
+    attachment = Attachment(
+        name="flag.txt",
+        download_info=DownloadInfo(
+            type=DownloadType.SSH, host="h", username="u", path="/chal/flag.txt"
+        ),
+    )
+
+    with patch("asyncssh.connect", AsyncMock(return_value=conn)):
+        [result] = await service.download(attachment, tmp_path)
+
+    assert result.local_path
+    assert service._ssh_pool._sessions == {}
+    conn.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_read_streams_without_writing(tmp_path, monkeypatch):
+    service = make_service(lambda request: httpx.Response(200, content=b"ELF" * 100))
+    monkeypatch.chdir(tmp_path)
+
+    assert await service.read(make_attachment()) == b"ELF" * 100
+    assert list(tmp_path.iterdir()) == []
+
+    with pytest.raises(AttachmentDownloadError, match="Larger than 10 bytes"):
+        await service.read(make_attachment(), max_bytes=10)
+
+
+@pytest.mark.asyncio
+async def test_open_verifies_expected_checksum():
+    service = make_service(lambda request: httpx.Response(200, content=b"ELF"))
+    attachment = make_attachment()
+    attachment.download_info.expected_sha256 = "0" * 64
+
+    with pytest.raises(AttachmentDownloadError, match="SHA-256 mismatch"):
+        async with service.open(attachment) as stream:
+            async for _ in stream:
+                pass
+
+
+@pytest.mark.asyncio
+async def test_open_ssh_file():
+    sftp = FakeSFTP({"chal": {"flag.txt": b"flag"}})
+    service = make_service(lambda request: httpx.Response(404))
+    service._ssh_pool.sftp = AsyncMock(return_value=sftp)
+    info = DownloadInfo(type=DownloadType.SSH, host="h", username="u", path="/chal/flag.txt")
+
+    assert await service.read(Attachment(name="flag.txt", download_info=info)) == b"flag"
+
+    directory = info.model_copy(update={"path": "/chal"})
+    with pytest.raises(AttachmentDownloadError, match="directory"):
+        await service.read(Attachment(name="chal", download_info=directory))
+
+
+@pytest.mark.asyncio
+async def test_download_all_extracts_archives(tmp_path, monkeypatch):
+    closed = []
+    monkeypatch.setattr(ArchiveExtractor, "close", lambda self: closed.append(self._executor))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("chall/vuln", b"\x7fELF")
+    service = make_service(lambda request: httpx.Response(200, content=buffer.getvalue()))
+    challenge = Challenge(
+        id="1",
+        name="pwn1",
+        attachments=AttachmentCollection(attachments=[make_attachment(name="handout.zip")]),
+    )
+
+    result = await service.download_all(challenge, tmp_path, extract=True)
+
+    [executor] = closed
+    executor.shutdown()
+
+    [archive] = result.attachments
+    [child] = archive.children
+    assert child.name == "chall/vuln"
+    assert child.file_type == "application/x-elf"
+    assert (tmp_path / "handout" / "chall" / "vuln").read_bytes() == b"\x7fELF"
+
+
+@pytest.mark.asyncio
+async def test_failed_extraction_keeps_downloads(tmp_path):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("flag.txt", b"flag")
+    # Mark the member as encrypted in the local and central headers
+    encrypted = bytearray(buffer.getvalue())
+    encrypted[6] |= 0x1
+    encrypted[encrypted.find(b"PK\x01\x02") + 8] |= 0x1
+    bodies = {"secret.zip": bytes(encrypted), "notes.txt": b"notes"}
+    service = make_service(
+        lambda request: httpx.Response(200, content=bodies[request.url.path[1:]])
+    )
+    challenge = Challenge(
+        id="1",
+        name="crypto",
+        attachments=AttachmentCollection(
+            attachments=[make_attachment(f"/{name}", name) for name in bodies]
+        ),
+    )
+
+    result = await service.download_all(challenge, tmp_path, extract=True)
+
+    assert {att.name: att.children for att in result.attachments} == {
+        "secret.zip": [],
+        "notes.txt": [],
+    }
+    assert (tmp_path / "secret.zip").exists()
+    assert (tmp_path / "notes.txt").read_bytes() == b"notes"
+    assert not (tmp_path / "secret").exists()
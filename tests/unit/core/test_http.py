@@ -0,0 +1,41 @@
+import httpx
+import pytest
+
+from ctfbridge.core.http import RetryTransport, make_http_client
+
+
+class FlakyTransport(httpx.AsyncBaseTransport):
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.attempts = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200)
+
+
+@pytest.mark.asyncio
+async def test_retry_transport_retries_connect_errors():
+    flaky = FlakyTransport(failures=2)
+    async with httpx.AsyncClient(transport=RetryTransport(flaky, retries=2, backoff_factor=0)) as c:
+        assert (await c.get("https://example.com")).status_code == 200
+    assert flaky.attempts == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_transport_per_request_override():
+    flaky = FlakyTransport(failures=1)
+    async with httpx.AsyncClient(transport=RetryTransport(flaky, retries=5, backoff_factor=0)) as c:
+        with pytest.raises(httpx.ConnectError):
+            await c.get("https://example.com", extensions={"retries": 0})
+    assert flaky.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_is_restored():
+    async with make_http_client(config={"retries": 3}) as client:
+        with client.retry_policy(1):
+            assert client.retries == 1
+        assert client.retries == 3
@@ -0,0 +1,42 @@
+import pytest
+
+from ctfbridge.core.services.scoreboard import CoreScoreboardService
+from ctfbridge.exceptions import ScoreboardFetchError
+from ctfbridge.models.scoreboard import ScoreboardEntry
+
+
+class ListScoreboardService(CoreScoreboardService):
+    async def _fetch_scoreboard(self, limit):
+        return [ScoreboardEntry(name=f"team{i}", score=100 - i, rank=i) for i in range(1, 6)]
+
+
+@pytest.mark.asyncio
+async def test_get_top_limits_fetched_scoreboard():
+    service = ListScoreboardService(client=None)
+
+    assert len(await service.get_top()) == 5
+    assert [entry.rank for entry in await service.get_top(limit=2)] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_iter_top_yields_in_rank_order():
+    service = ListScoreboardService(client=None)
+
+    assert [entry.name async for entry in service.iter_top(limit=3)] == ["team1", "team2", "team3"]
+
+
+@pytest.mark.asyncio
+async def test_own_standing_found_by_name():
+    class NamedScoreboardService(ListScoreboardService):
+        async def _own_name(self):
+            return "team4"
+
+    entry = await NamedScoreboardService(client=None).get_own_standing()
+
+    assert entry.rank == 4
+
+
+@pytest.mark.asyncio
+async def test_own_standing_without_account_name_raises():
+    with pytest.raises(ScoreboardFetchError):
+        await ListScoreboardService(client=None).get_own_standing()
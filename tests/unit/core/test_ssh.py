@@ -0,0 +1,34 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ctfbridge.core.ssh import SSHConnectionPool
+from ctfbridge.models.challenge import DownloadInfo
+
+
+def make_conn():
+    conn = MagicMock()
+    conn.is_closed.return_value = False
+    conn.start_sftp_client = AsyncMock(return_value=MagicMock())
+    conn.wait_closed = AsyncMock()
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_connection_per_host_and_credentials():
+    pool = SSHConnectionPool()
+    info = DownloadInfo(type="ssh", host="dojo.example.com", username="hacker", key=b"k1")
+    other_key = info.model_copy(update={"key": b"k2"})
+
+    with patch("asyncssh.connect", AsyncMock(side_effect=lambda *a, **kw: make_conn())) as connect:
+        first = await pool.sftp(info)
+        assert await pool.sftp(info.model_copy(update={"path": "/other"})) is first
+        assert await pool.sftp(other_key) is not first
+        assert connect.await_count == 2
+
+        await pool.invalidate(info)
+        assert await pool.sftp(info) is not first
+        assert connect.await_count == 3
+
+    await pool.aclose()
+    assert pool._sessions == {}
@@ -0,0 +1,122 @@
+import httpx
+import pytest
+
+from ctfbridge.exceptions import ScoreboardFetchError
+from ctfbridge.platforms.ctfd.client import CTFdClient
+
+FULL_SCOREBOARD = [
+    {"pos": i, "account_id": i, "name": f"team{i}", "score": 1000 - i} for i in range(1, 501)
+]
+TOP_SCOREBOARD = {
+    str(i): {"id": i, "account_url": f"/teams/{i}", "name": f"team{i}", "score": 1000 - i}
+    for i in range(1, 11)
+}
+
+
+async def fetch_top(handler, limit):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = CTFdClient(http=http, url="https://ctfd.example.com")
+        return await client.scoreboard.get_top(limit=limit)
+
+
+@pytest.mark.asyncio
+async def test_get_top_uses_top_endpoint():
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"success": True, "data": TOP_SCOREBOARD})
+
+    entries = await fetch_top(handler, limit=10)
+
+    assert paths == ["/api/v1/scoreboard/top/10"]
+    assert [entry.rank for entry in entries] == list(range(1, 11))
+    assert entries[0].name == "team1"
+
+
+@pytest.mark.asyncio
+async def test_get_top_falls_back_to_full_scoreboard():
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.startswith("/api/v1/scoreboard/top"):
+            return httpx.Response(404)
+        return httpx.Response(200, json={"success": True, "data": FULL_SCOREBOARD})
+
+    entries = await fetch_top(handler, limit=3)
+
+    assert paths == ["/api/v1/scoreboard/top/3", "/api/v1/scoreboard"]
+    assert [entry.name for entry in entries] == ["team1", "team2", "team3"]
+
+
+@pytest.mark.asyncio
+async def test_get_all_uses_full_scoreboard():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/scoreboard"
+        return httpx.Response(200, json={"success": True, "data": FULL_SCOREBOARD})
+
+    assert len(await fetch_top(handler, limit=0)) == len(FULL_SCOREBOARD)
+
+
+def me_handler(paths, user, team=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        data = {
+            "/api/v1/users/me": user,
+            "/api/v1/teams/me": team,
+            "/api/v1/users/me/solves": [{"challenge_id": 1}],
+            "/api/v1/teams/me/solves": [{"challenge_id": 1}, {"challenge_id": 2}],
+            "/api/v1/scoreboard": FULL_SCOREBOARD,
+        }[request.url.path]
+        return httpx.Response(200, json={"success": True, "data": data})
+
+    return handler
+
+
+async def fetch_own_standing(handler):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = CTFdClient(http=http, url="https://ctfd.example.com")
+        return await client.scoreboard.get_own_standing()
+
+
+@pytest.mark.asyncio
+async def test_own_standing_in_user_mode():
+    paths = []
+    user = {"id": 7, "name": "team7", "place": "7th", "score": 993, "team_id": None}
+
+    entry = await fetch_own_standing(me_handler(paths, user))
+
+    assert (entry.rank, entry.score, entry.total_solves) == (7, 993, 1)
+    assert "/api/v1/scoreboard" not in paths
+
+
+@pytest.mark.asyncio
+async def test_own_standing_in_team_mode():
+    paths = []
+    user = {"id": 1, "name": "alice", "place": "1st", "score": 100, "team_id": 21}
+    team = {"id": 21, "name": "team21", "place": "21st", "score": 979}
+
+    entry = await fetch_own_standing(me_handler(paths, user, team))
+
+    assert (entry.name, entry.rank, entry.score, entry.total_solves) == ("team21", 21, 979, 2)
+    assert "/api/v1/scoreboard" not in paths
+
+
+@pytest.mark.asyncio
+async def test_own_standing_falls_back_to_scoreboard():
+    paths = []
+    user = {"id": 3, "name": "team3", "place": None, "score": 997, "team_id": None}
+
+    entry = await fetch_own_standing(me_handler(paths, user))
+
+    assert (entry.rank, entry.score, entry.total_solves) == (3, 997, 1)
+    assert "/api/v1/scoreboard" in paths
+
+
+@pytest.mark.asyncio
+async def test_own_standing_with_incomplete_profile_raises():
+    user = {"place": "7th", "score": 993, "team_id": None}
+
+    with pytest.raises(ScoreboardFetchError):
+        await fetch_own_standing(me_handler([], user))
@@ -1,11 +1,10 @@
-from urllib.parse import ParseResult, urlparse
-
 import httpx  # Import httpx for AsyncClient and Response
 import pytest
 from httpx import Response  # Specifically import Response for clarity
 
 from ctfbridge.platforms.ctfd.http.endpoints import Endpoints  # Import Endpoints
 from ctfbridge.platforms.ctfd.identifier import CTFdIdentifier
+from ctfbridge.platforms.registry import match_url_patterns
 
 # Mark all tests in this file as asyncio
 pytestmark = pytest.mark.asyncio
@@ -29,7 +28,7 @@ async def test_platform_name(identifier):
     assert identifier.platform_name == "CTFd"
 
 
-# Test cases for match_url_pattern
+# Test cases for the CTFd URL patterns
 @pytest.mark.parametrize(
     "url, expected",
     [
@@ -43,9 +42,8 @@ async def test_platform_name(identifier):
         ("http://rctf.example.org", False),
     ],
 )
-async def test_match_url_pattern(identifier, url, expected):
-    parsed_url = urlparse(url)
-    assert identifier.match_url_pattern(parsed_url) == expected
+async def test_match_url_patterns(url, expected):
+    assert ("ctfd" in match_url_patterns(url)) == expected
 
 
 # Test cases for static_detect
@@ -0,0 +1,50 @@
+import httpx
+import pytest
+
+from ctfbridge.exceptions import NotAuthenticatedError
+from ctfbridge.platforms.gzctf.client import GZCTFClient
+
+SCOREBOARD = [{"name": f"team{i}", "score": 1000 - i, "rank": i + 1} for i in range(5)]
+
+
+def game_handler(own_team: str, details_status: int = 200):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/game/1/details":
+            rank = {"name": own_team, "score": 0, "rank": 0, "solvedChallenges": []}
+            return httpx.Response(details_status, json={"challenges": {}, "rank": rank})
+        if request.url.path == "/api/game/1/scoreboard":
+            return httpx.Response(200, json={"items": SCOREBOARD})
+        return httpx.Response(404)
+
+    return handler
+
+
+async def make_client(handler) -> GZCTFClient:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return GZCTFClient(http=http, url="https://gzctf.example.com/games/1")
+
+
+@pytest.mark.asyncio
+async def test_own_standing_looks_up_team_from_game_details():
+    client = await make_client(game_handler("team3"))
+
+    standing = await client.scoreboard.get_own_standing()
+
+    assert standing.name == "team3"
+    assert standing.rank == 4
+    assert standing.score == 997
+
+
+@pytest.mark.asyncio
+async def test_own_standing_missing_from_scoreboard():
+    client = await make_client(game_handler("unranked"))
+
+    assert await client.scoreboard.get_own_standing() is None
+
+
+@pytest.mark.asyncio
+async def test_own_standing_requires_login():
+    client = await make_client(game_handler("team3", details_status=401))
+
+    with pytest.raises(NotAuthenticatedError):
+        await client.scoreboard.get_own_standing()
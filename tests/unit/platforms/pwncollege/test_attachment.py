@@ -0,0 +1,78 @@
+import stat
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from ctfbridge.models.challenge import Attachment, DownloadInfo, DownloadType
+from ctfbridge.platforms.pwncollege.client import PwnCollegeClient
+
+
+class FakeSFTP:
+    async def stat(self, path):
+        return SimpleNamespace(permissions=stat.S_IFREG)
+
+    def open(self, path, mode):
+        class Reader:
+            data = b"flag"
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                pass
+
+            async def read(self, size):
+                chunk, self.data = self.data[:size], self.data[size:]
+                return chunk
+
+        return Reader()
+
+    def exit(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_ssh_key_removed_after_download(tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        return httpx.Response(200, json={"success": True})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = PwnCollegeClient(http, "https://pwn.college")
+    conn = MagicMock()
+    conn.is_closed.return_value = False
+    conn.start_sftp_client = AsyncMock(return_value=FakeSFTP())
+    conn.wait_closed = AsyncMock()
+    key = MagicMock()
+    key.export_private_key.return_value = b"private"
+    key.export_public_key.return_value = b"ssh-rsa AAAA ctfbridge"
+    attachment = Attachment(
+        name="flag",
+        download_info=DownloadInfo(
+            type=DownloadType.SSH,
+            host="dojo.pwn.college",
+            username="hacker",
+            path="/challenge/flag",
+            extra={
+                "pwncollege_dojo": "welcome",
+                "pwncollege_module": "welcome",
+                "pwncollege_challenge": "flag",
+            },
+        ),
+    )
+
+    with (
+        patch("asyncssh.connect", AsyncMock(return_value=conn)),
+        patch("asyncssh.generate_private_key", return_value=key),
+    ):
+        [result] = await client.attachments.download(attachment, tmp_path)
+
+    assert (tmp_path / "flag").read_bytes() == b"flag"
+    assert result.download_info.key is None
+    assert ("DELETE", "/pwncollege_api/v1/ssh_key") in requests
+    assert client.attachments._ssh_keypair is None
+    await http.aclose()
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from ctfbridge.platforms.pwncollege.utils.instance import OnDemandInstanceManager
+
+
+@pytest.mark.asyncio
+async def test_same_challenge_reuses_running_instance():
+    manager = OnDemandInstanceManager()
+    starts = []
+
+    async def start(key):
+        starts.append(key)
+
+    async def use(key):
+        async with manager.lease(key, lambda: start(key)):
+            await asyncio.sleep(0.01)
+
+    first = ("dojo", "module", "a")
+    second = ("dojo", "module", "b")
+    await asyncio.gather(use(first), use(first), use(second), use(first))
+
+    assert starts.count(first) == 1
+    assert starts.count(second) == 1
+    assert manager.current == second
+
+
+@pytest.mark.asyncio
+async def test_other_challenge_waits_for_running_leases():
+    manager = OnDemandInstanceManager()
+    events = []
+
+    async def start(key):
+        events.append(f"start {key[2]}")
+
+    async def use(key):
+        async with manager.lease(key, lambda: start(key)):
+            events.append(f"use {key[2]}")
+            await asyncio.sleep(0.01)
+            events.append(f"done {key[2]}")
+
+    await asyncio.gather(use(("d", "m", "a")), use(("d", "m", "b")))
+
+    assert events == ["start a", "use a", "done a", "start b", "use b", "done b"]
+
+
+@pytest.mark.asyncio
+async def test_failed_start_leaves_no_running_instance():
+    manager = OnDemandInstanceManager()
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        async with manager.lease(("d", "m", "a"), fail):
+            pass
+
+    assert manager.current is None
+    async with manager.lease(("d", "m", "b"), lambda: asyncio.sleep(0)):
+        pass
+    assert manager.current == ("d", "m", "b")
@@ -0,0 +1,121 @@
+import asyncio
+
+import httpx
+import pytest
+
+from ctfbridge.platforms.rctf.client import RCTFClient
+
+TOTAL = 250
+
+
+def leaderboard_handler(requests: list[tuple[int, int]], delay: float = 0):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        requests.append((offset, limit))
+        # Later pages answer faster, to check that they are reassembled in order
+        await asyncio.sleep(delay / (offset + 1))
+        entries = [
+            {"id": str(i), "name": f"team{i}", "score": 10000 - i}
+            for i in range(offset, min(offset + limit, TOTAL))
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "kind": "goodLeaderboard",
+                "message": "The leaderboard was retrieved.",
+                "data": {"total": TOTAL, "leaderboard": entries},
+            },
+        )
+
+    return handler
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+async def client(requests):
+    transport = httpx.MockTransport(leaderboard_handler(requests))
+    async with httpx.AsyncClient(transport=transport) as http:
+        yield RCTFClient(http=http, url="https://rctf.example.com")
+
+
+@pytest.mark.asyncio
+async def test_get_top_pages_through_scoreboard(client, requests):
+    entries = await client.scoreboard.get_top()
+
+    assert [entry.rank for entry in entries] == list(range(1, TOTAL + 1))
+    assert entries[120].name == "team120"
+    assert sorted(requests) == [(0, 100), (100, 100), (200, 100)]
+
+
+@pytest.mark.asyncio
+async def test_iter_top_stops_fetching_when_iteration_stops(client, requests):
+    async for entry in client.scoreboard.iter_top():
+        if entry.rank == 50:
+            break
+
+    assert requests == [(0, 100)]
+
+
+@pytest.mark.asyncio
+async def test_iter_top_limit_caps_page_size(client, requests):
+    entries = [entry async for entry in client.scoreboard.iter_top(limit=130)]
+
+    assert len(entries) == 130
+    assert requests == [(0, 100), (100, 30)]
+
+
+@pytest.mark.asyncio
+async def test_pages_after_the_first_are_fetched_concurrently(requests):
+    in_flight = 0
+    max_in_flight = 0
+    handler = leaderboard_handler(requests, delay=0.05)
+
+    async def counting_handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            return await handler(request)
+        finally:
+            in_flight -= 1
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(counting_handler)) as http:
+        client = RCTFClient(http=http, url="https://rctf.example.com")
+        entries = await client.scoreboard.get_top()
+
+    assert [entry.rank for entry in entries] == list(range(1, TOTAL + 1))
+    assert [entry.name for entry in entries[:3]] == ["team0", "team1", "team2"]
+    assert entries[-1].name == f"team{TOTAL - 1}"
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_own_standing_from_profile():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/users/me"
+        profile = {
+            "id": "abc",
+            "name": "team42",
+            "email": "team42@example.com",
+            "division": "open",
+            "score": 9958,
+            "globalPlace": 42,
+            "divisionPlace": 40,
+            "solves": [
+                {"id": "c1", "name": "c1", "category": "pwn", "points": 100, "solves": 3},
+            ],
+            "teamToken": "token",
+            "allowedDivisions": ["open"],
+        }
+        return httpx.Response(200, json={"kind": "goodUserData", "data": profile})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = RCTFClient(http=http, url="https://rctf.example.com")
+        entry = await client.scoreboard.get_own_standing()
+
+    assert (entry.name, entry.rank, entry.score, entry.total_solves) == ("team42", 42, 9958, 1)
@@ -0,0 +1,226 @@
+import asyncio
+
+import httpx
+import pytest
+
+from ctfbridge.exceptions import DetectionTimeoutError, UnknownPlatformError
+from ctfbridge.platforms.detect import (
+    DetectionReport,
+    _first_confirmed,
+    detect_many,
+    detect_platform,
+)
+from ctfbridge.utils import platform_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(platform_cache, "CACHE_PATH", tmp_path / "platform_cache.json")
+
+
+@pytest.mark.asyncio
+async def test_first_confirmed_prefers_priority_and_cancels_rest():
+    cancelled = []
+
+    async def check(index: int, delay: float, confirmed: bool):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return index if confirmed else None
+
+    result = await _first_confirmed(
+        [
+            lambda: check(0, 0.02, False),
+            lambda: check(1, 0.03, True),
+            lambda: check(2, 0.0, True),
+            lambda: check(3, 1.0, True),
+        ]
+    )
+
+    assert result == 1
+    assert cancelled == [3]
+
+
+@pytest.mark.asyncio
+async def test_dynamic_detection_runs_concurrently_with_priority():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/swagger.json":
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, text="disband your current team")
+        if request.url.path == "/api/metadata":
+            return httpx.Response(200, text="allowAnonymousAccess anonymous_allowed")
+        return httpx.Response(200, text="<html>welcome</html>")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        assert await detect_platform("https://ctf.example.com", http) == (
+            "ctfd",
+            "https://ctf.example.com",
+        )
+
+
+@pytest.mark.asyncio
+async def test_repeated_requests_are_memoized_within_a_run():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/api/v1/swagger.json":
+            return httpx.Response(200, text="disband your current team")
+        return httpx.Response(404)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        assert await detect_platform("https://ctf.example.com", http) == (
+            "ctfd",
+            "https://ctf.example.com",
+        )
+        # dynamic_detect and is_base_url share one swagger request
+        assert requests.count("/api/v1/swagger.json") == 1
+
+        await detect_platform("https://ctf.example.com", http)
+        assert requests.count("/api/v1/swagger.json") == 2
+
+
+@pytest.mark.asyncio
+async def test_static_signature_detection():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/swagger.json":
+            return httpx.Response(200, text="{}")
+        return httpx.Response(200, text="<footer>Powered by CTFd</footer>")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        assert await detect_platform("https://ctf.example.com/challenges", http) == (
+            "ctfd",
+            "https://ctf.example.com/challenges",
+        )
+
+
+@pytest.mark.asyncio
+async def test_failed_candidates_are_remembered_with_reason():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        raise httpx.ConnectError("[Errno -2] Name or service not known", request=request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        with pytest.raises(UnknownPlatformError):
+            await detect_platform("https://dead.example.com", http)
+        probed = len(calls)
+
+        with pytest.raises(UnknownPlatformError, match="recently failed: dns"):
+            await detect_platform("https://dead.example.com", http)
+
+    assert probed and len(calls) == probed
+    assert platform_cache.get_cached_failure("https://dead.example.com")[0] == "dns"
+
+
+@pytest.mark.asyncio
+async def test_failures_written_once_per_detection(monkeypatch):
+    writes = []
+    update = platform_cache.JSONCacheBackend.update
+
+    def spy(self, entries, ttl_seconds=None):
+        writes.append(sorted(entries))
+        update(self, entries, ttl_seconds)
+
+    monkeypatch.setattr(platform_cache.JSONCacheBackend, "update", spy)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("[Errno -2] Name or service not known", request=request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        with pytest.raises(UnknownPlatformError):
+            await detect_platform("https://dead.example.com/event/challenges", http)
+
+    [written] = writes
+    assert len(written) > 1
+    assert "https://dead.example.com" in written
+
+
+@pytest.mark.asyncio
+async def test_detect_many_shares_probes_per_host_and_fills_cache():
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        if request.url.host == "ctfd.example.com":
+            if request.url.path.endswith("/swagger.json"):
+                if request.url.path != "/api/v1/swagger.json":
+                    return httpx.Response(404)
+                return httpx.Response(200, json={})
+                return httpx.Response(200, json={})
+            return httpx.Response(200, text="<footer>Powered by CTFd</footer>")
+        return httpx.Response(404, text="not found")
+
+    urls = [
+        "https://ctfd.example.com/challenges",
+        "https://ctfd.example.com/scoreboard",
+        "https://ctfd.example.com/challenges",
+        "https://other.example.com",
+        "",
+    ]
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        results = {
+            url: (platform, result) async for url, platform, result in detect_many(urls, http)
+        }
+
+    assert set(results) == set(urls)
+    assert results["https://ctfd.example.com/challenges"] == ("ctfd", "https://ctfd.example.com")
+    assert results["https://ctfd.example.com/scoreboard"] == ("ctfd", "https://ctfd.example.com")
+    assert results["https://other.example.com"][0] is None
+    assert isinstance(results["https://other.example.com"][1], UnknownPlatformError)
+    assert isinstance(results[""][1], ValueError)
+    assert requests.count("https://ctfd.example.com") == 1
+
+    assert platform_cache.get_cached_platform("https://ctfd.example.com/scoreboard") == (
+        "ctfd",
+        "https://ctfd.example.com",
+    )
+
+
+@pytest.mark.asyncio
+async def test_detect_many_answers_from_cache():
+    platform_cache.set_cached_platform(
+        "https://cached.example.com", "rctf", "https://cached.example.com"
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("cached URLs must not be probed")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        results = [r async for r in detect_many(["https://cached.example.com"], http)]
+
+    assert results == [("https://cached.example.com", "rctf", "https://cached.example.com")]
+
+
+@pytest.mark.asyncio
+async def test_deadline_returns_best_guess_with_timings():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/swagger.json"):
+            await asyncio.sleep(10)
+        return httpx.Response(200, text="<footer>Powered by CTFd</footer>")
+
+    report = DetectionReport()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        result = await detect_platform("https://ctf.example.com", http, timeout=0.1, report=report)
+
+    assert result == ("ctfd", "https://ctf.example.com")
+    assert report.guessed
+    assert list(report.timings) == ["direct", "probe", "static"]
+    assert sum(report.timings.values()) == pytest.approx(0.1, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_deadline_without_guess_raises():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        with pytest.raises(DetectionTimeoutError) as exc_info:
+            await detect_platform("https://ctf.example.com", http, timeout=0.05)
+
+    assert isinstance(exc_info.value, UnknownPlatformError)
+    assert "probe" in exc_info.value.timings
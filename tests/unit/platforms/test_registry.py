@@ -0,0 +1,40 @@
+import pytest
+
+from ctfbridge.platforms.registry import (
+    PLATFORM_IDENTIFIERS,
+    PLATFORM_URL_PATTERNS,
+    get_identifier_classes,
+    match_url_patterns,
+)
+
+
+def test_url_patterns_name_registered_platforms():
+    assert set(PLATFORM_URL_PATTERNS) <= set(PLATFORM_IDENTIFIERS)
+
+
+def test_identifiers_reexported_lazily():
+    from ctfbridge.platforms import CTFdIdentifier, RCTFIdentifier
+
+    assert CTFdIdentifier is get_identifier_classes(["ctfd"])[0][1]
+    assert RCTFIdentifier.__name__ == "RCTFIdentifier"
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://demo.ctfd.io/challenges", ["ctfd"]),
+        ("https://CTF.EPT.GG", ["ept"]),
+        ("https://ctf.hackthebox.com/event/123", ["htb"]),
+        ("https://pwn.college/fundamentals", ["pwncollege"]),
+        ("https://ctfd.io", []),
+        ("https://example.com", []),
+    ],
+)
+def test_match_url_patterns(url, expected):
+    assert match_url_patterns(url) == expected
+
+
+def test_get_identifier_classes_filters_in_registry_order():
+    names = [name for name, _ in get_identifier_classes(["htb", "ctfd"])]
+    assert names == ["ctfd", "htb"]
+    assert len(get_identifier_classes()) == len(PLATFORM_IDENTIFIERS)
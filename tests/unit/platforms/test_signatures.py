@@ -0,0 +1,42 @@
+import httpx
+
+from ctfbridge.base.identifier import Signature
+from ctfbridge.platforms.signatures import SignatureMatcher
+
+
+def make_response(text: str = "", headers=None) -> httpx.Response:
+    return httpx.Response(
+        200, text=text, headers=headers, request=httpx.Request("GET", "https://x")
+    )
+
+
+def test_scores_all_platforms_in_one_pass():
+    matcher = SignatureMatcher(
+        [
+            ("ctfd", [Signature("Powered by CTFd")]),
+            ("gzctf", [Signature("GZCTF"), Signature("GZ::CTF")]),
+            ("rctf", [Signature("rctf-config")]),
+        ]
+    )
+
+    response = make_response("<footer>GZ::CTF</footer><script>GZCTF GZCTF</script>")
+
+    assert matcher.match(response) == [("gzctf", 2.0)]
+    assert matcher.match(make_response("nothing here")) == []
+
+
+def test_headers_cookies_and_priority_tie_break():
+    matcher = SignatureMatcher(
+        [
+            ("first", [Signature("marker")]),
+            ("second", [Signature("marker"), Signature("session", where="cookie")]),
+            ("third", [Signature("nginx/", where="header", header="server", weight=0.5)]),
+        ]
+    )
+
+    response = make_response(
+        "a marker", headers={"Server": "nginx/1.25", "Set-Cookie": "session=abc; Path=/"}
+    )
+
+    assert matcher.match(response) == [("second", 2.0), ("first", 1.0), ("third", 0.5)]
+    assert matcher.match(make_response("a marker")) == [("first", 1.0), ("second", 1.0)]
@@ -0,0 +1,66 @@
+import httpx
+import pytest
+
+from ctfbridge import create_client, factory
+from ctfbridge.base.client import CTFClient
+from ctfbridge.core import http as http_module
+from ctfbridge.utils import platform_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(platform_cache, "CACHE_PATH", tmp_path / "platform_cache.json")
+
+
+@pytest.mark.asyncio
+async def test_auto_detection_reuses_one_client_with_configured_retries(monkeypatch):
+    clients = []
+    retries_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        retries_seen.append(clients[0].retries)
+        if request.url.path == "/api/v1/swagger.json":
+            return httpx.Response(200, json={})
+        return httpx.Response(200, text="<footer>Powered by CTFd</footer>")
+
+    def make_http_client(**kwargs):
+        clients.append(http_module.make_http_client(**kwargs))
+        return clients[-1]
+
+    monkeypatch.setattr(
+        http_module.httpx, "AsyncHTTPTransport", lambda **_: httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(factory, "make_http_client", make_http_client)
+
+    client = await create_client("https://ctf.example.com")
+
+    assert client._http is clients[0]
+    assert len(clients) == 1
+    assert set(retries_seen) == {1}
+    assert client._http.retries == 5
+    await client._http.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_closes_only_its_own_http_client():
+    async with await create_client("https://ctf.example.com", platform="ctfd") as client:
+        owned = client._http
+
+    http = httpx.AsyncClient()
+    async with await create_client("https://ctf.example.com", platform="ctfd", http=http):
+        pass
+
+    assert owned.is_closed
+    assert not http.is_closed
+    await http.aclose()
+
+
+@pytest.mark.asyncio
+async def test_clients_without_resources_need_no_aclose():
+    class MinimalClient(CTFClient):
+        platform_name = platform_url = "minimal"
+        auth = attachments = challenges = scoreboard = session = None
+        capabilities = None
+
+    async with MinimalClient() as client:
+        assert client.platform_name == "minimal"
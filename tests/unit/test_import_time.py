@@ -0,0 +1,58 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Import time allowed relative to httpx, which ctfbridge cannot avoid importing. Relative
+# and generous, so that it catches the platform packages or models being imported
+# eagerly again (about 4x) rather than machine speed or noise (currently about 1.7x).
+IMPORT_BUDGET_VS_HTTPX = 2.5
+
+
+def _import_profile(statement: str) -> tuple[int, set[str]]:
+    """Run an import statement in a fresh interpreter; return its time and loaded modules."""
+    module = statement.split()[1]
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Unindented entries are imported directly by the statement; their cumulative times
+    # include everything they pull in
+    total = sum(
+        int(cumulative)
+        for cumulative, name in re.findall(
+            r"^import time:\s+\d+ \|\s+(\d+) \| (\S+)", result.stderr, re.MULTILINE
+        )
+        if module == name or module.startswith(f"{name}.")
+    )
+    return total, set(result.stdout.split())
+
+
+def _best_import_time(statement: str) -> int:
+    # The fastest run is the one least disturbed by other load on the machine
+    return min(_import_profile(statement)[0] for _ in range(5))
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["import ctfbridge", "import ctfbridge.platforms", "import ctfbridge.platforms.detect"],
+)
+def test_import_does_not_load_platforms_or_models(statement):
+    _, modules = _import_profile(statement)
+
+    heavy = {"pydantic", "bs4", "markdownify", "ctfbridge.models", "ctfbridge.processors"}
+    assert not heavy & modules
+    assert not {m for m in modules if re.match(r"ctfbridge\.platforms\.\w+\.", m)}
+
+
+def test_import_time_benchmark():
+    detect = _best_import_time("import ctfbridge.platforms.detect")
+    httpx = _best_import_time("import httpx")
+    print(
+        f"import ctfbridge.platforms.detect: {detect / 1000:.1f} ms (httpx: {httpx / 1000:.1f} ms)"
+    )
+    assert detect < httpx * IMPORT_BUDGET_VS_HTTPX
@@ -0,0 +1,118 @@
+import gzip
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from ctfbridge.exceptions import AttachmentExtractionError
+from ctfbridge.utils.archive import (
+    ArchiveExtractor,
+    ExtractionLimits,
+    extract_archive,
+    extraction_dir,
+)
+
+
+def make_zip(path, members):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+
+
+def make_encrypted_zip(path, members):
+    make_zip(path, members)
+    # Set the "encrypted" flag bit in the local and central headers
+    data = bytearray(path.read_bytes())
+    for signature, offset in ((b"PK\x03\x04", 6), (b"PK\x01\x02", 8)):
+        start = data.find(signature)
+        while start != -1:
+            data[start + offset] |= 0x1
+            start = data.find(signature, start + 4)
+    path.write_bytes(bytes(data))
+
+
+def test_extract_zip_skips_traversal(tmp_path):
+    archive = tmp_path / "handout.zip"
+    make_zip(archive, {"chall/vuln": b"\x7fELF", "../evil": b"x", "/abs": b"x"})
+
+    files = extract_archive(archive, extraction_dir(archive))
+
+    assert [f.name for f in files] == ["chall/vuln"]
+    assert files[0].digest.file_type == "application/x-elf"
+    assert (tmp_path / "handout" / "chall" / "vuln").read_bytes() == b"\x7fELF"
+    assert not (tmp_path / "evil").exists()
+
+
+def test_extract_tar_gz_skips_links(tmp_path):
+    archive = tmp_path / "handout.tar.gz"
+    with tarfile.open(archive, "w:gz") as tf:
+        data = b"flag{fake}"
+        info = tarfile.TarInfo("flag.txt")
+        info.size = len(data)
+        tf.addfile(info, io.BytesIO(data))
+        link = tarfile.TarInfo("passwd")
+        link.type = tarfile.SYMTYPE
+        link.linkname = "/etc/passwd"
+        tf.addfile(link)
+
+    files = extract_archive(archive, extraction_dir(archive))
+
+    assert [f.name for f in files] == ["flag.txt"]
+    assert not (tmp_path / "handout" / "passwd").exists()
+
+
+def test_extract_single_gzip(tmp_path):
+    archive = tmp_path / "libc.so.6.gz"
+    archive.write_bytes(gzip.compress(b"\x7fELF"))
+
+    [file] = extract_archive(archive, tmp_path / "out")
+
+    assert file.name == "libc.so.6"
+    assert file.path.read_bytes() == b"\x7fELF"
+
+
+def test_limits_abort_and_clean_up(tmp_path):
+    archive = tmp_path / "bomb.zip"
+    make_zip(archive, {"a": b"\0" * 4096, "b": b"\0" * 4096})
+    dest = tmp_path / "bomb"
+
+    with pytest.raises(AttachmentExtractionError, match="exceed"):
+        extract_archive(archive, dest, limits=ExtractionLimits(max_total_bytes=5000))
+
+    assert not dest.exists()
+
+
+def test_encrypted_zip_fails_cleanly(tmp_path):
+    archive = tmp_path / "secret.zip"
+    make_encrypted_zip(archive, {"flag.txt": b"flag"})
+    dest = tmp_path / "secret"
+
+    with pytest.raises(AttachmentExtractionError, match="encrypted"):
+        extract_archive(archive, dest)
+
+    assert not dest.exists()
+
+
+def test_rejects_non_archive(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("hello")
+
+    with pytest.raises(AttachmentExtractionError, match="Not a supported archive"):
+        extract_archive(path, tmp_path / "out")
+
+
+@pytest.mark.asyncio
+async def test_process_pool_reports_errors_and_keeps_working(tmp_path):
+    big = tmp_path / "big.zip"
+    make_zip(big, {"a": b"\0" * 1000})
+    small = tmp_path / "small.zip"
+    make_zip(small, {"a": b"ok"})
+
+    async with ArchiveExtractor(ExtractionLimits(max_file_bytes=100), processes=True) as extractor:
+        with pytest.raises(AttachmentExtractionError, match="exceed") as excinfo:
+            await extractor.extract(big)
+        [file] = await extractor.extract(small)
+
+    assert excinfo.value.path == str(big)
+    assert file.path.read_bytes() == b"ok"
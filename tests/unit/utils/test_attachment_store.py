@@ -0,0 +1,68 @@
+import hashlib
+
+import pytest
+
+from ctfbridge.utils.attachment_store import AttachmentStore, content_key
+
+
+def _ingest(store, tmp_path, data: bytes, key=None) -> str:
+    src = tmp_path / "incoming.part"
+    src.write_bytes(data)
+    digest = hashlib.sha256(data).hexdigest()
+    store.ingest(src, digest, key)
+    return digest
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "https://demo.ctfd.io/files/0123456789abcdef0123456789ABCDEF/libc.so.6?token=x",
+            "ctfd:demo.ctfd.io/0123456789abcdef0123456789abcdef/libc.so.6",
+        ),
+        (
+            "https://CTF.example.com:8443/files/0123456789abcdef0123456789abcdef/a",
+            "ctfd:ctf.example.com:8443/0123456789abcdef0123456789abcdef/a",
+        ),
+        ("https://example.com/files/short/libc.so.6", None),
+        ("https://example.com/download/libc.so.6", None),
+    ],
+)
+def test_content_key(url, expected):
+    assert content_key(url) == expected
+
+
+def test_ingest_deduplicates(tmp_path):
+    store = AttachmentStore(tmp_path / "store")
+    first = _ingest(store, tmp_path, b"same bytes")
+    second = _ingest(store, tmp_path, b"same bytes")
+
+    assert first == second
+    assert store.get(first).read_bytes() == b"same bytes"
+    assert not (tmp_path / "incoming.part").exists()
+
+
+def test_lookup_by_key(tmp_path):
+    store = AttachmentStore(tmp_path / "store")
+    digest = _ingest(store, tmp_path, b"payload", key="ctfd:abc/file")
+
+    assert store.lookup("ctfd:abc/file") == digest
+    assert store.lookup("ctfd:missing/file") is None
+
+
+@pytest.mark.parametrize("link_mode", ["auto", "hardlink", "copy"])
+def test_place_replaces_existing_file(tmp_path, link_mode):
+    store = AttachmentStore(tmp_path / "store", link_mode=link_mode)
+    digest = _ingest(store, tmp_path, b"new")
+    dest = tmp_path / "out" / "file.bin"
+    dest.parent.mkdir()
+    dest.write_bytes(b"old")
+
+    store.place(digest, dest)
+
+    assert dest.read_bytes() == b"new"
+
+
+def test_invalid_link_mode(tmp_path):
+    with pytest.raises(ValueError):
+        AttachmentStore(tmp_path, link_mode="symlink")
@@ -0,0 +1,39 @@
+import pytest
+
+from ctfbridge.utils.file_writer import AsyncFileWriter, preallocate
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threaded", [True, False])
+async def test_writes_are_ordered(tmp_path, threaded):
+    path = tmp_path / "out.bin"
+    chunks = [bytes([i]) * 1000 for i in range(50)]
+
+    async with AsyncFileWriter(path, threaded=threaded, block_size=4096, max_pending=2) as f:
+        for chunk in chunks:
+            await f.write(chunk)
+
+    assert path.read_bytes() == b"".join(chunks)
+
+
+@pytest.mark.asyncio
+async def test_preallocated_file_truncated_to_written_size(tmp_path):
+    path = tmp_path / "out.bin"
+
+    async with AsyncFileWriter(path, size=10_000) as f:
+        await f.write(b"short")
+
+    assert path.read_bytes() == b"short"
+
+
+@pytest.mark.asyncio
+async def test_write_at_offset(tmp_path):
+    path = tmp_path / "out.bin"
+    preallocate(path, 6)
+
+    async with AsyncFileWriter(path, offset=3) as f:
+        await f.write(b"def")
+    async with AsyncFileWriter(path, offset=0, fsync=True) as f:
+        await f.write(b"abc")
+
+    assert path.read_bytes() == b"abcdef"
@@ -0,0 +1,23 @@
+import pytest
+
+from ctfbridge.utils.filetype import detect_file_type
+
+
+@pytest.mark.parametrize(
+    "head, expected",
+    [
+        (b"\x7fELF\x02\x01\x01", "application/x-elf"),
+        (b"PK\x03\x04\x14\x00", "application/zip"),
+        (b"\x1f\x8b\x08\x00", "application/gzip"),
+        (b"\xfd7zXZ\x00\x00", "application/x-xz"),
+        (b"7z\xbc\xaf\x27\x1c\x00\x04", "application/x-7z-compressed"),
+        (b"\x00" * 257 + b"ustar\x0000", "application/x-tar"),
+        (b"#!/usr/bin/env python3\n", "text/x-script"),
+        (b"from pwn import *\n", "text/plain"),
+        ("flag{ø}".encode()[:-2], "text/plain"),
+        (b"\x00\x01\x02\x03", None),
+        (b"", None),
+    ],
+)
+def test_detect_file_type(head, expected):
+    assert detect_file_type(head) == expected
@@ -1,4 +1,5 @@
 import json
+import multiprocessing
 import time
 from pathlib import Path
 
@@ -42,3 +43,63 @@ def test_entry_is_tuple(tmp_path):
 
     result = platform_cache.load_platform_cache()
     assert isinstance(result["https://tuple.com"], tuple)
+
+
+@pytest.fixture(params=["json", "log", "sqlite"])
+def backend(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(platform_cache, "CACHE_BACKEND", request.param)
+    monkeypatch.setattr(platform_cache, "CACHE_PATH", tmp_path / "cache")
+    return request.param
+
+
+def _write_entries(path: str, backend: str, worker: int) -> None:
+    platform_cache.configure_platform_cache(path=path, backend=backend)
+    for i in range(20):
+        platform_cache.set_cached_platform(f"https://{worker}-{i}.com", "ctfd", "https://x")
+
+
+def test_backends_round_trip_and_sweep(backend):
+    platform_cache.set_cached_platform("https://a.com", "ctfd", "https://a.com")
+    stale = ("rctf", "https://b.com", time.time() - platform_cache.CACHE_TTL_SECONDS - 10)
+    platform_cache.get_cache_backend().set("https://b.com", stale)
+
+    assert platform_cache.get_cached_platform("https://a.com") == ("ctfd", "https://a.com")
+    assert platform_cache.get_cached_platform("https://b.com") is None
+    assert platform_cache.sweep_platform_cache() == 1
+    assert list(platform_cache.load_platform_cache()) == ["https://a.com"]
+
+
+def test_backends_update_many_entries_at_once(backend):
+    cache = platform_cache.get_cache_backend()
+    now = time.time()
+    cache.set("https://a.com", ("ctfd", "https://a.com", now))
+
+    cache.update({"https://a.com": None, "https://b.com": ("rctf", "https://b.com", now)})
+
+    assert cache.load() == {"https://b.com": ("rctf", "https://b.com", now)}
+
+
+def test_backends_see_writes_from_other_processes(backend):
+    ours = platform_cache.get_cache_backend()
+    assert ours.get("https://a.com") is None
+
+    # A separate instance on the same file stands in for another process
+    theirs = platform_cache.BACKENDS[backend](platform_cache.CACHE_PATH)
+    theirs.set("https://a.com", ("ctfd", "https://a.com", time.time()))
+
+    assert ours.get("https://a.com")[0] == "ctfd"
+
+
+def test_concurrent_processes_do_not_lose_entries(backend):
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(target=_write_entries, args=(str(platform_cache.CACHE_PATH), backend, n))
+        for n in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    assert len(platform_cache.load_platform_cache()) == 80
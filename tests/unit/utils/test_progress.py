@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from ctfbridge.models.challenge import Attachment
+from ctfbridge.utils.progress import ProgressReporter
+
+
+@pytest.mark.asyncio
+async def test_events_are_throttled_and_final_event_delivered():
+    events = []
+    attachment = Attachment(name="chall.zip")
+
+    async with ProgressReporter(events.append, interval=60) as reporter:
+        tracker = reporter.track(attachment, total_bytes=1000)
+        for _ in range(10):
+            tracker.advance(100)
+
+    assert [e.downloaded_bytes for e in events] == [1000]
+    assert events[0].percentage == 100
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_does_not_block_transfer():
+    delivered = []
+
+    async def slow_callback(event):
+        await asyncio.sleep(0.05)
+        delivered.append(event.downloaded_bytes)
+
+    async with ProgressReporter(slow_callback, interval=0) as reporter:
+        tracker = reporter.track(Attachment(name="disk.img"), total_bytes=100)
+        for _ in range(100):
+            tracker.advance(1)
+            await asyncio.sleep(0)
+
+    # Intermediate events are coalesced while the consumer is busy; the last one is kept
+    assert len(delivered) < 100
+    assert delivered[-1] == 100